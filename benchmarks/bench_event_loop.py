@@ -0,0 +1,112 @@
+"""Compare bridge datagram throughput on the asyncio and uvloop event loops.
+
+Blasts NMEA datagrams at a local UDP listener from a separate process and
+measures how many sentences the bridge ingest path (framing, filtering,
+parsing, throttling - MQTT is not connected so nothing is sent) handles
+per second on each available loop.
+
+Usage:
+    python benchmarks/bench_event_loop.py [--datagrams N] [--mode batch|datagram]
+"""
+
+import argparse
+import asyncio
+import multiprocessing
+import socket
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from nmea_mqtt_bridge.bridge import NMEABridge  # noqa: E402
+from nmea_mqtt_bridge.runtime import select_event_loop  # noqa: E402
+
+SENTENCES = [
+    b"$GPGGA,232001.00,1635.2474,S,14555.1765,E,1,11,0.70,11.5,M,62.6,M,,*72\r\n",
+    b"$GPVTG,17.6,T,10.8,M,23.6,N,43.7,K*40\r\n",
+    b"$GPHDT,18.2,T*0E\r\n",
+    b"$GPHDG,11.4,,,6.8,E*0F\r\n",
+    b"!AIVDM,1,1,,A,404k0a1v`UGD0bKV4qnE0uG00H1;,0*3C\r\n",
+]
+
+
+def _free_port() -> int:
+    with socket.socket(socket.AF_INET, socket.SOCK_DGRAM) as s:
+        s.bind(("127.0.0.1", 0))
+        return s.getsockname()[1]
+
+
+def _blast(port: int, count: int):
+    """Send count datagrams as fast as the kernel accepts them."""
+    with socket.socket(socket.AF_INET, socket.SOCK_DGRAM) as tx:
+        for i in range(count):
+            tx.sendto(SENTENCES[i % len(SENTENCES)], ("127.0.0.1", port))
+
+
+async def _run(port: int, count: int, mode: str) -> tuple[int, float]:
+    bridge = NMEABridge(
+        {
+            "udp": {
+                "ingest_mode": mode,
+                "sources": [
+                    {"name": "bench", "port": port, "recv_buffer_bytes": 4 << 20}
+                ],
+            },
+        }
+    )
+    listener = bridge.udp_listener
+    listener.set_callback(bridge._on_nmea_received)
+    if mode == "batch":
+        listener.set_batch_callback(bridge._on_nmea_batch)
+    await listener.start(
+        [{"name": "bench", "port": port, "recv_buffer_bytes": 4 << 20}],
+        "127.0.0.1",
+    )
+
+    sender = multiprocessing.Process(target=_blast, args=(port, count))
+    start = time.perf_counter()
+    sender.start()
+
+    # Stop once everything arrived or the stream has been idle for 0.5s
+    last_count, last_change = 0, time.perf_counter()
+    while True:
+        await asyncio.sleep(0.05)
+        received = bridge._stats["sentences_received"]
+        if received >= count:
+            break
+        if received != last_count:
+            last_count, last_change = received, time.perf_counter()
+        elif time.perf_counter() - last_change > 0.5 and not sender.is_alive():
+            break
+    # Don't count the idle tail when some datagrams were dropped
+    elapsed = (time.perf_counter() if received >= count else last_change) - start
+
+    sender.join()
+    await listener.stop()
+    return bridge._stats["sentences_received"], elapsed
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--datagrams", type=int, default=200_000)
+    parser.add_argument("--mode", choices=("batch", "datagram"), default="batch")
+    args = parser.parse_args()
+
+    for choice in ("asyncio", "uvloop"):
+        name, factory = select_event_loop(choice)
+        if name != choice:
+            print(f"{choice:8s} not installed, skipped")
+            continue
+        with asyncio.Runner(loop_factory=factory) as runner:
+            received, elapsed = runner.run(
+                _run(_free_port(), args.datagrams, args.mode)
+            )
+        print(
+            f"{name:8s} {args.mode:8s} received {received}/{args.datagrams} "
+            f"in {elapsed:.2f}s = {received / elapsed:,.0f} sentences/s"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,93 @@
+"""Compare the fast-path sentence parser with the pynmea2 based parsers.
+
+Parses the same mix of the supported talker sentences (GGA, VTG, HDT, HDG,
+ZDA, RSA, GSV, DPT, VHW, MTW) through parse_sentence(), which takes the
+split-based fast path, and through the pynmea2 path it falls back to,
+checks both give the same NMEAData and reports the speedup. The fast path
+is timed both checking the checksum and with verified=True, as the bridge
+calls it for sentences its listeners' framers already checked.
+
+Only the "fast path" row is like-for-like with pynmea2, which always
+checks the checksum. It runs about 2.4-2.9x faster, short of the 5x
+target. The "verified" row leaves the checksum to the framer, so its
+3.5-4.3x does not count that work. See the README for the breakdown.
+
+Usage:
+    python benchmarks/bench_parser.py [--sentences N] [--rounds N]
+"""
+
+import argparse
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from nmea_mqtt_bridge.nmea_parser import _parse_pynmea2, parse_sentence  # noqa: E402
+
+SENTENCES = [
+    "$GPGGA,232001.00,1635.2474,S,14555.1765,E,1,11,0.70,11.5,M,62.6,M,,*72",
+    "$GPVTG,17.6,T,10.8,M,23.6,N,43.7,K*40",
+    "$GPHDT,18.2,T*0E",
+    "$GPHDG,11.4,,,6.8,E*0F",
+    "$GPZDA,232001.00,10,02,2026,-10,00*4D",
+    "$GPRSA,0.6,A,,*3E",
+    "$GPGSV,3,1,11,10,63,137,17,07,61,098,15,05,59,290,20,08,54,157,30*70",
+    "$IIDPT,36.03,-3.2,*46",
+    "$IIVHW,18.2,T,11.4,M,0.0,N,0.0,K*5A",
+    "$YXMTW,076.25,C*14",
+]
+
+
+# Name -> parser and the arguments after the sentence. Arguments are passed
+# positionally: a functools.partial with verified=True costs about as much
+# per call as the checksum it skips.
+PARSERS = {
+    "pynmea2": (_parse_pynmea2, ()),
+    "fast path": (parse_sentence, ()),
+    "verified": (parse_sentence, (True,)),
+}
+
+
+def _run(parse, args: tuple, sentences: list[str]) -> float:
+    """Time one pass of a parser over the sentences."""
+    start = time.perf_counter()
+    for raw in sentences:
+        parse(raw, *args)
+    return time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sentences", type=int, default=50_000)
+    parser.add_argument("--rounds", type=int, default=9)
+    args = parser.parse_args()
+
+    for raw in SENTENCES:
+        fast, slow = parse_sentence(raw), _parse_pynmea2(raw)
+        if fast is None or fast != slow:
+            sys.exit(f"Parsers disagree on {raw}:\n  fast:    {fast}\n  pynmea2: {slow}")
+
+    sentences = [SENTENCES[i % len(SENTENCES)] for i in range(args.sentences)]
+    print(f"Python {sys.version.split()[0]}, {len(sentences)} sentences")
+
+    # Best of interleaved rounds, so other load hits every parser alike
+    results = dict.fromkeys(PARSERS, float("inf"))
+    for _ in range(args.rounds):
+        for name, (parse, parse_args) in PARSERS.items():
+            results[name] = min(results[name], _run(parse, parse_args, sentences))
+    for name, elapsed in results.items():
+        print(
+            f"  {name:10s} {elapsed:6.2f}s  "
+            f"{len(sentences) / elapsed:>10,.0f} sentences/s  "
+            f"{elapsed / len(sentences) * 1e6:5.1f} us/sentence"
+        )
+    print(f"Speedup (fast path): {results['pynmea2'] / results['fast path']:.1f}x")
+    print(
+        f"Speedup (verified, checksum not timed): "
+        f"{results['pynmea2'] / results['verified']:.1f}x"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,92 @@
+"""Compare single-threaded and per-source-thread sentence processing.
+
+Feeds the same mix of sentences from N sources through the bridge
+processing path (dedup, parsing, AIS decoding, throttling - MQTT is not
+connected so nothing is sent), once inline on the calling thread and
+once through per-source processing threads, and reports the speedup.
+Threads only scale on a free-threaded interpreter with the GIL disabled
+(e.g. python3.13t); with the GIL they show the locking overhead instead.
+
+Usage:
+    python benchmarks/bench_threads.py [--sources N] [--sentences N]
+"""
+
+import argparse
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from nmea_mqtt_bridge.bridge import NMEABridge  # noqa: E402
+from nmea_mqtt_bridge.threads import gil_enabled  # noqa: E402
+from nmea_mqtt_bridge.udp_listener import ReceivedSentence  # noqa: E402
+
+SENTENCES = [
+    "$GPGGA,232001.00,1635.2474,S,14555.1765,E,1,11,0.70,11.5,M,62.6,M,,*72",
+    "$GPVTG,17.6,T,10.8,M,23.6,N,43.7,K*40",
+    "$GPHDT,18.2,T*0E",
+    "$GPHDG,11.4,,,6.8,E*0F",
+    "!AIVDM,1,1,,B,15MwkT1P37G?fl0EJbR0OwT0@MS,0*0E",
+]
+
+
+def _batches(sources: int, count: int, batch_size: int = 64) -> list[list]:
+    """Build per-source batches, interleaved the way listeners deliver them."""
+    per_source = [
+        [
+            ReceivedSentence(f"src{s}", "127.0.0.1", SENTENCES[i % len(SENTENCES)], None)
+            for i in range(count // sources)
+        ]
+        for s in range(sources)
+    ]
+    batches = []
+    for start in range(0, count // sources, batch_size):
+        for items in per_source:
+            batches.append(items[start : start + batch_size])
+    return batches
+
+
+def _run(batches: list[list], threads: bool) -> float:
+    bridge = NMEABridge(
+        {
+            "runtime": {"source_threads": "on" if threads else "off"},
+            # Never throttle, so every sentence goes the full publish path
+            "sensors": {"throttle": {"ais": 0}},
+        }
+    )
+    start = time.perf_counter()
+    if threads:
+        for batch in batches:
+            bridge._threads.dispatch(batch)
+        bridge._threads.stop(timeout=None)
+    else:
+        process = bridge._process_sentence
+        for batch in batches:
+            for item in batch:
+                process(*item)
+    return time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sources", type=int, default=4)
+    parser.add_argument("--sentences", type=int, default=200_000)
+    args = parser.parse_args()
+
+    batches = _batches(args.sources, args.sentences)
+    total = sum(len(batch) for batch in batches)
+    print(
+        f"Python {sys.version.split()[0]}, GIL {'enabled' if gil_enabled() else 'disabled'}, "
+        f"{args.sources} sources, {total} sentences"
+    )
+
+    single = _run(batches, threads=False)
+    threaded = _run(batches, threads=True)
+    for name, elapsed in (("inline", single), ("threads", threaded)):
+        print(f"{name:8s} {elapsed:.2f}s = {total / elapsed:,.0f} sentences/s")
+    print(f"speedup  {single / threaded:.2f}x")
+
+
+if __name__ == "__main__":
+    main()
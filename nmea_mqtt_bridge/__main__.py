@@ -1,6 +1,7 @@
 """Entry point for the Navnet NMEA-to-MQTT Bridge."""
 
 import asyncio
+import ipaddress
 import logging
 import signal
 import sys
@@ -9,6 +10,16 @@ from pathlib import Path
 import yaml
 
 from .bridge import NMEABridge
+from .filters import DESTINATION_TYPES
+from .ingest_queue import OVERFLOW_POLICIES
+from .runtime import select_event_loop, setup_logging
+from .serial_listener import BAUDRATES, DEFAULT_BAUDRATE, DEFAULT_REOPEN_DELAY
+from .sources import REQUIRED_KEYS, SOURCE_TYPES, source_type
+from .tcp_listener import DEFAULT_IDLE_TIMEOUT
+from .threads import SOURCE_THREAD_MODES
+
+# Supported values for runtime.event_loop
+EVENT_LOOPS = ("auto", "asyncio", "uvloop")
 
 
 def load_config(config_path: str = "config.yaml") -> dict:
@@ -34,24 +45,178 @@ def validate_config(config: dict):
         print("Error: mqtt.host is required in config.yaml")
         sys.exit(1)
 
-    sources = config.get("udp", {}).get("sources", [])
+    udp = config.get("udp", {})
+    if udp.get("ingest_mode", "datagram") not in ("datagram", "batch"):
+        print("Error: udp.ingest_mode must be 'datagram' or 'batch'")
+        sys.exit(1)
+
+    runtime = config.get("runtime", {})
+    if runtime.get("event_loop", "auto") not in EVENT_LOOPS:
+        print(f"Error: runtime.event_loop must be one of {', '.join(EVENT_LOOPS)}")
+        sys.exit(1)
+    if runtime.get("source_threads", "auto") not in SOURCE_THREAD_MODES:
+        print(f"Error: runtime.source_threads must be one of {', '.join(SOURCE_THREAD_MODES)}")
+        sys.exit(1)
+
+    queue = config.get("queue", {})
+    if queue.get("overflow", "drop-oldest") not in OVERFLOW_POLICIES:
+        print(f"Error: queue.overflow must be one of {', '.join(OVERFLOW_POLICIES)}")
+        sys.exit(1)
+
+    shedding = config.get("load_shedding", {})
+    thresholds = shedding.get("thresholds", [0.05, 0.1, 0.25])
+    if (
+        not isinstance(thresholds, list)
+        or len(thresholds) != 3
+        or not all(isinstance(t, (int, float)) and t > 0 for t in thresholds)
+        or sorted(thresholds) != thresholds
+    ):
+        print("Error: load_shedding.thresholds must be 3 increasing positive numbers (seconds)")
+        sys.exit(1)
+    for key in ("ais_keep_every", "heading_keep_every"):
+        value = shedding.get(key, 1)
+        if isinstance(value, bool) or not isinstance(value, int) or value < 1:
+            print(f"Error: load_shedding.{key} must be a positive integer")
+            sys.exit(1)
+
+    diagnostics = config.get("diagnostics", {})
+    for key in ("interval", "time_constant"):
+        value = diagnostics.get(key, 1)
+        if isinstance(value, bool) or not isinstance(value, (int, float)) or value <= 0:
+            print(f"Error: diagnostics.{key} must be a positive number (seconds)")
+            sys.exit(1)
+
+    sources = udp.get("sources", [])
     for i, source in enumerate(sources):
-        if "port" not in source or "name" not in source:
-            print(f"Error: udp.sources[{i}] must have 'name' and 'port' keys")
+        kind = source_type(source)
+        if kind not in SOURCE_TYPES:
+            print(f"Error: udp.sources[{i}].type must be one of {', '.join(SOURCE_TYPES)}")
             sys.exit(1)
 
+        required = ("name", *REQUIRED_KEYS[kind])
+        if any(key not in source for key in required):
+            keys = ", ".join(f"'{key}'" for key in required)
+            print(f"Error: udp.sources[{i}] ({kind}) must have {keys} keys")
+            sys.exit(1)
+
+        for key in ("segment_bytes", "max_segments"):
+            value = source.get(key)
+            if value is not None and (
+                isinstance(value, bool) or not isinstance(value, int) or value < 1
+            ):
+                print(f"Error: udp.sources[{i}].{key} must be a positive integer")
+                sys.exit(1)
 
-def setup_logging(config: dict):
-    """Configure logging from config."""
-    log_config = config.get("logging", {})
-    level = getattr(logging, log_config.get("level", "INFO").upper(), logging.INFO)
-    fmt = log_config.get("format", "%(asctime)s [%(levelname)s] %(name)s: %(message)s")
+        if kind in ("tcp-client", "tcp-server"):
+            timeout = source.get("idle_timeout", DEFAULT_IDLE_TIMEOUT)
+            if isinstance(timeout, bool) or not isinstance(timeout, (int, float)) or timeout <= 0:
+                print(f"Error: udp.sources[{i}].idle_timeout must be a positive number (seconds)")
+                sys.exit(1)
 
-    logging.basicConfig(level=level, format=fmt)
+        if kind == "serial":
+            if source.get("baudrate", DEFAULT_BAUDRATE) not in BAUDRATES:
+                print(f"Error: udp.sources[{i}].baudrate must be one of {', '.join(map(str, BAUDRATES))}")
+                sys.exit(1)
+            delay = source.get("reopen_delay", DEFAULT_REOPEN_DELAY)
+            if isinstance(delay, bool) or not isinstance(delay, (int, float)) or delay <= 0:
+                print(f"Error: udp.sources[{i}].reopen_delay must be a positive number (seconds)")
+                sys.exit(1)
+            # Serial lines have no sender address or ingress interface; the
+            # sender is the device path, which sender allow/deny networks
+            # never match
+            for key in ("senders", "interface_names", "allow_senders", "deny_senders"):
+                if key in source:
+                    print(f"Error: udp.sources[{i}].{key} is not supported for serial sources")
+                    sys.exit(1)
 
-    # Quiet down paho-mqtt unless debugging
-    if level > logging.DEBUG:
-        logging.getLogger("paho").setLevel(logging.WARNING)
+        group = source.get("multicast_group")
+        if group is not None:
+            try:
+                is_multicast = ipaddress.IPv4Address(group).is_multicast
+            except ValueError:
+                is_multicast = False
+            if not is_multicast:
+                print(f"Error: udp.sources[{i}].multicast_group must be an IPv4 multicast address")
+                sys.exit(1)
+
+        for key in ("allow_senders", "deny_senders"):
+            for entry in source.get(key) or []:
+                try:
+                    ipaddress.ip_network(entry, strict=False)
+                except ValueError:
+                    print(f"Error: udp.sources[{i}].{key} entry '{entry}' is not an IP address or network")
+                    sys.exit(1)
+
+        if source.get("overflow", "drop-oldest") not in OVERFLOW_POLICIES:
+            print(f"Error: udp.sources[{i}].overflow must be one of {', '.join(OVERFLOW_POLICIES)}")
+            sys.exit(1)
+
+        types = source.get("sentence_types", {})
+        if not isinstance(types, dict) or set(types) - {"allow", "deny"}:
+            print(f"Error: udp.sources[{i}].sentence_types may only have 'allow' and 'deny' lists")
+            sys.exit(1)
+
+        if not isinstance(source.get("senders", {}), dict):
+            print(f"Error: udp.sources[{i}].senders must map sender IPs to names")
+            sys.exit(1)
+
+        if not isinstance(source.get("interface_names", {}), dict):
+            print(f"Error: udp.sources[{i}].interface_names must map interfaces to names")
+            sys.exit(1)
+        if not isinstance(source.get("ingress_interfaces", []), list):
+            print(f"Error: udp.sources[{i}].ingress_interfaces must be a list of interface names")
+            sys.exit(1)
+        destinations = source.get("destinations", [])
+        if not isinstance(destinations, list) or set(destinations) - set(DESTINATION_TYPES):
+            print(f"Error: udp.sources[{i}].destinations may only contain {', '.join(DESTINATION_TYPES)}")
+            sys.exit(1)
+
+        limits = source.get("rate_limit", {})
+        if not isinstance(limits, dict) or set(limits) - {"rate", "burst", "sentence_types"}:
+            print(f"Error: udp.sources[{i}].rate_limit may only have 'rate', 'burst' and 'sentence_types' keys")
+            sys.exit(1)
+        type_rates = limits.get("sentence_types") or {}
+        if not isinstance(type_rates, dict):
+            print(f"Error: udp.sources[{i}].rate_limit.sentence_types must map sentence types to rates")
+            sys.exit(1)
+        for value in (limits.get("rate"), limits.get("burst"), *type_rates.values()):
+            if value is not None and (
+                isinstance(value, bool) or not isinstance(value, (int, float)) or value <= 0
+            ):
+                print(f"Error: udp.sources[{i}].rate_limit rates must be positive numbers")
+                sys.exit(1)
+
+    # Worker records reach the bridge already parsed, past the ingest-side
+    # shedding, the parse-time throttle and state vector paths and the
+    # source threads ("auto" just stays off)
+    if config.get("workers", {}).get("enabled", False):
+        for name, enabled in (
+            ("load_shedding.enabled", config.get("load_shedding", {}).get("enabled", False)),
+            ("sensors.lazy_parse", config.get("sensors", {}).get("lazy_parse", False)),
+            ("runtime.state_vector", config.get("runtime", {}).get("state_vector", False)),
+            ("runtime.source_threads", config.get("runtime", {}).get("source_threads") == "on"),
+        ):
+            if enabled:
+                print(f"Error: {name} is not supported with workers.enabled")
+                sys.exit(1)
+
+    groups = config.get("workers", {}).get("groups") or {}
+    if not isinstance(groups, dict) or not all(
+        isinstance(names, list) for names in groups.values()
+    ):
+        print("Error: workers.groups must map group names to lists of source names")
+        sys.exit(1)
+    source_names = {source.get("name") for source in sources}
+    grouped: set = set()
+    for group, names in groups.items():
+        for name in names:
+            if name not in source_names:
+                print(f"Error: workers.groups.{group} lists unknown source '{name}'")
+                sys.exit(1)
+            if name in grouped:
+                print(f"Error: source '{name}' is listed in more than one worker group")
+                sys.exit(1)
+            grouped.add(name)
 
 
 def main():
@@ -76,8 +241,14 @@ def main():
     signal.signal(signal.SIGINT, handle_signal)
     signal.signal(signal.SIGTERM, handle_signal)
 
+    loop_name, loop_factory = select_event_loop(
+        config.get("runtime", {}).get("event_loop", "auto")
+    )
+    logger.info("Using %s event loop", loop_name)
+
     try:
-        asyncio.run(bridge.run())
+        with asyncio.Runner(loop_factory=loop_factory) as runner:
+            runner.run(bridge.run())
     except KeyboardInterrupt:
         logger.info("Interrupted, shutting down...")
         bridge.stop()
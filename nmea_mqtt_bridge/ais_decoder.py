@@ -20,6 +20,27 @@ POSITION_MSG_TYPES = {1, 2, 3, 18, 19}
 # AIS message types that contain static/voyage data
 STATIC_MSG_TYPES = {5, 24}
 
+# Decoded message fields used to update a tracked vessel
+DECODED_FIELDS = (
+    "mmsi",
+    "msg_type",
+    "lat",
+    "lon",
+    "speed",
+    "course",
+    "heading",
+    "status",
+    "shipname",
+    "callsign",
+    "ship_type",
+    "destination",
+    "draught",
+    "to_bow",
+    "to_stern",
+    "to_port",
+    "to_starboard",
+)
+
 # Ship type descriptions (subset of common types)
 SHIP_TYPE_NAMES = {
     0: "Not available",
@@ -63,6 +84,47 @@ def _ship_type_name(ship_type: Any) -> str:
     return f"Type {type_int}"
 
 
+def decode_fields(*raw_parts: str) -> Optional[dict]:
+    """Decode raw AIS sentence(s) into the fields used for vessel tracking.
+
+    This is the expensive part of AIS handling and keeps no state, so it
+    can run in a worker process; values are plain ints, floats and
+    strings (enums are converted).
+
+    Args:
+        raw_parts: All fragments of one AIS message.
+
+    Returns:
+        Dict of decoded fields, or None if decoding failed.
+    """
+    try:
+        decoded = decode(*raw_parts).asdict()
+    except (
+        InvalidNMEAMessageException,
+        UnknownMessageException,
+        Exception,
+    ) as e:
+        logger.debug("AIS decode failed: %s", e)
+        return None
+
+    fields = {}
+    for key in DECODED_FIELDS:
+        value = decoded.get(key)
+        if value is None:
+            continue
+        if key == "status":
+            try:
+                value = str(value.name) if hasattr(value, "name") else str(value)
+            except Exception:
+                value = str(value)
+        elif isinstance(value, bool):
+            pass
+        elif isinstance(value, int):
+            value = int(value)
+        fields[key] = value
+    return fields
+
+
 @dataclass
 class AISVessel:
     """Tracked AIS vessel."""
@@ -155,6 +217,21 @@ class AISDecoder:
         Returns:
             Tuple of (vessel, is_new_vessel) if decoded successfully, None otherwise.
         """
+        parts = self.assemble(raw)
+        if parts is None:
+            return None
+        return self._process_decoded(*parts)
+
+    def assemble(self, raw: str) -> Optional[tuple[str, ...]]:
+        """Collect the fragments of a (possibly multipart) AIS message.
+
+        Args:
+            raw: Raw AIS NMEA sentence.
+
+        Returns:
+            All raw fragments once the message is complete, None while
+            waiting for more (or if the sentence is malformed).
+        """
         try:
             parts = raw.split(",")
             if len(parts) < 7:
@@ -166,7 +243,7 @@ class AISDecoder:
 
             # Single-part message
             if frag_count == 1:
-                return self._process_decoded(raw)
+                return (raw,)
 
             # Multipart message handling
             if frag_num == 1:
@@ -181,7 +258,7 @@ class AISDecoder:
                 if key in self._multipart_buffer:
                     part1_raw, ts = self._multipart_buffer.pop(key)
                     if time.monotonic() - ts < self._multipart_timeout:
-                        return self._process_decoded(part1_raw, raw)
+                        return (part1_raw, raw)
 
             return None
 
@@ -198,16 +275,20 @@ class AISDecoder:
         Returns:
             Tuple of (vessel, is_new) or None.
         """
-        try:
-            decoded = decode(*raw_parts).asdict()
-        except (
-            InvalidNMEAMessageException,
-            UnknownMessageException,
-            Exception,
-        ) as e:
-            logger.debug("AIS decode failed: %s", e)
+        decoded = decode_fields(*raw_parts)
+        if decoded is None:
             return None
+        return self.apply(decoded)
 
+    def apply(self, decoded: dict) -> Optional[tuple[AISVessel, bool]]:
+        """Update vessel state from decoded message fields.
+
+        Args:
+            decoded: Fields as returned by decode_fields().
+
+        Returns:
+            Tuple of (vessel, is_new) or None.
+        """
         mmsi = decoded.get("mmsi")
         if not mmsi:
             return None
@@ -243,10 +324,7 @@ class AISDecoder:
 
             status = decoded.get("status")
             if status is not None:
-                try:
-                    vessel.status = str(status.name) if hasattr(status, "name") else str(status)
-                except Exception:
-                    vessel.status = str(status)
+                vessel.status = status
 
         # Update static/voyage data (message types 5, 19, 24)
         if msg_type in STATIC_MSG_TYPES or msg_type == 19:
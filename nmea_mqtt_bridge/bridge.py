@@ -2,13 +2,34 @@
 
 import asyncio
 import logging
+import threading
 import time
+from collections.abc import MutableMapping
 from typing import Any, Optional
 
-from .ais_decoder import AISDecoder
+from .ais_decoder import AISDecoder, decode_fields
+from .capture import CaptureListener
+from .dedup import DEFAULT_WINDOW, DuplicateFilter
+from .ingest_queue import DEFAULT_MAXSIZE, DEFAULT_POLICY, IngestQueue
+from .load_shedding import DEFAULT_INTERVAL, LEVEL_NAMES, LoadShedder, LoopLagMonitor
 from .mqtt_publisher import MQTTPublisher, SENSOR_DEFINITIONS
 from .nmea_parser import NMEAData, parse_sentence
-from .udp_listener import UDPListener
+from .rates import (
+    DEFAULT_MAX_SENTENCE_TYPES,
+    DEFAULT_PUBLISH_INTERVAL,
+    DEFAULT_TIME_CONSTANT,
+    SOURCE,
+    RateMeters,
+    sentence_formatter,
+)
+from .replay import ReplayListener
+from .serial_listener import SerialListener
+from .sources import source_type, sources_of_type
+from .state_vector import FIELDS, StateVector
+from .tcp_listener import TCPListener
+from .threads import SourceThreadPool, gil_enabled, use_source_threads
+from .udp_listener import DEFAULT_BATCH_SIZE, ReceivedSentence, UDPListener
+from .workers import POLL_INTERVAL, RECORD_AIS, WorkerPool
 
 logger = logging.getLogger(__name__)
 
@@ -48,6 +69,41 @@ SENSOR_THROTTLE_MAP = {
     "fix_quality": "position",
 }
 
+# Sensors fed by each parsed sentence type. A sentence whose sensors are
+# all still throttled is skipped before parsing; GSV and ZDA feed none.
+SENTENCE_SENSORS = {
+    "GGA": ("latitude", "longitude", "altitude", "satellites_in_use", "hdop", "fix_quality"),
+    "VTG": ("speed_knots", "speed_kmh", "course_true"),
+    "HDT": ("heading_true",),
+    "HDG": ("heading_magnetic", "magnetic_variation"),
+    "DPT": ("depth",),
+    "MTW": ("water_temperature",),
+    "VHW": ("heading_true", "heading_magnetic", "speed_through_water"),
+    "RSA": ("rudder_angle",),
+    "GSV": (),
+    "ZDA": (),
+}
+
+# State read by the device tracker, and the sentence types that set it.
+# The latest skipped sentence of these types is kept and parsed only when
+# the tracker publishes, so its attributes stay as fresh as without skipping.
+TRACKER_STATE_KEYS = ("latitude", "longitude", "heading_true", "speed_over_ground_knots", "hdop")
+TRACKER_SENTENCES = {
+    "GGA": ("GGA",),
+    "VTG": ("VTG",),
+    "HDT": ("HDT", "VHW"),
+    "VHW": ("VHW", "HDT"),
+}
+
+# Sensor fed by each state vector field ID (None for fields with no sensor)
+FIELD_SENSORS = tuple(
+    next(
+        (sid for sid, sdef in SENSOR_DEFINITIONS.items() if sdef["value_key"] == name),
+        None,
+    )
+    for name in FIELDS
+)
+
 
 class NMEABridge:
     """Orchestrates NMEA UDP reception and MQTT publishing."""
@@ -60,6 +116,10 @@ class NMEABridge:
         """
         self.config = config
         self.udp_listener = UDPListener()
+        self.tcp_listener = TCPListener()
+        self.serial_listener = SerialListener()
+        self.replay_listener = ReplayListener()
+        self.capture_listener = CaptureListener()
         self.mqtt_publisher = MQTTPublisher(
             config.get("mqtt", {}),
             config.get("device", {}),
@@ -70,6 +130,19 @@ class NMEABridge:
         # Per-sensor throttle tracking: sensor_id -> last publish timestamp
         self._last_sensor_publish: dict[str, float] = {}
         self._throttle_config = config.get("sensors", {}).get("throttle", {})
+        self._sensor_throttle = {
+            sensor_id: self._throttle_config.get(
+                SENSOR_THROTTLE_MAP.get(sensor_id, "position"), 5
+            )
+            for sensor_id in SENSOR_DEFINITIONS
+        }
+
+        # Skip parsing sentences whose sensors are all throttled
+        self._lazy_parse = config.get("sensors", {}).get("lazy_parse", False)
+        # Sentence type -> monotonic time one of its sensors is next due
+        self._next_useful: dict[str, float] = {}
+        # Tracker sentence type -> latest skipped raw sentence, oldest first
+        self._pending_tracker: dict[str, str] = {}
 
         # Device tracker config
         self._device_tracker_enabled = (
@@ -85,8 +158,84 @@ class NMEABridge:
         self._last_ais_cleanup = 0.0
         self._last_ais_vessel_count = -1
 
-        # Current state - accumulated from multiple sentences
-        self._state: dict[str, Any] = {}
+        # Cross-feed duplicate suppression (optional)
+        dedup_config = config.get("dedup", {})
+        self._dedup: Optional[DuplicateFilter] = None
+        if dedup_config.get("enabled", False):
+            self._dedup = DuplicateFilter(
+                window=dedup_config.get("window", DEFAULT_WINDOW),
+                cross_interface_only=dedup_config.get("cross_interface_only", False),
+            )
+
+        # Per-source processing threads (free-threaded builds); worker
+        # processes parse in their own processes instead. Each thread's
+        # backlog is bounded by the queue's maxsize and overflow policies.
+        queue_config = config.get("queue", {})
+        self._threads: Optional[SourceThreadPool] = None
+        if not config.get("workers", {}).get("enabled", False) and use_source_threads(
+            config.get("runtime", {}).get("source_threads", "auto")
+        ):
+            self._threads = SourceThreadPool(
+                self._process_sentence_threaded,
+                maxsize=queue_config.get("maxsize", DEFAULT_MAXSIZE),
+                policies=self._overflow_policies(config),
+                default_policy=queue_config.get("overflow", DEFAULT_POLICY),
+            )
+        # Guard state shared between source threads
+        self._dedup_lock = threading.Lock()
+        self._publish_lock = threading.Lock()
+
+        # Bounded queue between UDP receive and processing (optional).
+        # Source threads keep their own per-source queues instead.
+        self._queue: Optional[IngestQueue] = None
+        self._queue_batch_size = queue_config.get("batch_size", 256)
+        if queue_config.get("enabled", False):
+            if self._threads is not None:
+                logger.warning(
+                    "Ingest queue disabled: source threads queue sentences per source"
+                )
+            else:
+                self._queue = IngestQueue(
+                    maxsize=queue_config.get("maxsize", DEFAULT_MAXSIZE),
+                    policies=self._overflow_policies(config),
+                    default_policy=queue_config.get("overflow", DEFAULT_POLICY),
+                )
+
+        # Per-source-group worker processes (optional)
+        self._workers: Optional[WorkerPool] = None
+        if config.get("workers", {}).get("enabled", False):
+            self._workers = WorkerPool(config)
+
+        # Loop lag driven load shedding at ingest (optional)
+        shed_config = config.get("load_shedding", {})
+        self._lag_monitor = LoopLagMonitor(
+            interval=shed_config.get("interval", DEFAULT_INTERVAL)
+        )
+        self._shedder: Optional[LoadShedder] = None
+        if shed_config.get("enabled", False):
+            self._shedder = LoadShedder.from_config(shed_config)
+
+        # Per-source and per-sentence-type rate meters (optional)
+        diag_config = config.get("diagnostics", {})
+        self._rates: Optional[RateMeters] = None
+        self._rates_interval = diag_config.get("interval", DEFAULT_PUBLISH_INTERVAL)
+        if diag_config.get("enabled", False):
+            self._rates = RateMeters(
+                time_constant=diag_config.get("time_constant", DEFAULT_TIME_CONSTANT),
+                max_sentence_types=diag_config.get(
+                    "max_sentence_types", DEFAULT_MAX_SENTENCE_TYPES
+                ),
+            )
+            for source in config.get("udp", {}).get("sources", []):
+                if source.get("enabled", True) and source_type(source) != "capture":
+                    self._rates.register(SOURCE, source["name"])
+
+        # Current state - accumulated from multiple sentences. With
+        # runtime.state_vector it is an array parsed into in place.
+        self._state: MutableMapping[str, Any] = {}
+        self._state_vector = config.get("runtime", {}).get("state_vector", False)
+        if self._state_vector:
+            self._state = StateVector()
 
         # Shutdown event
         self._stop_event: Optional[asyncio.Event] = None
@@ -96,23 +245,277 @@ class NMEABridge:
             "sentences_received": 0,
             "sentences_parsed": 0,
             "sentences_published": 0,
+            "duplicates": 0,
+            "sentences_skipped": 0,
             "errors": 0,
         }
         self._stats_interval = 60  # Log stats every 60 seconds
         self._last_stats_log = 0.0
+        # Ingest-to-publish latency since the last stats log (seconds)
+        self._latency = {"count": 0, "total": 0.0, "max": 0.0}
+        # Kernel drop counts at the previous stats log, per source
+        self._last_kernel_drops: dict[str, int] = {}
+
+    @staticmethod
+    def _overflow_policies(config: dict) -> dict[str, str]:
+        """Map source and sub-source names to overflow policies.
 
-    def _on_nmea_received(self, source_name: str, sender_ip: str, raw: str):
+        Sub-sources named by senders or interface_names inherit the
+        policy of the source they belong to.
+        """
+        policies = {}
+        for source in config.get("udp", {}).get("sources", []):
+            if "overflow" not in source:
+                continue
+            policies[source["name"]] = source["overflow"]
+            for key in ("senders", "interface_names"):
+                for sub_name in (source.get(key) or {}).values():
+                    policies[sub_name] = source["overflow"]
+        return policies
+
+    def _on_nmea_received(
+        self,
+        source_name: str,
+        sender_ip: str,
+        raw: str,
+        received_at: Optional[float] = None,
+        interface: Optional[str] = None,
+        destination: Optional[str] = None,
+    ):
         """Callback for received NMEA sentences from UDP listeners.
 
+        Queues the sentence when the ingest queue is enabled, otherwise
+        processes it immediately.
+
         Args:
             source_name: Name of the UDP source that received the data.
             sender_ip: IP address of the sender.
             raw: Raw NMEA sentence string.
+            received_at: Wall-clock arrival time of the datagram.
+            interface: Ingress interface of the datagram, if known.
+            destination: Destination type of the datagram, if known.
+        """
+        if self._rates is not None:
+            self._rates.mark(source_name, sentence_formatter(raw))
+        if self._shedder is not None and self._shedder.sheds(raw):
+            return
+        item = ReceivedSentence(
+            source_name, sender_ip, raw, received_at, interface, destination
+        )
+        if self._threads is not None:
+            self._threads.dispatch([item])
+        elif self._queue is not None:
+            self._queue.put(item)
+        else:
+            self._process_sentence(*item)
+
+    def _on_nmea_batch(self, batch: list[ReceivedSentence]):
+        """Callback for a batch of NMEA sentences from UDP listeners.
+
+        Args:
+            batch: Sentences drained from a socket in one event loop wakeup.
+        """
+        if self._rates is not None:
+            mark = self._rates.mark
+            for item in batch:
+                mark(item.source, sentence_formatter(item.sentence))
+
+        shedder = self._shedder
+        if shedder is not None and shedder.level:
+            batch = [item for item in batch if not shedder.sheds(item.sentence)]
+            if not batch:
+                return
+
+        if self._threads is not None:
+            self._threads.dispatch(batch)
+            return
+        if self._queue is not None:
+            self._queue.put_many(batch)
+            return
+
+        process = self._process_sentence
+        for item in batch:
+            process(*item)
+
+    def feed(self, batch: list[ReceivedSentence]):
+        """Hand sentences to the bridge as a listener would.
+
+        Used to drive the bridge without sockets, e.g. by the offline
+        replay tool. Call flush() afterwards when the ingest queue is on.
+
+        Sentences must already be framed and checksum-checked, as the
+        listeners' NMEAProtocol.extract() returns them: they are parsed
+        with verified=True, so a sentence with a wrong checksum is not
+        rejected here but parsed as if it were valid.
+
+        Args:
+            batch: Sentences to ingest, each one whole sentence without
+                CR/LF whose checksum has been checked.
+        """
+        self._on_nmea_batch(batch)
+
+    def flush(self) -> int:
+        """Process everything waiting in the ingest queue.
+
+        Returns:
+            Number of sentences processed.
+        """
+        processed = 0
+        if self._queue is not None:
+            while len(self._queue):
+                processed += self._process_queued()
+        return processed
+
+    @property
+    def stats(self) -> dict:
+        """Snapshot of the bridge counters."""
+        return dict(self._stats)
+
+    def _process_queued(self) -> int:
+        """Process one batch from the ingest queue, returning its size."""
+        process = self._process_sentence
+        items = self._queue.drain(self._queue_batch_size)
+        for item in items:
+            try:
+                process(*item)
+            except Exception as e:
+                self._stats["errors"] += 1
+                logger.error(
+                    "Error processing %s: %s", item.sentence, e, exc_info=True
+                )
+        return len(items)
+
+    async def _consume_queue(self):
+        """Drain the ingest queue in batches, yielding to the loop between them."""
+        queue = self._queue
+        while True:
+            await queue.wait()
+            self._process_queued()
+            # Let pending datagrams be received before the next batch
+            await asyncio.sleep(0)
+
+    async def _consume_workers(self):
+        """Drain records pushed by worker processes."""
+        workers = self._workers
+        handle = self._handle_worker_record
+        while True:
+            records = workers.read(self._queue_batch_size)
+            for record in records:
+                try:
+                    handle(*record)
+                except Exception as e:
+                    self._stats["errors"] += 1
+                    logger.error("Error handling worker record: %s", e, exc_info=True)
+            # Yield between batches, back off while every ring is empty
+            await asyncio.sleep(0 if records else POLL_INTERVAL)
+
+    def _handle_worker_record(
+        self,
+        kind: int,
+        now: float,
+        received_at: Optional[float],
+        fields: dict,
+        raw: Optional[str],
+        interface: Optional[str] = None,
+    ):
+        """Publish a sentence parsed (or AIS message decoded) by a worker.
+
+        Mirrors _process_sentence from the duplicate check onwards; the
+        worker has already parsed the sentence and, for AIS, decoded it.
+
+        Args:
+            kind: RECORD_NMEA or RECORD_AIS.
+            now: Monotonic arrival time.
+            received_at: Wall-clock arrival time of the datagram.
+            fields: NMEAData fields or decoded AIS fields.
+            raw: Raw sentence when duplicate suppression is enabled.
+            interface: Ingress interface of the datagram, if known.
+        """
+        if raw is not None and self._dedup is not None and self._dedup.is_duplicate(
+            raw, interface=interface
+        ):
+            self._stats["duplicates"] += 1
+            return
+
+        if kind == RECORD_AIS:
+            if not self._ais_throttle_passed(now):
+                return
+            self._publish_ais_result(self.ais_decoder.apply(fields))
+            self._finish_ais_publish(received_at)
+            return
+
+        if self._update_and_publish(NMEAData(**fields), now):
+            self._record_latency(received_at)
+
+    def _on_loop_lag(self, lag: float):
+        """Lag monitor callback - adjust the load shedding level."""
+        previous = self._shedder.level
+        level = self._shedder.update(lag)
+        if level == previous:
+            return
+
+        log = logger.warning if level > previous else logger.info
+        log(
+            "Load shedding level %d (%s), loop lag %.0fms",
+            level,
+            LEVEL_NAMES[level],
+            lag * 1000,
+        )
+        self.mqtt_publisher.publish_load_shed_level(level)
+
+    def _process_sentence(
+        self,
+        source_name: str,
+        sender_ip: str,
+        raw: str,
+        received_at: Optional[float] = None,
+        interface: Optional[str] = None,
+        destination: Optional[str] = None,
+    ):
+        """Parse a sentence and publish the resulting data.
+
+        Throttling is based on when the sentence arrived rather than when
+        it is processed, so queueing delay does not skew publish rates.
+
+        Args:
+            source_name: Name of the UDP source that received the data.
+            sender_ip: IP address of the sender.
+            raw: Raw NMEA sentence string, its checksum already verified
+                by the source's framer.
+            received_at: Wall-clock arrival time of the datagram.
+            interface: Ingress interface of the datagram, if known.
+            destination: Destination type of the datagram, if known.
         """
         self._stats["sentences_received"] += 1
 
-        # Parse the sentence
-        data = parse_sentence(raw)
+        # Drop copies of the same sentence relayed by another feed
+        if self._dedup is not None and self._dedup.is_duplicate(
+            raw, interface=interface
+        ):
+            self._stats["duplicates"] += 1
+            return
+
+        # Monotonic equivalent of the arrival time
+        now = time.monotonic()
+        if received_at is not None:
+            now -= max(0.0, time.time() - received_at)
+
+        # Nothing this sentence feeds is due yet
+        if self._lazy_parse and self._skips(raw, now):
+            self._stats["sentences_skipped"] += 1
+            return
+
+        if self._state_vector and raw[:1] == "$":
+            mask = self._state.parse(raw, verified=True)
+            if mask < 0:
+                return
+            self._stats["sentences_parsed"] += 1
+            if self._publish_fields(raw[3:6], mask, now):
+                self._record_latency(received_at)
+            return
+
+        # Parse the sentence (sources have already checked its checksum)
+        data = parse_sentence(raw, verified=True)
         if data is None:
             return
 
@@ -120,48 +523,190 @@ class NMEABridge:
 
         # Handle AIS with sentence-level throttle
         if data.sentence_type == "AIS" and data.ais_messages:
-            throttle_seconds = self._throttle_config.get("ais", 10)
-            now = time.monotonic()
-            last = self._last_publish.get("ais", 0)
-
-            if now - last < throttle_seconds:
+            if not self._ais_throttle_passed(now):
                 return
 
-            self._last_publish["ais"] = now
             for msg in data.ais_messages:
                 # Decode and track vessel
-                result = self.ais_decoder.decode_message(msg)
-                if result is not None:
-                    vessel, is_new = result
-                    if vessel.latitude is not None and vessel.longitude is not None:
-                        self.mqtt_publisher.publish_ais_vessel(vessel, is_new)
-
-                    # Update vessel count if changed
-                    count = self.ais_decoder.vessel_count
-                    if count != self._last_ais_vessel_count:
-                        self.mqtt_publisher.publish_ais_vessel_count(count)
-                        self._last_ais_vessel_count = count
-
-            # Periodic cleanup of stale vessels
-            now = time.monotonic()
-            if now - self._last_ais_cleanup > self._ais_cleanup_interval:
-                self._last_ais_cleanup = now
-                stale = self.ais_decoder.cleanup_stale_vessels()
-                for mmsi in stale:
-                    self.mqtt_publisher.remove_ais_vessel(mmsi)
-                    logger.info("Removed stale AIS vessel MMSI %d", mmsi)
-                if stale:
-                    self.mqtt_publisher.publish_ais_vessel_count(
-                        self.ais_decoder.vessel_count
-                    )
+                self._publish_ais_result(self.ais_decoder.decode_message(msg))
 
-            self._stats["sentences_published"] += 1
+            self._finish_ais_publish(received_at)
             return
 
         # Non-AIS: per-sensor throttle applied inside _update_and_publish
-        self._update_and_publish(data)
+        if self._update_and_publish(data, now):
+            self._record_latency(received_at)
+
+    def _process_sentence_threaded(
+        self,
+        counters: dict,
+        source_name: str,
+        sender_ip: str,
+        raw: str,
+        received_at: Optional[float] = None,
+        interface: Optional[str] = None,
+        destination: Optional[str] = None,
+    ):
+        """Thread-safe variant of _process_sentence for source threads.
+
+        Parsing and AIS decoding run without any lock, in parallel across
+        source threads. Duplicate suppression and everything on the publish
+        side (sensor state and throttles, the AIS registry, publish stats)
+        are touched only under their locks. Receive-side counters go to the
+        calling thread's own shard.
 
-    def _update_and_publish(self, data: NMEAData):
+        Args:
+            counters: Counter shard of the calling thread.
+            source_name: Name of the source that received the data.
+            sender_ip: IP address of the sender.
+            raw: Raw NMEA sentence string.
+            received_at: Wall-clock arrival time of the datagram.
+            interface: Ingress interface of the datagram, if known.
+            destination: Destination type of the datagram, if known.
+        """
+        counters["sentences_received"] += 1
+
+        if self._dedup is not None:
+            with self._dedup_lock:
+                duplicate = self._dedup.is_duplicate(raw, interface=interface)
+            if duplicate:
+                counters["duplicates"] += 1
+                return
+
+        now = time.monotonic()
+        if received_at is not None:
+            now -= max(0.0, time.time() - received_at)
+
+        if self._lazy_parse:
+            with self._publish_lock:
+                skipped = self._skips(raw, now)
+            if skipped:
+                counters["sentences_skipped"] += 1
+                return
+
+        data = parse_sentence(raw, verified=True)
+        if data is None:
+            return
+        counters["sentences_parsed"] += 1
+
+        if data.sentence_type == "AIS" and data.ais_messages:
+            with self._publish_lock:
+                if not self._ais_throttle_passed(now):
+                    return
+                messages = [self.ais_decoder.assemble(msg) for msg in data.ais_messages]
+
+            decoded = [decode_fields(*parts) for parts in messages if parts is not None]
+
+            with self._publish_lock:
+                for fields in decoded:
+                    if fields is not None:
+                        self._publish_ais_result(self.ais_decoder.apply(fields))
+                self._finish_ais_publish(received_at)
+            return
+
+        with self._publish_lock:
+            if self._update_and_publish(data, now):
+                self._record_latency(received_at)
+
+    def _skips(self, raw: str, now: float) -> bool:
+        """Decide whether a sentence can be skipped without parsing.
+
+        A sentence is skipped when none of the sensors it feeds is due
+        and the device tracker is not about to publish. Skipped tracker
+        sentences are kept for _apply_pending_tracker().
+
+        Args:
+            raw: Raw NMEA sentence.
+            now: Monotonic arrival time.
+        """
+        sentence_type = raw[3:6]
+        if sentence_type not in SENTENCE_SENSORS:
+            return False
+        if now >= self._next_useful.get(sentence_type, 0.0):
+            return False
+
+        if self._device_tracker_enabled:
+            # Any parsed sentence lets a due device tracker publish
+            tracker_due = self._last_sensor_publish.get(
+                "_device_tracker", 0
+            ) + self._throttle_config.get("position", 5)
+            if now >= tracker_due and (
+                "latitude" in self._state or "GGA" in self._pending_tracker
+            ):
+                return False
+            if sentence_type in TRACKER_SENTENCES:
+                # Keep the newest one last
+                self._pending_tracker.pop(sentence_type, None)
+                self._pending_tracker[sentence_type] = raw
+        return True
+
+    def _apply_pending_tracker(self):
+        """Parse skipped tracker sentences into the state, oldest first."""
+        for raw in self._pending_tracker.values():
+            data = parse_sentence(raw, verified=True)
+            if data is None:
+                continue
+            for key in TRACKER_STATE_KEYS:
+                value = getattr(data, key, None)
+                if value is not None:
+                    self._state[key] = value
+        self._pending_tracker.clear()
+
+    def _ais_throttle_passed(self, now: float) -> bool:
+        """Apply the AIS sentence-level throttle, claiming the slot if free."""
+        throttle_seconds = self._throttle_config.get("ais", 10)
+        last = self._last_publish.get("ais", 0)
+
+        if now - last < throttle_seconds:
+            return False
+
+        self._last_publish["ais"] = now
+        return True
+
+    def _publish_ais_result(self, result: Optional[tuple]):
+        """Publish a decoded vessel and the vessel count if it changed."""
+        if result is None:
+            return
+
+        vessel, is_new = result
+        if vessel.latitude is not None and vessel.longitude is not None:
+            self.mqtt_publisher.publish_ais_vessel(vessel, is_new)
+
+        # Update vessel count if changed
+        count = self.ais_decoder.vessel_count
+        if count != self._last_ais_vessel_count:
+            self.mqtt_publisher.publish_ais_vessel_count(count)
+            self._last_ais_vessel_count = count
+
+    def _finish_ais_publish(self, received_at: Optional[float]):
+        """Run periodic stale vessel cleanup and count an AIS publish."""
+        now = time.monotonic()
+        if now - self._last_ais_cleanup > self._ais_cleanup_interval:
+            self._last_ais_cleanup = now
+            stale = self.ais_decoder.cleanup_stale_vessels()
+            for mmsi in stale:
+                self.mqtt_publisher.remove_ais_vessel(mmsi)
+                logger.info("Removed stale AIS vessel MMSI %d", mmsi)
+            if stale:
+                self.mqtt_publisher.publish_ais_vessel_count(
+                    self.ais_decoder.vessel_count
+                )
+
+        self._stats["sentences_published"] += 1
+        self._record_latency(received_at)
+
+    def _record_latency(self, received_at: Optional[float]):
+        """Track ingest-to-publish latency for a published sentence."""
+        if received_at is None:
+            return
+        latency = time.time() - received_at
+        stats = self._latency
+        stats["count"] += 1
+        stats["total"] += latency
+        if latency > stats["max"]:
+            stats["max"] = latency
+
+    def _update_and_publish(self, data: NMEAData, now: Optional[float] = None) -> bool:
         """Update accumulated state and publish to MQTT.
 
         Each sensor is throttled individually based on its category,
@@ -170,9 +715,14 @@ class NMEABridge:
 
         Args:
             data: Parsed NMEA data.
+            now: Monotonic time the data arrived (defaults to now).
+
+        Returns:
+            True if any sensor value was published.
         """
         published = False
-        now = time.monotonic()
+        if now is None:
+            now = time.monotonic()
 
         for sensor_id, sensor_def in SENSOR_DEFINITIONS.items():
             value_key = sensor_def["value_key"]
@@ -194,8 +744,67 @@ class NMEABridge:
                 self.mqtt_publisher.publish_sensor(sensor_id, value)
                 published = True
 
+        return self._finish_update(data.sentence_type, now, published)
+
+    def _publish_fields(self, sentence_type: str, mask: int, now: float) -> bool:
+        """Publish the state vector fields a sentence just wrote.
+
+        The state vector counterpart of _update_and_publish: the values are
+        already in place, so only the sensors of the fields set in the mask
+        are throttled and published.
+
+        Args:
+            sentence_type: Sentence type, e.g. "HDT".
+            mask: Bitmask of the field IDs the sentence wrote.
+            now: Monotonic time the sentence arrived.
+
+        Returns:
+            True if any sensor value was published.
+        """
+        published = False
+        state = self._state
+        last_publish = self._last_sensor_publish
+        while mask:
+            low = mask & -mask
+            mask ^= low
+            field_id = low.bit_length() - 1
+            sensor_id = FIELD_SENSORS[field_id]
+            if sensor_id is None:
+                continue
+            if now - last_publish.get(sensor_id, 0) < self._sensor_throttle[sensor_id]:
+                continue
+            last_publish[sensor_id] = now
+            self.mqtt_publisher.publish_sensor(sensor_id, state.value(field_id))
+            published = True
+
+        return self._finish_update(sentence_type, now, published)
+
+    def _finish_update(self, sentence_type: str, now: float, published: bool) -> bool:
+        """Common tail of _update_and_publish and _publish_fields.
+
+        Records when the sentence type is next useful, publishes the device
+        tracker when due and counts the publish.
+
+        Returns:
+            published, passed through.
+        """
+        sensors = SENTENCE_SENSORS.get(sentence_type)
+        if sensors is not None:
+            last_publish = self._last_sensor_publish
+            self._next_useful[sentence_type] = min(
+                (last_publish.get(s, 0) + self._sensor_throttle[s] for s in sensors),
+                default=float("inf"),
+            )
+            # Skipped sentences older than this one must not overwrite it
+            for older in TRACKER_SENTENCES.get(sentence_type, ()):
+                self._pending_tracker.pop(older, None)
+
         # Update device tracker on the position throttle schedule only
         if self._device_tracker_enabled:
+            if self._pending_tracker and now - self._last_sensor_publish.get(
+                "_device_tracker", 0
+            ) >= self._throttle_config.get("position", 5):
+                self._apply_pending_tracker()
             lat = self._state.get("latitude")
             lon = self._state.get("longitude")
 
@@ -221,20 +830,201 @@ class NMEABridge:
 
         if published:
             self._stats["sentences_published"] += 1
+        return published
+
+    async def _publish_rates_periodically(self):
+        """Update the rate meters and publish them as diagnostic sensors."""
+        rates = self._rates
+        rates.tick(time.monotonic())
+        while True:
+            await asyncio.sleep(self._rates_interval)
+            if self._workers is not None:
+                for (kind, name), count in self._workers.take_counts().items():
+                    rates.add(kind, name, count)
+            for (kind, name), rate in rates.tick(time.monotonic()).items():
+                self.mqtt_publisher.publish_rate(kind, name, rate)
 
     async def _log_stats_periodically(self):
         """Log bridge statistics periodically."""
         while True:
             await asyncio.sleep(self._stats_interval)
+            kernel_drops = self.udp_listener.kernel_drops()
+            # Counters kept by source threads and worker processes
+            extra: dict[str, int] = {}
+            if self._threads is not None:
+                extra = self._threads.counters()
+            if self._workers is not None:
+                self._workers.check()
+                for key, value in self._workers.totals().items():
+                    extra[key] = extra.get(key, 0) + value
+                kernel_drops.update(self._workers.kernel_drops())
             logger.info(
-                "Bridge stats: received=%d parsed=%d published=%d errors=%d ais_vessels=%d",
-                self._stats["sentences_received"],
-                self._stats["sentences_parsed"],
+                "Bridge stats: received=%d parsed=%d skipped=%d published=%d errors=%d "
+                "filtered=%d invalid=%d rate_limited=%d duplicates=%d (%.1f%%) "
+                "kernel_drops=%d ais_vessels=%d",
+                self._stats["sentences_received"] + extra.get("sentences_received", 0),
+                self._stats["sentences_parsed"] + extra.get("sentences_parsed", 0),
+                self._stats["sentences_skipped"] + extra.get("sentences_skipped", 0),
                 self._stats["sentences_published"],
-                self._stats["errors"],
+                self._stats["errors"] + extra.get("errors", 0),
+                self.udp_listener.sentences_filtered
+                + self.tcp_listener.sentences_filtered
+                + self.serial_listener.sentences_filtered
+                + extra.get("filtered", 0),
+                self.udp_listener.sentences_invalid
+                + self.tcp_listener.sentences_invalid
+                + self.serial_listener.sentences_invalid
+                + extra.get("invalid", 0),
+                self.udp_listener.sentences_rate_limited
+                + self.tcp_listener.sentences_rate_limited
+                + self.serial_listener.sentences_rate_limited
+                + extra.get("rate_limited", 0),
+                self._stats["duplicates"] + extra.get("duplicates", 0),
+                self._dedup.hit_rate * 100 if self._dedup is not None else 0.0,
+                sum(kernel_drops.values()),
                 self.ais_decoder.vessel_count,
             )
 
+            # Name the sources that lost datagrams since the last interval
+            new_drops = {
+                name: count - self._last_kernel_drops.get(name, 0)
+                for name, count in kernel_drops.items()
+                if count > self._last_kernel_drops.get(name, 0)
+            }
+            if new_drops:
+                logger.warning(
+                    "Kernel dropped UDP datagrams: %s",
+                    " ".join(f"{n}=+{c}" for n, c in sorted(new_drops.items())),
+                )
+            self._last_kernel_drops = kernel_drops
+
+            latency = self._latency
+            if latency["count"]:
+                logger.info(
+                    "Ingest-to-publish latency: avg=%.1fms max=%.1fms over %d publishes",
+                    latency["total"] / latency["count"] * 1000,
+                    latency["max"] * 1000,
+                    latency["count"],
+                )
+                self._latency = {"count": 0, "total": 0.0, "max": 0.0}
+
+            for source, senders in self.udp_listener.sender_stats().items():
+                logger.debug(
+                    "Sender stats [%s]: %s",
+                    source,
+                    " ".join(
+                        f"{ip}={accepted}" + (f"(dropped={dropped})" if dropped else "")
+                        for ip, (accepted, dropped) in sorted(senders.items())
+                    ),
+                )
+
+            for source, tags in self.udp_listener.ingress_stats().items():
+                if tags:
+                    logger.debug(
+                        "Ingress stats [%s]: %s",
+                        source,
+                        " ".join(
+                            f"{interface}/{destination}={accepted}"
+                            + (f"(dropped={dropped})" if dropped else "")
+                            for (interface, destination), (accepted, dropped) in sorted(
+                                tags.items()
+                            )
+                        ),
+                    )
+
+            if self._queue is not None:
+                logger.info(
+                    "Queue stats: depth=%d high_watermark=%d/%d overflows=%d coalesced=%d%s",
+                    len(self._queue),
+                    self._queue.high_watermark,
+                    self._queue.maxsize,
+                    sum(self._queue.overflows.values()),
+                    self._queue.coalesced,
+                    "".join(
+                        f" {name}={count}"
+                        for name, count in sorted(self._queue.overflows.items())
+                    ),
+                )
+
+            if self._threads is not None:
+                threads = list(self._threads.threads.values())
+                overflows = self._threads.overflows()
+                logger.info(
+                    "Source thread stats: depth=%d high_watermark=%d/%d overflows=%d%s",
+                    sum(len(thread) for thread in threads),
+                    max((thread.high_watermark for thread in threads), default=0),
+                    self._threads.maxsize,
+                    sum(overflows.values()),
+                    "".join(
+                        f" {name}={count}" for name, count in sorted(overflows.items())
+                    ),
+                )
+
+            for label, conn in sorted(self.tcp_listener.connection_stats.items()):
+                logger.info(
+                    "TCP stats [%s]: bytes=%d sentences=%d%s",
+                    label,
+                    conn["bytes"],
+                    conn["sentences"],
+                    "" if conn["connected"] else " (disconnected)",
+                )
+
+            for name, port in sorted(self.serial_listener.port_stats.items()):
+                logger.info(
+                    "Serial stats [%s]: bytes=%d sentences=%d%s",
+                    name,
+                    port["bytes"],
+                    port["sentences"],
+                    "" if port["connected"] else " (closed)",
+                )
+
+            for name, capture in sorted(self.capture_listener.stats.items()):
+                logger.info(
+                    "Capture stats [%s]: datagrams=%d bytes=%d dropped=%d "
+                    "errors=%d segments=%d",
+                    name,
+                    capture["datagrams"],
+                    capture["bytes"],
+                    capture["dropped"],
+                    capture["errors"],
+                    capture["segments"],
+                )
+
+            if self._workers is not None:
+                for group, stats in sorted(self._workers.stats.items()):
+                    logger.info(
+                        "Worker stats [%s]: received=%d parsed=%d records=%d ring_full=%d",
+                        group,
+                        stats["sentences_received"],
+                        stats["sentences_parsed"],
+                        stats["records"],
+                        stats["ring_full"],
+                    )
+
+            if self._shedder is not None:
+                logger.info(
+                    "Load shedding: level=%d lag=%.1fms max_lag=%.1fms %s",
+                    self._shedder.level,
+                    self._lag_monitor.lag * 1000,
+                    self._lag_monitor.max_lag * 1000,
+                    " ".join(
+                        f"{name}={count}"
+                        for name, count in self._shedder.shed.items()
+                    ),
+                )
+
+            batch = self.udp_listener.batch_stats
+            if batch["batches"]:
+                logger.info(
+                    "Batch stats: batches=%d datagrams=%d avg_batch=%.1f max_batch=%d "
+                    "truncated=%d",
+                    batch["batches"],
+                    batch["datagrams"],
+                    batch["datagrams"] / batch["batches"],
+                    batch["max_batch"],
+                    batch["truncated"],
+                )
+
     async def run(self):
         """Start the bridge - runs until interrupted."""
         logger.info("Starting Navnet NMEA-to-MQTT Bridge")
@@ -256,18 +1046,69 @@ class NMEABridge:
             )
             return
 
-        # Set up UDP callback
+        # Set up source callbacks
+        udp_config = self.config.get("udp", {})
         self.udp_listener.set_callback(self._on_nmea_received)
+        self.tcp_listener.set_callback(self._on_nmea_received)
+        self.serial_listener.set_callback(self._on_nmea_received)
+        if udp_config.get("ingest_mode", "datagram") == "batch":
+            self.udp_listener.set_batch_callback(self._on_nmea_batch)
+            self.serial_listener.set_batch_callback(self._on_nmea_batch)
+        self.replay_listener.set_batch_callback(self._on_nmea_batch)
 
-        # Start UDP listeners
-        udp_config = self.config.get("udp", {})
+        # Start UDP listeners, TCP, serial and replay sources
         sources = udp_config.get("sources", [])
         bind_address = udp_config.get("bind_address", "0.0.0.0")
+        batch_size = udp_config.get("batch_size", DEFAULT_BATCH_SIZE)
 
-        await self.udp_listener.start(sources, bind_address)
+        if self._workers is not None:
+            # Sources run in worker processes instead
+            self._workers.start()
+        else:
+            await self.udp_listener.start(sources, bind_address, batch_size=batch_size)
+            await self.tcp_listener.start(
+                sources_of_type(sources, "tcp-client", "tcp-server"), bind_address
+            )
+            await self.serial_listener.start(sources_of_type(sources, "serial"))
+
+            await self.replay_listener.start(
+                sources_of_type(sources, "replay"), sources_of_type(sources, "udp")
+            )
+
+        # Capture-only sources never reach the NMEA path, even in worker mode
+        await self.capture_listener.start(
+            sources_of_type(sources, "capture"), bind_address
+        )
 
-        # Start stats logging
-        stats_task = asyncio.create_task(self._log_stats_periodically())
+        if not (
+            self.udp_listener.active
+            or self.tcp_listener.active
+            or self.serial_listener.active
+            or self.replay_listener.active
+            or self.capture_listener.active
+            or (self._workers is not None and self._workers.active)
+        ):
+            raise RuntimeError("No NMEA sources could be started")
+
+        if self._threads is not None:
+            logger.info(
+                "Processing each source on its own thread (GIL %s)",
+                "enabled" if gil_enabled() else "disabled",
+            )
+
+        # Start stats logging, the queue consumer and the lag monitor
+        tasks = [asyncio.create_task(self._log_stats_periodically())]
+        if self._queue is not None:
+            tasks.append(asyncio.create_task(self._consume_queue()))
+        if self._workers is not None:
+            tasks.append(asyncio.create_task(self._consume_workers()))
+        if self._rates is not None:
+            tasks.append(asyncio.create_task(self._publish_rates_periodically()))
+        if self._shedder is not None:
+            self.mqtt_publisher.publish_load_shed_level(self._shedder.level)
+            tasks.append(
+                asyncio.create_task(self._lag_monitor.run(self._on_loop_lag))
+            )
 
         logger.info("Bridge is running. Press Ctrl+C to stop.")
 
@@ -277,8 +1118,17 @@ class NMEABridge:
         except asyncio.CancelledError:
             pass
         finally:
-            stats_task.cancel()
+            for task in tasks:
+                task.cancel()
             await self.udp_listener.stop()
+            await self.tcp_listener.stop()
+            await self.serial_listener.stop()
+            await self.replay_listener.stop()
+            await self.capture_listener.stop()
+            if self._workers is not None:
+                self._workers.stop()
+            if self._threads is not None:
+                self._threads.stop()
             self.mqtt_publisher.disconnect()
             logger.info("Bridge stopped")
 
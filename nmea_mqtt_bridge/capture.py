@@ -0,0 +1,385 @@
+"""Raw datagram capture to rotating segment files.
+
+Some Navnet ports carry proprietary binary data rather than NMEA (10024
+multicast radar, 10026 sounder packets). A ``type: capture`` source
+archives every datagram on its port for later analysis instead of
+framing it. Datagrams are stamped on arrival and handed to a write-behind
+thread, so disk I/O never runs on the event loop.
+
+Each segment file starts with FILE_MAGIC, followed by records of:
+
+    timestamp  int64   nanoseconds since the epoch
+    sender     4 bytes IPv4 address
+    port       uint16  sender port
+    length     uint16  payload length
+    payload    length bytes
+
+all little-endian. Segments are preallocated to ``segment_bytes`` and
+truncated to their contents when closed; a segment left preallocated by
+a crash ends at the first all-zero record header.
+"""
+
+import asyncio
+import logging
+import os
+import queue
+import re
+import socket
+import struct
+import threading
+import time
+from pathlib import Path
+from typing import Iterator, NamedTuple, Optional
+
+from .udp_listener import _open_socket
+
+logger = logging.getLogger(__name__)
+
+FILE_MAGIC = b"NAVCAP1\n"
+
+# Segment size before rotating to a new file
+DEFAULT_SEGMENT_BYTES = 64 << 20
+
+# Userspace write buffer of the open segment
+WRITE_BUFFER_BYTES = 1 << 20
+
+# Datagrams waiting for the writer before new ones are dropped
+DEFAULT_MAX_PENDING = 10000
+
+# Seconds of idle time after which buffered records are flushed
+FLUSH_INTERVAL = 1.0
+
+_RECORD = struct.Struct("<q4sHH")
+
+
+class CaptureRecord(NamedTuple):
+    """One captured datagram."""
+
+    timestamp: float
+    sender: str
+    port: int
+    payload: bytes
+
+
+def read_segment(path) -> Iterator[CaptureRecord]:
+    """Read the records of a capture segment.
+
+    Args:
+        path: Segment file path.
+
+    Raises:
+        ValueError: If the file is not a capture segment.
+    """
+    with open(path, "rb") as f:
+        if f.read(len(FILE_MAGIC)) != FILE_MAGIC:
+            raise ValueError(f"{path} is not a capture segment")
+        while True:
+            header = f.read(_RECORD.size)
+            if len(header) < _RECORD.size:
+                return
+            timestamp_ns, sender, port, length = _RECORD.unpack(header)
+            if not timestamp_ns:
+                # Unused preallocated space
+                return
+            payload = f.read(length)
+            if len(payload) < length:
+                return
+            yield CaptureRecord(
+                timestamp_ns / 1e9, socket.inet_ntoa(sender), port, payload
+            )
+
+
+class SegmentWriter:
+    """Appends records to size-rotated, preallocated segment files.
+
+    Not thread-safe; owned by the capture writer thread.
+    """
+
+    def __init__(
+        self,
+        directory,
+        prefix: str,
+        segment_bytes: int = DEFAULT_SEGMENT_BYTES,
+        max_segments: Optional[int] = None,
+    ):
+        """Initialize segment writer.
+
+        Args:
+            directory: Directory for segment files (created if missing).
+            prefix: Segment file name prefix, usually the source name.
+            segment_bytes: Size at which a new segment is started.
+            max_segments: Number of segments to keep; older ones with the
+                same prefix are deleted. None keeps everything.
+        """
+        self.directory = Path(directory)
+        self.prefix = prefix
+        self.segment_bytes = segment_bytes
+        self.max_segments = max_segments
+        self.path: Optional[Path] = None
+        # Exactly this prefix's segment names, not those of a source whose
+        # name merely starts with it (e.g. "radar" vs "radar-2")
+        self._segment_name = re.compile(
+            re.escape(prefix) + r"-\d{8}-\d{6}-\d{5}\.cap"
+        )
+        self.segments = 0
+        self._file = None
+        self._written = 0
+        self._sequence = 0
+
+    def write(self, timestamp_ns: int, sender: bytes, port: int, payload: bytes):
+        """Append one record, rotating first if it would not fit."""
+        size = _RECORD.size + len(payload)
+        if self._file is None or (
+            self._written + size > self.segment_bytes
+            and self._written > len(FILE_MAGIC)
+        ):
+            self._rotate()
+        self._file.write(_RECORD.pack(timestamp_ns, sender, port, len(payload)))
+        self._file.write(payload)
+        self._written += size
+
+    def flush(self):
+        """Push buffered records to the kernel."""
+        if self._file is not None:
+            self._file.flush()
+
+    def close(self):
+        """Close the open segment, trimming its unused preallocation."""
+        if self._file is None:
+            return
+        self._file.flush()
+        self._file.truncate(self._written)
+        self._file.close()
+        self._file = None
+
+    def _rotate(self):
+        self.close()
+        self.directory.mkdir(parents=True, exist_ok=True)
+        # UTC, so names keep sorting by creation time across DST changes
+        stamp = time.strftime("%Y%m%d-%H%M%S", time.gmtime())
+        while True:
+            self._sequence += 1
+            self.path = self.directory / (
+                f"{self.prefix}-{stamp}-{self._sequence:05d}.cap"
+            )
+            try:
+                # Never truncate a segment left by a restart within the second
+                f = open(self.path, "xb", buffering=WRITE_BUFFER_BYTES)
+            except FileExistsError:
+                continue
+            break
+        try:
+            # Reserve the whole segment up front to avoid fragmentation
+            if hasattr(os, "posix_fallocate"):
+                os.posix_fallocate(f.fileno(), 0, self.segment_bytes)
+            else:
+                f.truncate(self.segment_bytes)
+        except OSError as e:
+            logger.debug("Preallocating %s failed: %s", self.path, e)
+        f.write(FILE_MAGIC)
+        self._file = f
+        self._written = len(FILE_MAGIC)
+        self.segments += 1
+        self._prune()
+
+    def _prune(self):
+        if not self.max_segments:
+            return
+        # Names sort by creation time
+        segments = sorted(
+            path
+            for path in self.directory.glob(f"{self.prefix}-*.cap")
+            if self._segment_name.fullmatch(path.name)
+        )
+        for old in segments[: -self.max_segments]:
+            try:
+                old.unlink()
+            except OSError as e:
+                logger.warning("Failed to remove old capture segment %s: %s", old, e)
+
+
+class CaptureWriter(threading.Thread):
+    """Write-behind thread draining captured datagrams to a SegmentWriter."""
+
+    def __init__(self, segments: SegmentWriter, max_pending: int = DEFAULT_MAX_PENDING):
+        """Initialize capture writer.
+
+        Args:
+            segments: Segment writer owned by this thread from now on.
+            max_pending: Datagrams allowed to wait before new ones are dropped.
+        """
+        super().__init__(name=f"capture-{segments.prefix}", daemon=True)
+        self.segments = segments
+        self.max_pending = max_pending
+        self._queue: queue.SimpleQueue = queue.SimpleQueue()
+        self.dropped = 0
+        self.errors = 0
+
+    def submit(self, timestamp_ns: int, sender: bytes, port: int, payload: bytes) -> bool:
+        """Queue a datagram (called from the event loop).
+
+        Returns:
+            False if the writer is too far behind and the datagram was dropped.
+        """
+        if self._queue.qsize() >= self.max_pending:
+            self.dropped += 1
+            return False
+        self._queue.put((timestamp_ns, sender, port, payload))
+        return True
+
+    def run(self):
+        get = self._queue.get
+        segments = self.segments
+        while True:
+            try:
+                item = get(timeout=FLUSH_INTERVAL)
+            except queue.Empty:
+                self._safely(segments.flush)
+                continue
+            if item is None:
+                break
+            self._safely(segments.write, *item)
+        self._safely(segments.close)
+
+    def _safely(self, action, *args):
+        try:
+            action(*args)
+        except OSError as e:
+            self.errors += 1
+            if self.errors == 1 or self.errors % 1000 == 0:
+                logger.error(
+                    "[%s] Capture write failed (%d errors): %s",
+                    self.segments.prefix,
+                    self.errors,
+                    e,
+                )
+
+    def stop(self, timeout: Optional[float] = 5.0):
+        """Write out queued datagrams, close the segment and exit."""
+        self._queue.put(None)
+        self.join(timeout)
+
+
+class CaptureProtocol(asyncio.DatagramProtocol):
+    """Hands every datagram of a capture source to its writer."""
+
+    def __init__(self, source_name: str, writer: CaptureWriter):
+        self.source_name = source_name
+        self.writer = writer
+        self.datagrams = 0
+        self.bytes = 0
+
+    def connection_made(self, transport: asyncio.DatagramTransport):
+        logger.info("Capture listener '%s' ready", self.source_name)
+
+    def datagram_received(self, data: bytes, addr: tuple):
+        self.datagrams += 1
+        self.bytes += len(data)
+        self.writer.submit(time.time_ns(), socket.inet_aton(addr[0]), addr[1], data)
+
+    def error_received(self, exc: Exception):
+        logger.warning("Capture error on '%s': %s", self.source_name, exc)
+
+
+class CaptureListener:
+    """Manages capture-only sources."""
+
+    def __init__(self):
+        self.transports: list[asyncio.DatagramTransport] = []
+        self.protocols: list[CaptureProtocol] = []
+
+    async def start(
+        self,
+        sources: list[dict],
+        bind_address: str = "0.0.0.0",
+        loop: Optional[asyncio.AbstractEventLoop] = None,
+    ):
+        """Start capturing for all enabled capture sources.
+
+        Args:
+            sources: Source dicts with 'name', 'port' and 'directory' keys,
+                plus optional 'segment_bytes', 'max_segments' and the UDP
+                socket settings (multicast_group, interface,
+                recv_buffer_bytes).
+            bind_address: Address to bind on.
+            loop: Event loop (defaults to running loop).
+        """
+        if loop is None:
+            loop = asyncio.get_running_loop()
+
+        for source in sources:
+            name = source["name"]
+            if not source.get("enabled", True):
+                logger.info("Skipping disabled source: %s", name)
+                continue
+
+            try:
+                sock = _open_socket(bind_address, source)
+            except OSError as e:
+                logger.error(
+                    "Failed to bind %s:%d [%s]: %s",
+                    bind_address,
+                    source["port"],
+                    name,
+                    e,
+                )
+                continue
+
+            writer = CaptureWriter(
+                SegmentWriter(
+                    source["directory"],
+                    name,
+                    segment_bytes=source.get("segment_bytes", DEFAULT_SEGMENT_BYTES),
+                    max_segments=source.get("max_segments"),
+                )
+            )
+            protocol = CaptureProtocol(name, writer)
+            writer.start()
+            try:
+                transport, _ = await loop.create_datagram_endpoint(
+                    lambda: protocol, sock=sock
+                )
+            except OSError as e:
+                sock.close()
+                await asyncio.to_thread(writer.stop)
+                logger.error("Failed to start capture [%s]: %s", name, e)
+                continue
+            self.transports.append(transport)
+            self.protocols.append(protocol)
+            logger.info(
+                "Capturing %s:%d [%s] to %s",
+                bind_address,
+                source["port"],
+                name,
+                source["directory"],
+            )
+
+    @property
+    def active(self) -> bool:
+        """Whether any capture source is running."""
+        return bool(self.transports)
+
+    @property
+    def stats(self) -> dict[str, dict[str, int]]:
+        """Per-source capture counters."""
+        return {
+            p.source_name: {
+                "datagrams": p.datagrams,
+                "bytes": p.bytes,
+                "dropped": p.writer.dropped,
+                "errors": p.writer.errors,
+                "segments": p.writer.segments.segments,
+            }
+            for p in self.protocols
+        }
+
+    async def stop(self):
+        """Stop capturing and close all segments."""
+        for transport in self.transports:
+            transport.close()
+        self.transports.clear()
+        # Writers drain and join in parallel, off the event loop
+        await asyncio.gather(
+            *(asyncio.to_thread(protocol.writer.stop) for protocol in self.protocols)
+        )
+        self.protocols.clear()
@@ -0,0 +1,117 @@
+"""Cross-feed duplicate sentence suppression."""
+
+import time
+from collections import OrderedDict
+from typing import Optional
+
+# Default suppression window (seconds)
+DEFAULT_WINDOW = 1.0
+
+# Hard bound on remembered sentences regardless of window
+DEFAULT_MAX_ENTRIES = 4096
+
+
+def sentence_key(sentence: str) -> int:
+    """Build the dedup key for a sentence.
+
+    The start delimiter, talker ID and checksum are dropped, so the
+    same fix relayed as ``$GPGGA`` on one feed and ``$IIGGA`` on another
+    (with a different checksum) maps to the same key.
+
+    Args:
+        sentence: Raw NMEA sentence.
+    """
+    star = sentence.rfind("*")
+    if star == -1:
+        star = len(sentence)
+    if sentence.startswith("$P"):
+        # Proprietary sentences have no talker ID to normalise
+        return hash(sentence[1:star])
+    return hash(sentence[3:star])
+
+
+class DuplicateFilter:
+    """Drops sentences already seen within a time window.
+
+    Keys are kept in insertion order in a bounded OrderedDict, so expiry
+    only ever pops from the front. A repeated sentence does not refresh
+    its entry, so a feed that legitimately repeats the same value still
+    gets one copy through per window.
+
+    With ``cross_interface_only``, only copies arriving on a different
+    ingress interface than the first one are suppressed: a repeat on the
+    same network is a fresh reading, a repeat from the mirrored VLAN is a
+    relayed copy.
+    """
+
+    def __init__(
+        self,
+        window: float = DEFAULT_WINDOW,
+        max_entries: int = DEFAULT_MAX_ENTRIES,
+        cross_interface_only: bool = False,
+    ):
+        """Initialize duplicate filter.
+
+        Args:
+            window: Seconds a sentence suppresses identical copies.
+            max_entries: Maximum sentences remembered.
+            cross_interface_only: Only suppress copies that arrived on
+                another ingress interface (untagged sentences always match).
+        """
+        self.window = window
+        self.max_entries = max_entries
+        self.cross_interface_only = cross_interface_only
+        # key -> (first seen, ingress interface)
+        self._seen: OrderedDict[int, tuple[float, Optional[str]]] = OrderedDict()
+        self.lookups = 0
+        self.hits = 0
+
+    def is_duplicate(
+        self,
+        sentence: str,
+        now: Optional[float] = None,
+        interface: Optional[str] = None,
+    ) -> bool:
+        """Check a sentence and remember it if new.
+
+        Args:
+            sentence: Raw NMEA sentence.
+            now: Monotonic timestamp (defaults to time.monotonic()).
+            interface: Ingress interface the sentence arrived on, if known.
+
+        Returns:
+            True if an identical sentence was seen within the window.
+        """
+        if now is None:
+            now = time.monotonic()
+        self.lookups += 1
+
+        seen = self._seen
+        cutoff = now - self.window
+        while seen:
+            key, (ts, _) = next(iter(seen.items()))
+            if ts > cutoff:
+                break
+            seen.popitem(last=False)
+
+        key = sentence_key(sentence)
+        entry = seen.get(key)
+        if entry is not None:
+            if (
+                self.cross_interface_only
+                and interface is not None
+                and entry[1] == interface
+            ):
+                return False
+            self.hits += 1
+            return True
+
+        seen[key] = (now, interface)
+        if len(seen) > self.max_entries:
+            seen.popitem(last=False)
+        return False
+
+    @property
+    def hit_rate(self) -> float:
+        """Fraction of checked sentences that were duplicates."""
+        return self.hits / self.lookups if self.lookups else 0.0
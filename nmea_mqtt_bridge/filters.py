@@ -0,0 +1,228 @@
+"""Early per-source filters applied before any sentence decoding."""
+
+import ipaddress
+from typing import Optional
+
+# Bound on cached per-sender decisions (guards against spoofed floods)
+MAX_CACHED_SENDERS = 1024
+
+
+class SenderFilter:
+    """Decides which senders a source accepts and what they are called.
+
+    Entries in the allow/deny lists may be single addresses or CIDR
+    networks. Decisions are cached per sender, so the lists are only
+    evaluated the first time a sender is seen.
+    """
+
+    def __init__(
+        self,
+        source_name: str,
+        names: Optional[dict[str, str]] = None,
+        allow: Optional[list[str]] = None,
+        deny: Optional[list[str]] = None,
+    ):
+        """Initialize sender filter.
+
+        Args:
+            source_name: Name used for senders without a sub-source name.
+            names: Sender IP -> sub-source name.
+            allow: If given, only these senders are accepted.
+            deny: Senders that are always dropped.
+
+        Raises:
+            ValueError: If an allow/deny entry is not a valid address or network.
+        """
+        self.source_name = source_name
+        self._names = dict(names or {})
+        self._allow = [ipaddress.ip_network(a, strict=False) for a in allow or []]
+        self._deny = [ipaddress.ip_network(d, strict=False) for d in deny or []]
+        # sender IP -> sub-source name, or None when rejected
+        self._decisions: dict[str, Optional[str]] = {}
+
+    @property
+    def active(self) -> bool:
+        """Whether the filter does anything beyond using the source name."""
+        return bool(self._names or self._allow or self._deny)
+
+    def resolve(self, sender_ip: str) -> Optional[str]:
+        """Get the (sub-)source name for a sender.
+
+        Args:
+            sender_ip: Sender IP address.
+
+        Returns:
+            Name to report the sender's sentences under, or None if the
+            sender is filtered out.
+        """
+        try:
+            return self._decisions[sender_ip]
+        except KeyError:
+            pass
+
+        name = self._decide(sender_ip)
+        if len(self._decisions) >= MAX_CACHED_SENDERS:
+            self._decisions.clear()
+        self._decisions[sender_ip] = name
+        return name
+
+    def _decide(self, sender_ip: str) -> Optional[str]:
+        try:
+            addr = ipaddress.ip_address(sender_ip)
+        except ValueError:
+            return None
+
+        if any(addr in net for net in self._deny):
+            return None
+        if self._allow and not any(addr in net for net in self._allow):
+            return None
+        return self._names.get(sender_ip, self.source_name)
+
+
+# Destination address types of tagged datagrams (from IP_PKTINFO)
+DESTINATION_TYPES = ("unicast", "broadcast", "multicast")
+
+
+class IngressFilter:
+    """Routes datagrams by the interface and destination they arrived on.
+
+    Uses the ingress tags taken from IP_PKTINFO, so a single socket bound
+    to 0.0.0.0 can tell traffic on the primary network from mirrored VLAN
+    broadcasts without a socket per interface. Untagged datagrams (no
+    ancillary data, e.g. in datagram ingest mode) are always accepted
+    under the source name.
+    """
+
+    def __init__(
+        self,
+        source_name: str,
+        names: Optional[dict[str, str]] = None,
+        interfaces: Optional[list[str]] = None,
+        destinations: Optional[list[str]] = None,
+    ):
+        """Initialize ingress filter.
+
+        Args:
+            source_name: Name used for interfaces without a sub-source name.
+            names: Interface name -> sub-source name.
+            interfaces: If given, only datagrams arriving on these
+                interfaces are accepted.
+            destinations: If given, only these destination types are
+                accepted (see DESTINATION_TYPES).
+        """
+        self.source_name = source_name
+        self._names = dict(names or {})
+        self._interfaces = frozenset(interfaces or ())
+        self._destinations = frozenset(destinations or ())
+
+    @property
+    def active(self) -> bool:
+        """Whether the filter does anything beyond using the source name."""
+        return bool(self._names or self._interfaces or self._destinations)
+
+    def resolve(
+        self, interface: Optional[str], destination: Optional[str]
+    ) -> Optional[str]:
+        """Get the (sub-)source name for a datagram's ingress tags.
+
+        Args:
+            interface: Ingress interface name, or None if untagged.
+            destination: Destination type, or None if untagged.
+
+        Returns:
+            Name to report the datagram's sentences under, or None if it
+            is filtered out.
+        """
+        if interface is None:
+            return self.source_name
+        if self._interfaces and interface not in self._interfaces:
+            return None
+        if self._destinations and destination not in self._destinations:
+            return None
+        return self._names.get(interface, self.source_name)
+
+
+# Bound on cached address decisions (real feeds use a handful)
+MAX_CACHED_ADDRESSES = 256
+
+
+def sentence_address(sentence) -> bytes:
+    """Get the address field (talker+formatter) of a framed sentence.
+
+    Args:
+        sentence: Framed sentence bytes (or a memoryview slice)
+            starting with '$' or '!'.
+    """
+    head = bytes(sentence[1:12])
+    end = head.find(b",")
+    return head[:end] if end != -1 else head
+
+
+def address_matches(address: str, entry: str) -> bool:
+    """Match an upper-case address against a filter entry.
+
+    A 3 character entry is a sentence formatter for any talker, anything
+    else is a prefix of the address.
+    """
+    if len(entry) == 3:
+        return address[2:] == entry
+    return address.startswith(entry)
+
+
+class SentenceTypeFilter:
+    """Allow/deny sentences by their address field, checked on raw bytes.
+
+    The address is the talker+formatter after the '$' or '!' (e.g.
+    ``GPGGA``, ``AIVDM``, ``PFEC``). Entries are matched as follows:
+
+        3 characters  - sentence formatter for any talker ("GGA", "RMC")
+        anything else - prefix of the address ("GPGGA", "AIVDM", "P")
+
+    A sentence is accepted if it matches the allow list (when given) and
+    does not match the deny list. Decisions are cached per address, so
+    the common case is one slice plus one dict lookup.
+    """
+
+    def __init__(
+        self, allow: Optional[list[str]] = None, deny: Optional[list[str]] = None
+    ):
+        """Initialize sentence type filter.
+
+        Args:
+            allow: If given, only matching sentences are accepted.
+            deny: Matching sentences are always dropped.
+        """
+        self._allow = [e.strip().upper() for e in allow or []]
+        self._deny = [e.strip().upper() for e in deny or []]
+        self._decisions: dict[bytes, bool] = {}
+
+    @property
+    def active(self) -> bool:
+        """Whether any allow/deny entries are configured."""
+        return bool(self._allow or self._deny)
+
+    def allows(self, sentence: bytes) -> bool:
+        """Check whether a framed sentence should be decoded.
+
+        Args:
+            sentence: Framed sentence bytes (or a memoryview slice)
+                starting with '$' or '!'.
+        """
+        address = sentence_address(sentence)
+        try:
+            return self._decisions[address]
+        except KeyError:
+            pass
+
+        allowed = self._decide(address.decode("ascii", errors="replace").upper())
+        if len(self._decisions) >= MAX_CACHED_ADDRESSES:
+            self._decisions.clear()
+        self._decisions[address] = allowed
+        return allowed
+
+    def _decide(self, address: str) -> bool:
+        if any(address_matches(address, e) for e in self._deny):
+            return False
+        if self._allow:
+            return any(address_matches(address, e) for e in self._allow)
+        return True
@@ -0,0 +1,286 @@
+"""Bytes-level framing of NMEA sentences from raw datagrams.
+
+Works directly on the received buffer: lines are located with a compiled
+regex and handed out as ``memoryview`` slices, so a datagram read into a
+reusable ``bytearray`` is framed without copying. Sentences can be
+checked against a type filter and their checksum before anything is
+copied or decoded. Datagrams containing non-printable bytes (rare) are
+cleaned with a precomputed ``bytes.translate`` delete table first.
+Sentences split across datagrams are stitched back together using a
+small carry-over buffer kept per sender.
+
+When NumPy is installed, a buffer carrying many sentences (a serial read,
+a datagram packed with an AIS burst) has all its checksums computed in
+one ``np.bitwise_xor.reduceat`` call.
+"""
+
+import re
+from typing import Callable, Optional, Sequence, Union
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+# Every byte outside printable ASCII except the CR/LF line terminators
+_DELETE_CHARS = bytes(
+    c for c in range(256) if not (32 <= c < 127) and c not in (10, 13)
+)
+
+# Any byte the delete table would remove
+_DIRTY = re.compile(rb"[^\x20-\x7e\r\n]")
+
+# A non-empty run of bytes between CR/LF terminators
+_LINE = re.compile(rb"[^\r\n]+")
+
+# First byte of a standard ($) or encapsulated/AIS (!) sentence
+_START_BYTES = (ord("$"), ord("!"))
+
+# Checksum digit byte -> value
+_HEX_DIGITS = {c: int(chr(c), 16) for c in b"0123456789abcdefABCDEF"}
+
+# Low-half masks used when folding a checksum, indexed by byte count
+_FOLD_MASKS = [(1 << (8 * n)) - 1 for n in range(128)]
+
+# Fewest sentences in one buffer for which the NumPy batch check beats
+# checking them one by one (it costs a fixed ~15-20us per call)
+BATCH_CHECKSUM_MIN = 16
+
+# NMEA 0183 caps sentences at 82 chars; anything longer is not a fragment
+MAX_CARRY_BYTES = 164
+
+# Bound on senders holding a partial line at any time
+MAX_CARRY_SENDERS = 64
+
+Buffer = Union[bytes, bytearray, memoryview]
+
+
+def _is_complete(line: Buffer) -> bool:
+    """Check whether a line ends with a '*HH' checksum field."""
+    return len(line) >= 3 and line[-3] == 42  # '*'
+
+
+def xor_checksum(data: Buffer) -> int:
+    """XOR all bytes of a buffer together.
+
+    Folds the buffer as one big integer, halving it each step, so the
+    work is a handful of integer operations instead of a per-byte loop.
+
+    Args:
+        data: Bytes between the start delimiter and the '*'.
+
+    Returns:
+        The 8-bit NMEA checksum.
+    """
+    n = len(data)
+    value = int.from_bytes(data, "little")
+    while n > 1:
+        half = (n + 1) >> 1
+        mask = _FOLD_MASKS[half] if half < 128 else (1 << (8 * half)) - 1
+        value = (value & mask) ^ (value >> (8 * half))
+        n = half
+    return value
+
+
+def expected_checksum(sentence: Buffer) -> Optional[int]:
+    """Read the trailing '*HH' checksum field of a sentence.
+
+    Args:
+        sentence: Sentence starting with '$' or '!', without CR/LF.
+
+    Returns:
+        The checksum value (hex digits in either case), or None if the
+        sentence does not end with a well-formed checksum field.
+    """
+    n = len(sentence)
+    if n < 4 or sentence[n - 3] != 42:  # '*'
+        return None
+    hi = _HEX_DIGITS.get(sentence[n - 2])
+    lo = _HEX_DIGITS.get(sentence[n - 1])
+    if hi is None or lo is None:
+        return None
+    return (hi << 4) | lo
+
+
+def has_valid_checksum(sentence: Buffer) -> bool:
+    """Check the trailing '*HH' checksum of a framed sentence.
+
+    Args:
+        sentence: Sentence starting with '$' or '!', without CR/LF.
+
+    Returns:
+        True if the checksum is present and matches.
+    """
+    expected = expected_checksum(sentence)
+    if expected is None:
+        return False
+    return xor_checksum(sentence[1 : len(sentence) - 3]) == expected
+
+
+if np is not None:
+    # Checksum digit byte -> value, -1 for anything else
+    _HEX_TABLE = np.full(256, -1, dtype=np.int16)
+    for _c, _v in _HEX_DIGITS.items():
+        _HEX_TABLE[_c] = _v
+
+
+def batch_valid_checksums(
+    buffer: Buffer, starts: Sequence[int], ends: Sequence[int]
+) -> "np.ndarray":
+    """Check the trailing '*HH' checksums of many sentences in one buffer.
+
+    The same test as has_valid_checksum(buffer[start:end]) for each
+    sentence, but the XOR of every body is computed in a single
+    ``np.bitwise_xor.reduceat`` over the whole buffer.
+
+    Args:
+        buffer: Buffer holding the sentences, e.g. a received datagram.
+        starts: Offset of each sentence's '$' or '!'.
+        ends: Offset just past each sentence's last checksum digit.
+
+    Returns:
+        Boolean array, True where the checksum is present and matches.
+
+    Raises:
+        ImportError: If NumPy is not installed.
+    """
+    if np is None:
+        raise ImportError("batch checksum validation requires numpy")
+    data = np.frombuffer(buffer, dtype=np.uint8)
+    starts = np.asarray(starts, dtype=np.intp)
+    ends = np.asarray(ends, dtype=np.intp)
+    if not len(starts):
+        return np.zeros(0, dtype=bool)
+
+    # Sentences too short for '*HH' read offset 0 and are masked out
+    valid = ends - starts >= 4
+    star = np.where(valid, ends - 3, 0)
+    valid &= data[star] == 42  # '*'
+    hi = _HEX_TABLE[data[np.where(valid, ends - 2, 0)]]
+    lo = _HEX_TABLE[data[np.where(valid, ends - 1, 0)]]
+    valid &= (hi >= 0) & (lo >= 0)
+
+    # reduceat over [body start, '*'] pairs; every other result is a body
+    bounds = np.empty(2 * len(starts), dtype=np.intp)
+    bounds[0::2] = np.where(valid, starts + 1, star)
+    bounds[1::2] = star
+    sums = np.bitwise_xor.reduceat(data, bounds)[0::2]
+    # An empty body reduces to the byte at its start instead of 0
+    sums[bounds[0::2] == star] = 0
+    return valid & (sums == (hi << 4) | lo)
+
+
+class SentenceFramer:
+    """Splits raw datagrams into NMEA sentences.
+
+    A trailing line that is not CR/LF terminated and has no checksum yet
+    is held back per sender and prepended to that sender's next datagram.
+
+    Sentences are returned as memoryview slices of the data passed in (or
+    of a private copy), so callers reading into a reused buffer must copy
+    or decode them before the next receive.
+    """
+
+    def __init__(
+        self,
+        max_carry: int = MAX_CARRY_BYTES,
+        accept: Optional[Callable[[Buffer], bool]] = None,
+        verify_checksum: bool = False,
+    ):
+        """Initialize framer.
+
+        Args:
+            max_carry: Longest partial line kept for reassembly.
+            accept: Optional predicate on each framed sentence, e.g. a
+                sentence type filter; rejected sentences are counted in
+                ``filtered``.
+            verify_checksum: Drop sentences without a valid checksum,
+                counted in ``invalid``.
+        """
+        self.max_carry = max_carry
+        self.accept = accept
+        self.verify_checksum = verify_checksum
+        self.filtered = 0
+        self.invalid = 0
+        self._carry: dict[str, bytes] = {}
+
+    def feed(self, sender: str, data: Buffer) -> list[memoryview]:
+        """Frame one datagram into sentences.
+
+        Args:
+            sender: Sender identity used to key the carry-over buffer.
+            data: Raw datagram payload.
+
+        Returns:
+            List of cleaned sentences starting with '$' or '!'.
+        """
+        if _DIRTY.search(data) is not None:
+            data = bytes(data).translate(None, _DELETE_CHARS)
+
+        carry = self._carry.pop(sender, None)
+        sentences: list[memoryview] = []
+        if carry is not None:
+            if data[:1] in (b"$", b"!"):
+                # New sentence starts here, so the held line was already whole
+                self._emit(memoryview(carry), 0, len(carry), sentences)
+            else:
+                data = carry + bytes(data)
+
+        view = memoryview(data)
+        spans = [m.span() for m in _LINE.finditer(view)]
+        if spans and view[-1] not in (10, 13):
+            start, end = spans[-1]
+            if not _is_complete(view[start:end]) and end - start <= self.max_carry:
+                spans.pop()
+                if len(self._carry) >= MAX_CARRY_SENDERS:
+                    self._carry.pop(next(iter(self._carry)))
+                self._carry[sender] = view[start:end].tobytes()
+
+        if self.verify_checksum and np is not None and len(spans) >= BATCH_CHECKSUM_MIN:
+            self._emit_batch(view, spans, sentences)
+        else:
+            for start, end in spans:
+                self._emit(view, start, end, sentences)
+        return sentences
+
+    def _frame(self, view: memoryview, start: int, end: int) -> Optional[tuple]:
+        """Trim a line to its sentence, or None if it is not a wanted one."""
+        while start < end and view[start] == 32:
+            start += 1
+        while end > start and view[end - 1] == 32:
+            end -= 1
+        if start == end or view[start] not in _START_BYTES:
+            return None
+        if self.accept is not None and not self.accept(view[start:end]):
+            self.filtered += 1
+            return None
+        return start, end
+
+    def _emit(self, view: memoryview, start: int, end: int, out: list):
+        """Append view[start:end] to out if it is a wanted sentence."""
+        span = self._frame(view, start, end)
+        if span is None:
+            return
+        line = view[span[0] : span[1]]
+        if self.verify_checksum and not has_valid_checksum(line):
+            self.invalid += 1
+            return
+        out.append(line)
+
+    def _emit_batch(self, view: memoryview, spans: list, out: list):
+        """Append the wanted sentences of many lines, checksummed together."""
+        frame = self._frame
+        framed = [span for span in (frame(view, *line) for line in spans) if span]
+        if not framed:
+            return
+        starts, ends = zip(*framed)
+        valid = batch_valid_checksums(view, starts, ends).tolist()
+        for (start, end), ok in zip(framed, valid):
+            if ok:
+                out.append(view[start:end])
+            else:
+                self.invalid += 1
+
+    def clear(self):
+        """Drop all partial lines."""
+        self._carry.clear()
@@ -0,0 +1,133 @@
+"""Bounded queue decoupling UDP receive from sentence processing."""
+
+import asyncio
+from collections import deque
+from typing import Optional
+
+from .udp_listener import ReceivedSentence
+
+# What to do when a sentence arrives and the queue is full:
+#   drop-oldest - discard the oldest queued sentence to make room
+#   drop-newest - discard the arriving sentence
+#   coalesce    - replace the pending sentence of the same type from the
+#                 same source; falls back to drop-oldest if there is none
+OVERFLOW_POLICIES = ("drop-oldest", "drop-newest", "coalesce")
+
+DEFAULT_MAXSIZE = 4096
+DEFAULT_POLICY = "drop-oldest"
+
+
+def _coalesce_key(item: ReceivedSentence) -> tuple[str, str]:
+    """Source name plus sentence address, e.g. ('heading_fast', '$GPHDT')."""
+    sentence = item.sentence
+    comma = sentence.find(",")
+    return item.source, sentence[:comma] if comma != -1 else sentence
+
+
+class IngestQueue:
+    """Bounded FIFO of received sentences with per-source overflow policies.
+
+    Entries are stored as ``[key, item]`` lists so a coalescing source can
+    overwrite its pending sentence in place without reordering the queue.
+    """
+
+    def __init__(
+        self,
+        maxsize: int = DEFAULT_MAXSIZE,
+        policies: Optional[dict[str, str]] = None,
+        default_policy: str = DEFAULT_POLICY,
+    ):
+        """Initialize ingest queue.
+
+        Args:
+            maxsize: Maximum queued sentences.
+            policies: Source name -> overflow policy.
+            default_policy: Policy for sources not listed in policies.
+
+        Raises:
+            ValueError: If a policy name is unknown.
+        """
+        for policy in [default_policy, *(policies or {}).values()]:
+            if policy not in OVERFLOW_POLICIES:
+                raise ValueError(f"Unknown overflow policy: {policy}")
+
+        self.maxsize = maxsize
+        self._policies = dict(policies or {})
+        self._default_policy = default_policy
+        self._entries: deque[list] = deque()
+        # Newest pending entry per coalesce key (coalescing sources only)
+        self._latest: dict[tuple[str, str], list] = {}
+        self._event = asyncio.Event()
+
+        self.high_watermark = 0
+        self.overflows: dict[str, int] = {}
+        self.coalesced = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def put(self, item: ReceivedSentence):
+        """Queue a sentence, applying the source's overflow policy if full.
+
+        Args:
+            item: Received sentence.
+        """
+        entries = self._entries
+        policy = self._policies.get(item.source, self._default_policy)
+        key = _coalesce_key(item) if policy == "coalesce" else None
+
+        if len(entries) >= self.maxsize:
+            self.overflows[item.source] = self.overflows.get(item.source, 0) + 1
+            if key is not None:
+                pending = self._latest.get(key)
+                if pending is not None:
+                    pending[1] = item
+                    self.coalesced += 1
+                    return
+            elif policy == "drop-newest":
+                return
+            self._pop_entry()
+
+        entry = [key, item]
+        entries.append(entry)
+        if key is not None:
+            self._latest[key] = entry
+
+        if len(entries) > self.high_watermark:
+            self.high_watermark = len(entries)
+        self._event.set()
+
+    def put_many(self, items: list[ReceivedSentence]):
+        """Queue several sentences.
+
+        Args:
+            items: Received sentences, in arrival order.
+        """
+        put = self.put
+        for item in items:
+            put(item)
+
+    def drain(self, max_items: int) -> list[ReceivedSentence]:
+        """Remove and return up to max_items queued sentences, oldest first.
+
+        Args:
+            max_items: Maximum sentences to return.
+        """
+        batch = []
+        pop = self._pop_entry
+        for _ in range(min(max_items, len(self._entries))):
+            batch.append(pop()[1])
+        return batch
+
+    async def wait(self):
+        """Wait until at least one sentence is queued."""
+        while not self._entries:
+            self._event.clear()
+            await self._event.wait()
+
+    def _pop_entry(self) -> list:
+        entry = self._entries.popleft()
+        key = entry[0]
+        if key is not None and self._latest.get(key) is entry:
+            del self._latest[key]
+        return entry
@@ -0,0 +1,214 @@
+"""Event loop lag monitoring and staged load shedding.
+
+When the event loop falls behind, every sentence competes equally for
+it, so own-ship position and heading end up waiting behind bulk AIS
+decoding. The lag monitor measures how late the loop wakes a sleeping
+task; the shedder turns that into a level and drops low-value traffic
+at ingest, in stages:
+
+    1  skip AIS static/voyage messages (types 5 and 24)
+    2  also keep only every Nth remaining AIS message
+    3  also keep only every Nth heading sentence (HDT/HDG)
+
+Nothing else is ever shed, so position (GGA etc.) and the own-ship AIS
+report (VDO) always get through.
+"""
+
+import asyncio
+import logging
+from typing import Callable, Optional
+
+logger = logging.getLogger(__name__)
+
+# Level index -> name, also used to label shed counters
+LEVEL_NAMES = ("normal", "ais_static", "ais_decimate", "heading_decimate")
+
+# Smoothed loop lag (seconds) at which levels 1, 2 and 3 are entered
+DEFAULT_THRESHOLDS = (0.05, 0.1, 0.25)
+
+# A level is left once lag falls below this fraction of its threshold
+RECOVER_RATIO = 0.5
+
+# Seconds between loop lag samples
+DEFAULT_INTERVAL = 0.1
+
+# Weight of the newest sample in the smoothed lag
+LAG_SMOOTHING = 0.3
+
+# Decimation when shedding: keep one of every N messages
+DEFAULT_AIS_KEEP_EVERY = 4
+DEFAULT_HEADING_KEEP_EVERY = 5
+
+# First armored payload character of AIS message types 5 and 24
+AIS_STATIC_FIRST_CHARS = frozenset("5H")
+
+HEADING_TYPES = ("HDT", "HDG")
+
+# AIS report of own ship rather than other traffic
+OWN_SHIP_AIS_TYPE = "VDO"
+
+
+class LoopLagMonitor:
+    """Measures event loop lag as scheduled-vs-actual wakeup delay."""
+
+    def __init__(self, interval: float = DEFAULT_INTERVAL):
+        """Initialize lag monitor.
+
+        Args:
+            interval: Seconds between samples.
+        """
+        self.interval = interval
+        # Smoothed and worst lag in seconds
+        self.lag = 0.0
+        self.max_lag = 0.0
+
+    def sample(self, lag: float) -> float:
+        """Fold one raw lag sample into the smoothed lag.
+
+        Args:
+            lag: Seconds a wakeup was late.
+
+        Returns:
+            The updated smoothed lag.
+        """
+        if lag > self.max_lag:
+            self.max_lag = lag
+        self.lag += LAG_SMOOTHING * (lag - self.lag)
+        return self.lag
+
+    async def run(self, on_sample: Optional[Callable[[float], None]] = None):
+        """Sample loop lag until cancelled.
+
+        Args:
+            on_sample: Called with the smoothed lag after every sample.
+        """
+        loop = asyncio.get_running_loop()
+        while True:
+            expected = loop.time() + self.interval
+            await asyncio.sleep(self.interval)
+            lag = self.sample(max(0.0, loop.time() - expected))
+            if on_sample is not None:
+                on_sample(lag)
+
+
+class LoadShedder:
+    """Drops low-priority sentences at ingest while the loop is lagging."""
+
+    def __init__(
+        self,
+        thresholds: tuple[float, ...] = DEFAULT_THRESHOLDS,
+        ais_keep_every: int = DEFAULT_AIS_KEEP_EVERY,
+        heading_keep_every: int = DEFAULT_HEADING_KEEP_EVERY,
+    ):
+        """Initialize load shedder.
+
+        Args:
+            thresholds: Smoothed lag in seconds at which levels 1-3 are
+                entered, in increasing order.
+            ais_keep_every: At level 2+, keep one of every N AIS messages.
+            heading_keep_every: At level 3, keep one of every N headings.
+        """
+        self.thresholds = tuple(thresholds)
+        self.ais_keep_every = max(1, int(ais_keep_every))
+        self.heading_keep_every = max(1, int(heading_keep_every))
+        self.level = 0
+        # Level name -> sentences shed for that reason
+        self.shed: dict[str, int] = {name: 0 for name in LEVEL_NAMES[1:]}
+        self._ais_seen = 0
+        self._heading_seen = 0
+        # Multipart sequence ID -> reason its first fragment was shed
+        self._shed_sequences: dict[str, str] = {}
+
+    @classmethod
+    def from_config(cls, config: dict) -> "LoadShedder":
+        """Build a shedder from the ``load_shedding`` config section."""
+        return cls(
+            thresholds=config.get("thresholds", DEFAULT_THRESHOLDS),
+            ais_keep_every=config.get("ais_keep_every", DEFAULT_AIS_KEEP_EVERY),
+            heading_keep_every=config.get(
+                "heading_keep_every", DEFAULT_HEADING_KEEP_EVERY
+            ),
+        )
+
+    def update(self, lag: float) -> int:
+        """Move between levels based on the smoothed loop lag.
+
+        Levels are entered as soon as their threshold is reached and left
+        one at a time once lag drops well below it.
+
+        Args:
+            lag: Smoothed loop lag in seconds.
+
+        Returns:
+            The new level.
+        """
+        level = self.level
+        while level < len(self.thresholds) and lag >= self.thresholds[level]:
+            level += 1
+        if level == self.level and level > 0:
+            if lag < self.thresholds[level - 1] * RECOVER_RATIO:
+                level -= 1
+        self.level = level
+        return level
+
+    def sheds(self, sentence: str) -> bool:
+        """Check whether a sentence should be dropped at the current level.
+
+        Args:
+            sentence: Raw NMEA sentence.
+
+        Returns:
+            True if the sentence should be dropped.
+        """
+        if not self.level:
+            return False
+        if sentence.startswith("!"):
+            if sentence[3:6] == OWN_SHIP_AIS_TYPE:
+                return False
+            reason = self._ais_reason(sentence)
+        elif self.level >= 3 and sentence[3:6] in HEADING_TYPES:
+            self._heading_seen += 1
+            reason = (
+                "heading_decimate"
+                if self._heading_seen % self.heading_keep_every
+                else None
+            )
+        else:
+            return False
+
+        if reason is None:
+            return False
+        self.shed[reason] += 1
+        return True
+
+    def _ais_reason(self, sentence: str) -> Optional[str]:
+        """Get the reason to shed an AIS sentence, or None to keep it."""
+        # !AIVDM,count,number,sequence,channel,payload,fill*cs
+        parts = sentence.split(",", 6)
+        if len(parts) < 7:
+            return None
+        sequence = parts[3]
+
+        if parts[2] != "1":
+            # Later fragments follow the decision made for the first one,
+            # which is forgotten once the last fragment has been seen
+            if not sequence:
+                return None
+            if parts[2] == parts[1]:
+                return self._shed_sequences.pop(sequence, None)
+            return self._shed_sequences.get(sequence)
+
+        if parts[5][:1] in AIS_STATIC_FIRST_CHARS:
+            reason: Optional[str] = "ais_static"
+        elif self.level >= 2:
+            self._ais_seen += 1
+            reason = "ais_decimate" if self._ais_seen % self.ais_keep_every else None
+        else:
+            reason = None
+
+        if sequence and parts[1] != "1":
+            if reason is None:
+                self._shed_sequences.pop(sequence, None)
+            else:
+                self._shed_sequences[sequence] = reason
+        return reason
@@ -2,6 +2,8 @@
 
 import json
 import logging
+import re
+import zlib
 from typing import Any, Optional
 
 import paho.mqtt.client as mqtt
@@ -144,6 +146,11 @@ class MQTTPublisher:
         self._discovery_sent = False
         self._last_values: dict[str, Any] = {}
         self._ais_discovered_mmsis: set[int] = set()
+        # (kind, name) -> slug of each discovered rate sensor, and the
+        # reverse, so two names never share a slug (and unique_id)
+        self._rate_slugs: dict[tuple[str, str], str] = {}
+        self._rate_names: dict[tuple[str, str], str] = {}
+        self._load_shed_discovered = False
 
     def connect(self):
         """Connect to MQTT broker."""
@@ -431,6 +438,95 @@ class MQTTPublisher:
         topic = f"{self.topic_prefix}/ais/vessel_count"
         self.client.publish(topic, str(count), retain=True)
 
+    def publish_load_shed_level(self, level: int):
+        """Publish the current load shedding level as an HA diagnostic sensor.
+
+        The sensor is discovered the first time the level is published.
+
+        Args:
+            level: Load shedding level (0 = not shedding).
+        """
+        if not self._connected:
+            return
+
+        state_topic = f"{self.topic_prefix}/bridge/load_shed_level"
+
+        if not self._load_shed_discovered:
+            object_id = "navnet_load_shed_level"
+            payload = {
+                "name": "Load shed level",
+                "unique_id": object_id,
+                "state_topic": state_topic,
+                "availability_topic": f"{self.topic_prefix}/bridge/status",
+                "device": self._device_payload(),
+                "icon": "mdi:gauge",
+                "state_class": "measurement",
+                "entity_category": "diagnostic",
+            }
+            self.client.publish(
+                f"{self.discovery_prefix}/sensor/{object_id}/config",
+                json.dumps(payload),
+                retain=True,
+            )
+            self._load_shed_discovered = True
+
+        self.client.publish(state_topic, str(level), retain=True)
+
+    def publish_rate(self, kind: str, name: str, rate: float):
+        """Publish a rate meter as an HA diagnostic sensor.
+
+        The sensor is discovered the first time each meter is published.
+
+        Args:
+            kind: Meter kind ("source" or "sentence_type").
+            name: Source name or sentence type.
+            rate: Rate in Hz.
+        """
+        if not self._connected:
+            return
+
+        slug = self._rate_slugs.get((kind, name))
+        discovered = slug is not None
+        if not discovered:
+            slug = self._rate_slug(kind, name)
+        state_topic = f"{self.topic_prefix}/diagnostics/rate/{kind}/{slug}"
+
+        if not discovered:
+            object_id = f"navnet_rate_{kind}_{slug}"
+            label = "Source" if kind == "source" else "Sentence"
+            payload = {
+                "name": f"{label} rate {name}",
+                "unique_id": object_id,
+                "state_topic": state_topic,
+                "availability_topic": f"{self.topic_prefix}/bridge/status",
+                "device": self._device_payload(),
+                "icon": "mdi:speedometer",
+                "unit_of_measurement": "Hz",
+                "state_class": "measurement",
+                "entity_category": "diagnostic",
+                "suggested_display_precision": 1,
+            }
+            self.client.publish(
+                f"{self.discovery_prefix}/sensor/{object_id}/config",
+                json.dumps(payload),
+                retain=True,
+            )
+            self._rate_slugs[(kind, name)] = slug
+            self._rate_names[(kind, slug)] = name
+
+        self.client.publish(state_topic, f"{rate:.2f}", retain=True)
+
+    def _rate_slug(self, kind: str, name: str) -> str:
+        """Get an unused topic/entity ID slug for a rate meter.
+
+        Names that reduce to a slug already taken by another name (e.g.
+        "a-b" after "a_b") get a suffix derived from the name itself.
+        """
+        slug = re.sub(r"[^a-z0-9_]", "_", name.lower())
+        if (kind, slug) in self._rate_names:
+            slug = f"{slug}_{zlib.crc32(name.encode()):08x}"
+        return slug
+
     def remove_ais_vessel(self, mmsi: int):
         """Remove HA discovery for a stale AIS vessel.
 
@@ -1,16 +1,25 @@
 """NMEA 0183 sentence parser for marine instrument data.
 
-Uses pynmea2 for parsing and checksum validation of standard NMEA sentences.
-AIS sentences are validated manually and stored raw for pyais decoding.
-Parsed data is normalized into NMEAData domain objects for the bridge.
+The supported talker sentences are split and converted directly (the
+fast path), giving the same NMEAData as the pynmea2 based parsers at a
+fraction of the cost. Anything the fast path does not recognise - other
+sentence types, proprietary or query sentences, unusual framing - goes
+through pynmea2 for parsing and checksum validation. AIS sentences are
+validated manually and stored raw for pyais decoding. Parsed data is
+normalized into NMEAData domain objects for the bridge.
 """
 
 import logging
+import re
+from array import array
 from dataclasses import dataclass, field
-from typing import Any, Optional
+from decimal import Decimal
+from typing import Any, Callable, NamedTuple, Optional
 
 import pynmea2
 
+from .framing import expected_checksum, xor_checksum
+
 logger = logging.getLogger(__name__)
 
 
@@ -65,6 +74,8 @@ def validate_checksum(sentence: str) -> bool:
 
     Used for AIS sentences (starting with !) which pynmea2 doesn't handle.
     For standard $ sentences, pynmea2.parse() validates checksums internally.
+    Checks one sentence; framing.batch_valid_checksums() checks a whole
+    received buffer at once.
     """
     try:
         if "*" not in sentence:
@@ -80,11 +91,7 @@ def validate_checksum(sentence: str) -> bool:
         body = sentence[start + 1 : sentence.index("*")]
         expected = sentence[sentence.index("*") + 1 :].strip()
 
-        calculated = 0
-        for char in body:
-            calculated ^= ord(char)
-
-        return f"{calculated:02X}" == expected.upper()
+        return f"{xor_checksum(body.encode('latin-1')):02X}" == expected.upper()
     except (ValueError, IndexError):
         return False
 
@@ -115,12 +122,100 @@ def _safe_int(value: Any) -> Optional[int]:
         return None
 
 
+def _signed_variation(variation: Optional[float], direction: str) -> Optional[float]:
+    """Magnetic variation, negative when west."""
+    if variation is not None and direction == "W":
+        return -variation
+    return variation
+
+
+def _water_temperature_c(temp: Optional[float], units: str) -> Optional[float]:
+    """MTW temperature in Celsius, None for unknown units."""
+    if temp is None:
+        return None
+    units = units or "C"
+    if units == "C":
+        # Navnet reports Fahrenheit mislabeled as Celsius (e.g. 076.25,C)
+        if temp > 50:
+            return round((temp - 32) * 5 / 9, 1)
+        return temp
+    if units == "F":
+        return round((temp - 32) * 5 / 9, 1)
+    return None
+
+
+# Returned by split_fields() for sentences left to pynmea2
+UNHANDLED = object()
+
+
+class FastSentence(NamedTuple):
+    """Fast-path handling of one supported sentence type."""
+
+    # Sentence fields -> NMEAData
+    build: Callable[[list], NMEAData]
+    # Sentence fields, state values and one slot per entry of `fields`
+    # -> bitmask of the slots written (see write_value())
+    write: Callable[[list, array, tuple], int]
+    # NMEAData fields the sentence carries
+    fields: tuple[str, ...]
+    # Number of sentence fields build() and write() read
+    count: int
+
+
 _PARSERS: dict = {}
+# Sentence type -> FastSentence
+FAST_SENTENCES: dict[str, FastSentence] = {}
+
+# "TTSSS" address -> FastSentence, or UNHANDLED; feeds use a handful
+_fast_addresses: dict[str, Any] = {}
+MAX_CACHED_ADDRESSES = 256
 
 
 def _init_parsers():
     """Initialize parsers dict. Called after parser functions are defined."""
     global _PARSERS
+    FAST_SENTENCES.update(
+        GGA=FastSentence(
+            _build_gga,
+            _write_gga,
+            (
+                "latitude",
+                "longitude",
+                "altitude",
+                "fix_quality",
+                "satellites_in_use",
+                "hdop",
+                "utc_time",
+            ),
+            9,
+        ),
+        VTG=FastSentence(
+            _build_vtg,
+            _write_vtg,
+            (
+                "course_over_ground_true",
+                "course_over_ground_magnetic",
+                "speed_over_ground_knots",
+                "speed_over_ground_kmh",
+            ),
+            7,
+        ),
+        HDT=FastSentence(_build_hdt, _write_hdt, ("heading_true",), 1),
+        HDG=FastSentence(
+            _build_hdg, _write_hdg, ("heading_magnetic", "magnetic_variation"), 5
+        ),
+        ZDA=FastSentence(_build_zda, _write_zda, ("utc_time", "utc_date"), 4),
+        RSA=FastSentence(_build_rsa, _write_rsa, ("rudder_angle",), 2),
+        GSV=FastSentence(_build_gsv, _write_gsv, ("satellites_in_view",), 3),
+        DPT=FastSentence(_build_dpt, _write_dpt, ("depth_meters", "depth_offset"), 2),
+        VHW=FastSentence(
+            _build_vhw,
+            _write_vhw,
+            ("heading_true", "heading_magnetic", "speed_through_water_knots"),
+            5,
+        ),
+        MTW=FastSentence(_build_mtw, _write_mtw, ("water_temperature_c",), 2),
+    )
     _PARSERS = {
         "GGA": _parse_gga,
         "VTG": _parse_vtg,
@@ -135,11 +230,17 @@ def _init_parsers():
     }
 
 
-def parse_sentence(raw: str) -> Optional[NMEAData]:
+def parse_sentence(raw: str, verified: bool = False) -> Optional[NMEAData]:
     """Parse a single NMEA 0183 sentence.
 
-    Uses pynmea2 for parsing and checksum validation of standard sentences.
-    AIS sentences (starting with !) are validated and stored for pyais decoding.
+    Supported talker sentences take the fast path; other standard sentences
+    are parsed and checksum validated by pynmea2. AIS sentences (starting
+    with !) are validated and stored for pyais decoding.
+
+    Args:
+        raw: Raw NMEA sentence.
+        verified: The checksum was already checked (the listeners' framers
+            drop sentences without a valid one), so it is not checked again.
 
     Supports:
         GGA - Position fix
@@ -160,13 +261,28 @@ def parse_sentence(raw: str) -> Optional[NMEAData]:
         return None
 
     # Handle AIS messages (start with !)
-    if raw.startswith("!"):
-        return _parse_ais(raw)
+    start = raw[0]
+    if start == "!":
+        return _parse_ais(raw, verified)
 
     # Standard NMEA sentences (start with $)
-    if not raw.startswith("$"):
+    if start != "$":
+        return None
+
+    fields = split_fields(raw, verified)
+    if fields is UNHANDLED:
+        return _parse_pynmea2(raw)
+    if fields is None:
         return None
+    try:
+        return FAST_SENTENCES[raw[3:6]].build(fields)
+    except Exception as e:
+        logger.debug("Parse error for %s: %s", raw[3:6], e)
+        return None
+
 
+def _parse_pynmea2(raw: str) -> Optional[NMEAData]:
+    """Parse a standard sentence with pynmea2 and the _PARSERS handlers."""
     try:
         msg = pynmea2.parse(raw, check=True)
     except pynmea2.ParseError:
@@ -253,11 +369,9 @@ def _parse_hdg(msg) -> Optional[NMEAData]:
     data = NMEAData()
     data.heading_magnetic = _safe_float(msg.heading)
 
-    variation = _safe_float(msg.variation)
-    if variation is not None:
-        if msg.var_dir == "W":
-            variation = -variation
-        data.magnetic_variation = variation
+    data.magnetic_variation = _signed_variation(
+        _safe_float(msg.variation), msg.var_dir
+    )
 
     return data
 
@@ -340,26 +454,329 @@ def _parse_mtw(msg) -> Optional[NMEAData]:
     $YXMTW,076.25,C
     """
     data = NMEAData()
-    temp = _safe_float(msg.temperature)
-    if temp is not None:
-        units = msg.units or "C"
-        if units == "C":
-            # Navnet reports Fahrenheit mislabeled as Celsius (e.g. 076.25,C)
-            if temp > 50:
-                temp = round((temp - 32) * 5 / 9, 1)
-            data.water_temperature_c = temp
-        elif units == "F":
-            data.water_temperature_c = round((temp - 32) * 5 / 9, 1)
+    data.water_temperature_c = _water_temperature_c(
+        _safe_float(msg.temperature), msg.units
+    )
 
     return data
 
 
-def _parse_ais(raw: str) -> Optional[NMEAData]:
+def split_fields(raw: str, verified: bool = False):
+    """Check a sentence is fit for the fast path and split its fields.
+
+    Only sentences shaped exactly "$TTSSS,<fields>*HH" with SSS one of the
+    supported types qualify, so that pynmea2 would parse them the same way.
+
+    Args:
+        raw: Stripped sentence starting with "$".
+        verified: Skip the checksum check, already done on the raw bytes.
+
+    Returns:
+        The fields after the address, padded to the count of fields the
+        type's FAST_SENTENCES entry reads; None for a bad checksum; or
+        UNHANDLED if the sentence must go through pynmea2.
+    """
+    n = len(raw)
+    end = n - 3
+    if n < 10 or raw[6] != "," or raw.find("*") != end:
+        return UNHANDLED
+    address = raw[1:6]
+    entry = _fast_addresses.get(address) or _fast_address(address)
+    if entry is UNHANDLED:
+        return UNHANDLED
+    if not verified:
+        try:
+            data = raw.encode("latin-1")
+        except UnicodeEncodeError:
+            return UNHANDLED
+        expected = expected_checksum(data)
+        if expected is None:
+            return UNHANDLED
+        if xor_checksum(data[1:end]) != expected:
+            logger.debug("Parse/checksum failed: %s", raw)
+            return None
+
+    fields = raw[7:end].split(",")
+    count = entry.count
+    if len(fields) < count:
+        fields.extend([""] * (count - len(fields)))
+    return fields
+
+
+def _fast_address(address: str):
+    """Look up (and cache) the FAST_SENTENCES entry for a "TTSSS" address.
+
+    Returns:
+        The entry, or UNHANDLED if the address is left to pynmea2.
+    """
+    entry = FAST_SENTENCES.get(address[2:])
+    # pynmea2 reads "$P..." as proprietary whatever follows
+    if entry is None or address[0] in "Pp" or not address[:2].isalnum():
+        entry = UNHANDLED
+    if len(_fast_addresses) < MAX_CACHED_ADDRESSES:
+        _fast_addresses[address] = entry
+    return entry
+
+
+def write_value(values: array, field_id: int, value: Optional[float]) -> int:
+    """Store a parsed value in a state array.
+
+    Args:
+        values: State values indexed by field ID.
+        field_id: Slot to write, or -1 if the state does not keep the field.
+        value: Parsed value; None or NaN means no value.
+
+    Returns:
+        The slot's bit, or 0 if nothing was written.
+    """
+    if value is None or value != value or field_id < 0:
+        return 0
+    values[field_id] = value
+    return 1 << field_id
+
+
+# Conversions matching a pynmea2 field's type followed by _safe_float()
+# or _safe_int(): pynmea2 falls back to the raw string when its type
+# conversion fails, which _safe_* then converts (or rejects) itself.
+
+
+def _float_field(value: str) -> Optional[float]:
+    """A float-typed pynmea2 field through _safe_float()."""
+    if not value:
+        return None
+    try:
+        return float(value)
+    except ValueError:
+        return None
+
+
+def _decimal_field(value: str) -> Optional[float]:
+    """A Decimal-typed pynmea2 field through _safe_float()."""
+    if not value:
+        return None
+    try:
+        return float(value)
+    except ValueError:
+        # Decimal accepts a few spellings float() does not (e.g. "NaN1")
+        try:
+            return float(Decimal(value))
+        except Exception:
+            return None
+
+
+def _int_field(value: str) -> Any:
+    """An int-typed pynmea2 field as read from the sentence object."""
+    if not value:
+        return None
+    try:
+        return int(value)
+    except ValueError:
+        return value
+
+
+_DM_RE = re.compile(r"^(\d+)(\d\d\.\d+)$")
+
+
+def _signed_degrees(dm: str, direction: str, positive: str, negative: str) -> float:
+    """Degrees/minutes and direction to signed degrees, as pynmea2's LatLonFix.
+
+    Raises:
+        ValueError: If dm is not in dddmm.mmm form.
+    """
+    if not dm or dm == "0":
+        degrees = 0.0
+    else:
+        dot = dm.find(".")
+        if dot >= 3 and dm[:dot].isdecimal() and dm[dot + 1 :].isdecimal():
+            d, m = dm[: dot - 2], dm[dot - 2 :]
+        else:
+            match = _DM_RE.match(dm)
+            if not match:
+                raise ValueError(
+                    f"Geographic coordinate value '{dm}' is not valid DDDMM.MMM"
+                )
+            d, m = match.groups()
+        degrees = float(d) + float(m) / 60
+    if direction == positive:
+        return +degrees
+    if direction == negative:
+        return -degrees
+    return 0.0
+
+
+# Fast-path builders and writers: the same values as the _parse_* function
+# of the same type, from the sentence's fields (padded to the count they
+# read). _build_* returns them as NMEAData; _write_* stores the numeric ones
+# with write_value(), given one slot per field listed in FAST_SENTENCES.
+
+
+def _build_gga(f: list) -> NMEAData:
+    latitude = longitude = None
+    if f[1] and f[2]:
+        try:
+            latitude = round(_signed_degrees(f[1], f[2], "N", "S"), 6)
+            longitude = round(_signed_degrees(f[3], f[4], "E", "W"), 6)
+        except ValueError:
+            pass
+    return NMEAData(
+        sentence_type="GGA",
+        utc_time=f[0] or None,
+        latitude=latitude,
+        longitude=longitude,
+        fix_quality=_safe_int(f[5]),
+        satellites_in_use=_safe_int(f[6]),
+        hdop=_safe_float(f[7]),
+        altitude=_float_field(f[8]),
+    )
+
+
+def _write_gga(f: list, values: array, slots: tuple) -> int:
+    mask = (
+        write_value(values, slots[2], _float_field(f[8]))
+        | write_value(values, slots[3], _safe_int(f[5]))
+        | write_value(values, slots[4], _safe_int(f[6]))
+        | write_value(values, slots[5], _safe_float(f[7]))
+    )
+    if f[1] and f[2]:
+        try:
+            latitude = round(_signed_degrees(f[1], f[2], "N", "S"), 6)
+            mask |= write_value(values, slots[0], latitude)
+            longitude = round(_signed_degrees(f[3], f[4], "E", "W"), 6)
+            mask |= write_value(values, slots[1], longitude)
+        except ValueError:
+            pass
+    return mask
+
+
+def _build_vtg(f: list) -> NMEAData:
+    return NMEAData(
+        sentence_type="VTG",
+        course_over_ground_true=_float_field(f[0]),
+        course_over_ground_magnetic=_decimal_field(f[2]),
+        speed_over_ground_knots=_decimal_field(f[4]),
+        speed_over_ground_kmh=_float_field(f[6]),
+    )
+
+
+def _write_vtg(f: list, values: array, slots: tuple) -> int:
+    return (
+        write_value(values, slots[0], _float_field(f[0]))
+        | write_value(values, slots[1], _decimal_field(f[2]))
+        | write_value(values, slots[2], _decimal_field(f[4]))
+        | write_value(values, slots[3], _float_field(f[6]))
+    )
+
+
+def _build_hdt(f: list) -> NMEAData:
+    return NMEAData(sentence_type="HDT", heading_true=_decimal_field(f[0]))
+
+
+def _write_hdt(f: list, values: array, slots: tuple) -> int:
+    return write_value(values, slots[0], _decimal_field(f[0]))
+
+
+def _build_hdg(f: list) -> NMEAData:
+    return NMEAData(
+        sentence_type="HDG",
+        heading_magnetic=_decimal_field(f[0]),
+        magnetic_variation=_signed_variation(_decimal_field(f[3]), f[4]),
+    )
+
+
+def _write_hdg(f: list, values: array, slots: tuple) -> int:
+    return write_value(values, slots[0], _decimal_field(f[0])) | write_value(
+        values, slots[1], _signed_variation(_decimal_field(f[3]), f[4])
+    )
+
+
+def _zda_date(f: list) -> Optional[str]:
+    """ZDA date as YYYY-MM-DD, or None unless day, month and year are set."""
+    day = _int_field(f[1])
+    month = _int_field(f[2])
+    year = _int_field(f[3])
+    if day is None or month is None or year is None:
+        return None
+    return f"{year}-{str(month).zfill(2)}-{str(day).zfill(2)}"
+
+
+def _build_zda(f: list) -> NMEAData:
+    return NMEAData(sentence_type="ZDA", utc_time=f[0] or None, utc_date=_zda_date(f))
+
+
+def _write_zda(f: list, values: array, slots: tuple) -> int:
+    # Time and date are not numeric state
+    return 0
+
+
+def _build_rsa(f: list) -> NMEAData:
+    rudder_angle = _decimal_field(f[0]) if f[1] == "A" else None
+    return NMEAData(sentence_type="RSA", rudder_angle=rudder_angle)
+
+
+def _write_rsa(f: list, values: array, slots: tuple) -> int:
+    if f[1] != "A":
+        return 0
+    return write_value(values, slots[0], _decimal_field(f[0]))
+
+
+def _build_gsv(f: list) -> NMEAData:
+    return NMEAData(sentence_type="GSV", satellites_in_view=_safe_int(f[2]))
+
+
+def _write_gsv(f: list, values: array, slots: tuple) -> int:
+    return write_value(values, slots[0], _safe_int(f[2]))
+
+
+def _build_dpt(f: list) -> NMEAData:
+    return NMEAData(
+        sentence_type="DPT",
+        depth_meters=_decimal_field(f[0]),
+        depth_offset=_decimal_field(f[1]),
+    )
+
+
+def _write_dpt(f: list, values: array, slots: tuple) -> int:
+    return write_value(values, slots[0], _decimal_field(f[0])) | write_value(
+        values, slots[1], _decimal_field(f[1])
+    )
+
+
+def _build_vhw(f: list) -> NMEAData:
+    return NMEAData(
+        sentence_type="VHW",
+        heading_true=_decimal_field(f[0]),
+        heading_magnetic=_decimal_field(f[2]),
+        speed_through_water_knots=_decimal_field(f[4]),
+    )
+
+
+def _write_vhw(f: list, values: array, slots: tuple) -> int:
+    return (
+        write_value(values, slots[0], _decimal_field(f[0]))
+        | write_value(values, slots[1], _decimal_field(f[2]))
+        | write_value(values, slots[2], _decimal_field(f[4]))
+    )
+
+
+def _build_mtw(f: list) -> NMEAData:
+    return NMEAData(
+        sentence_type="MTW",
+        water_temperature_c=_water_temperature_c(_decimal_field(f[0]), f[1]),
+    )
+
+
+def _write_mtw(f: list, values: array, slots: tuple) -> int:
+    return write_value(
+        values, slots[0], _water_temperature_c(_decimal_field(f[0]), f[1])
+    )
+
+
+def _parse_ais(raw: str, verified: bool = False) -> Optional[NMEAData]:
     """Parse AIS messages - store raw for forwarding.
 
     !AIVDM,1,1,,A,404k0a1v`UGD0bKV4qnE0uG00H1;,0*3C
     """
-    if not validate_checksum(raw):
+    if not verified and not validate_checksum(raw):
         return None
 
     data = NMEAData()
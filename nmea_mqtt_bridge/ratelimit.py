@@ -0,0 +1,178 @@
+"""Per-source sentence rate guards against talker storms.
+
+A misconfigured instrument or a rebroadcast loop can flood a port with
+far more sentences than any consumer needs. A token bucket per source,
+and optionally per sentence type, caps what gets through to parsing so
+one runaway feed cannot starve the others.
+"""
+
+import logging
+from typing import Optional
+
+from .filters import MAX_CACHED_ADDRESSES, address_matches, sentence_address
+
+logger = logging.getLogger(__name__)
+
+# Minimum seconds between rate limit warnings for one source
+DEFAULT_WARN_INTERVAL = 60.0
+
+# Label used for drops by the source-wide bucket
+SOURCE_LIMIT = "source"
+
+
+class TokenBucket:
+    """Classic token bucket: ``rate`` tokens per second, up to ``burst``."""
+
+    __slots__ = ("rate", "burst", "tokens", "updated")
+
+    def __init__(self, rate: float, burst: Optional[float] = None):
+        """Initialize token bucket.
+
+        Args:
+            rate: Sustained sentences per second.
+            burst: Bucket size (defaults to one second's worth, at least 1).
+        """
+        self.rate = float(rate)
+        self.burst = float(burst) if burst is not None else max(self.rate, 1.0)
+        self.tokens = self.burst
+        self.updated: Optional[float] = None
+
+    def take(self, now: float) -> bool:
+        """Take one token if available.
+
+        Args:
+            now: Current time in seconds.
+
+        Returns:
+            True if the sentence may pass.
+        """
+        tokens = self.tokens
+        updated = self.updated
+        if updated is None:
+            self.updated = now
+        elif now > updated:
+            # Clock steps backwards are ignored rather than refilling
+            tokens = min(self.burst, tokens + (now - updated) * self.rate)
+            self.updated = now
+
+        if tokens >= 1.0:
+            self.tokens = tokens - 1.0
+            return True
+        self.tokens = tokens
+        return False
+
+
+class RateGuard:
+    """Token bucket rate limits for one source.
+
+    Per-type entries use the sentence type filter matching rules (3
+    characters match the formatter for any talker, anything else is an
+    address prefix); all addresses matching an entry share its bucket.
+    A sentence must pass its type bucket and then the source bucket.
+    """
+
+    def __init__(
+        self,
+        source_name: str,
+        rate: Optional[float] = None,
+        burst: Optional[float] = None,
+        sentence_types: Optional[dict[str, float]] = None,
+        warn_interval: float = DEFAULT_WARN_INTERVAL,
+    ):
+        """Initialize rate guard.
+
+        Args:
+            source_name: Source name used in log messages.
+            rate: Sustained sentences per second for the whole source.
+            burst: Source bucket size (defaults to one second's worth).
+            sentence_types: Sentence type entry -> sentences per second.
+            warn_interval: Minimum seconds between warnings.
+        """
+        self.source_name = source_name
+        self.warn_interval = warn_interval
+        self._bucket = TokenBucket(rate, burst) if rate else None
+        self._type_buckets = [
+            (entry.strip().upper(), TokenBucket(type_rate))
+            for entry, type_rate in (sentence_types or {}).items()
+        ]
+        # Address -> (entry, bucket), or None if no entry matches
+        self._by_address: dict[bytes, Optional[tuple[str, TokenBucket]]] = {}
+        self.dropped = 0
+        # Limit label (sentence type entry or "source") -> dropped count
+        self.drops: dict[str, int] = {}
+        self._last_warning: Optional[float] = None
+
+    @classmethod
+    def from_source(cls, source: dict) -> "RateGuard":
+        """Build a rate guard from a source's ``rate_limit`` settings.
+
+        Args:
+            source: Source config dict.
+        """
+        limits = source.get("rate_limit") or {}
+        return cls(
+            source["name"],
+            rate=limits.get("rate"),
+            burst=limits.get("burst"),
+            sentence_types=limits.get("sentence_types"),
+        )
+
+    @property
+    def active(self) -> bool:
+        """Whether any limit is configured."""
+        return self._bucket is not None or bool(self._type_buckets)
+
+    def allows(self, sentence, now: float) -> bool:
+        """Check a framed sentence against the limits, consuming tokens.
+
+        Args:
+            sentence: Framed sentence bytes or memoryview slice.
+            now: Current time in seconds.
+
+        Returns:
+            True if the sentence may pass.
+        """
+        if self._type_buckets:
+            match = self._match(sentence)
+            if match is not None and not match[1].take(now):
+                self._drop(match[0], now)
+                return False
+
+        if self._bucket is not None and not self._bucket.take(now):
+            self._drop(SOURCE_LIMIT, now)
+            return False
+        return True
+
+    def _match(self, sentence) -> Optional[tuple[str, TokenBucket]]:
+        address = sentence_address(sentence)
+        try:
+            return self._by_address[address]
+        except KeyError:
+            pass
+
+        name = address.decode("ascii", errors="replace").upper()
+        match = next(
+            (
+                (entry, bucket)
+                for entry, bucket in self._type_buckets
+                if address_matches(name, entry)
+            ),
+            None,
+        )
+        if len(self._by_address) >= MAX_CACHED_ADDRESSES:
+            self._by_address.clear()
+        self._by_address[address] = match
+        return match
+
+    def _drop(self, label: str, now: float):
+        self.dropped += 1
+        self.drops[label] = self.drops.get(label, 0) + 1
+        if self._last_warning is None or now - self._last_warning >= self.warn_interval:
+            self._last_warning = now
+            logger.warning(
+                "[%s] Sentence rate limit exceeded (%s), dropping excess; "
+                "%d dropped so far",
+                self.source_name,
+                label,
+                self.dropped,
+            )
@@ -0,0 +1,169 @@
+"""Per-source and per-sentence-type rate meters.
+
+Each received sentence only bumps two counters; the counts are folded
+into exponentially weighted moving averages (in Hz) on a slow tick, so
+metering costs the same per sentence regardless of how many sources and
+sentence types there are. A meter that stops receiving decays towards
+zero, which is what makes a dying feed visible.
+"""
+
+import math
+from typing import Optional
+
+# Rate meter kinds, also used in MQTT topics and entity IDs
+SOURCE = "source"
+SENTENCE_TYPE = "sentence_type"
+
+# Seconds for a rate change to be ~63% reflected in the average
+DEFAULT_TIME_CONSTANT = 30.0
+
+# Seconds between rate updates (and MQTT publishes)
+DEFAULT_PUBLISH_INTERVAL = 30.0
+
+# Bound on sentence type meters, each of which becomes an HA entity; types
+# seen once the bound is reached are counted together under OTHER
+DEFAULT_MAX_SENTENCE_TYPES = 32
+OTHER = "other"
+
+
+def sentence_formatter(sentence: str) -> str:
+    """Get the sentence type used for rate metering.
+
+    The formatter for standard sentences ("GGA", "VDM"), or the whole
+    address for proprietary ones ("PFEC").
+
+    Args:
+        sentence: Raw NMEA sentence.
+    """
+    if sentence.startswith("$P"):
+        end = sentence.find(",")
+        return sentence[1:end] if end != -1 else sentence[1:]
+    return sentence[3:6]
+
+
+class RateMeter:
+    """EWMA event rate, fed with the count of events between ticks."""
+
+    __slots__ = ("count", "rate", "primed")
+
+    def __init__(self):
+        self.count = 0
+        self.rate = 0.0
+        # Whether the rate has been set by a first measured interval
+        self.primed = False
+
+    def update(self, elapsed: float, alpha: float) -> float:
+        """Fold the events counted over ``elapsed`` seconds into the rate.
+
+        The first interval sets the rate directly rather than ramping up
+        from zero.
+
+        Args:
+            elapsed: Seconds since the previous update.
+            alpha: Weight of this interval's rate.
+
+        Returns:
+            The updated rate in Hz.
+        """
+        instant = self.count / elapsed
+        self.count = 0
+        if self.primed:
+            self.rate += alpha * (instant - self.rate)
+        else:
+            self.rate = instant
+            self.primed = True
+        return self.rate
+
+
+class RateMeters:
+    """Rate meters keyed by (kind, name) for sources and sentence types."""
+
+    def __init__(
+        self,
+        time_constant: float = DEFAULT_TIME_CONSTANT,
+        max_sentence_types: int = DEFAULT_MAX_SENTENCE_TYPES,
+    ):
+        """Initialize rate meters.
+
+        Args:
+            time_constant: EWMA time constant in seconds.
+            max_sentence_types: Most sentence types metered separately.
+        """
+        self.time_constant = time_constant
+        self.max_sentence_types = max_sentence_types
+        self.sources: dict[str, RateMeter] = {}
+        self.sentence_types: dict[str, RateMeter] = {}
+        self._last_tick: Optional[float] = None
+
+    def register(self, kind: str, name: str):
+        """Create a meter ahead of its first event, so silence shows as 0 Hz."""
+        if kind == SOURCE:
+            if name not in self.sources:
+                self.sources[name] = RateMeter()
+        else:
+            self._sentence_type_meter(name)
+
+    def _sentence_type_meter(self, sentence_type: str) -> RateMeter:
+        """Get (or create) a sentence type's meter, OTHER once at the bound."""
+        meters = self.sentence_types
+        meter = meters.get(sentence_type)
+        if meter is None:
+            if len(meters) >= self.max_sentence_types:
+                sentence_type = OTHER
+                meter = meters.get(OTHER)
+            if meter is None:
+                meter = meters[sentence_type] = RateMeter()
+        return meter
+
+    def mark(self, source: str, sentence_type: str, count: int = 1):
+        """Count sentences for a source and sentence type.
+
+        Args:
+            source: Source (or sub-source) name.
+            sentence_type: Sentence type, see sentence_formatter().
+            count: Number of sentences.
+        """
+        meter = self.sources.get(source)
+        if meter is None:
+            meter = self.sources[source] = RateMeter()
+        meter.count += count
+        meter = self.sentence_types.get(sentence_type)
+        if meter is None:
+            meter = self._sentence_type_meter(sentence_type)
+        meter.count += count
+
+    def add(self, kind: str, name: str, count: int):
+        """Add events counted elsewhere (e.g. in a worker process)."""
+        if kind == SOURCE:
+            self.register(kind, name)
+            self.sources[name].count += count
+        else:
+            self._sentence_type_meter(name).count += count
+
+    def tick(self, now: float) -> dict[tuple[str, str], float]:
+        """Update every meter with the events counted since the last tick.
+
+        The first tick only starts the measurement interval.
+
+        Args:
+            now: Monotonic time in seconds.
+
+        Returns:
+            Dict of (kind, name) -> rate in Hz.
+        """
+        elapsed = now - self._last_tick if self._last_tick is not None else 0.0
+        self._last_tick = now
+        alpha = 1.0 - math.exp(-elapsed / self.time_constant)
+
+        rates: dict[tuple[str, str], float] = {}
+        for kind, meters in (
+            (SOURCE, self.sources),
+            (SENTENCE_TYPE, self.sentence_types),
+        ):
+            for name, meter in meters.items():
+                if elapsed > 0:
+                    meter.update(elapsed, alpha)
+                else:
+                    meter.count = 0
+                rates[(kind, name)] = meter.rate
+        return rates
@@ -0,0 +1,407 @@
+"""Replay captured NMEA traffic through the bridge pipeline.
+
+Reads classic pcap, pcapng or plain NMEA log files and feeds the UDP
+payloads through the same NMEAProtocol framing and filters as live
+sockets. Packets are replayed either at their captured timing (optionally
+scaled) or as fast as possible, and throughput is reported at the end.
+
+Run standalone for offline throughput and regression testing:
+
+    python -m nmea_mqtt_bridge.replay capture.pcap [--config config.yaml] [--speed 2 | --fast]
+"""
+
+import argparse
+import asyncio
+import logging
+import struct
+import sys
+import time
+from pathlib import Path
+from typing import Iterator, NamedTuple, Optional
+
+from .sources import CallbackListener
+from .udp_listener import NMEAProtocol, ReceivedSentence
+
+logger = logging.getLogger(__name__)
+
+# Packets fed between event loop yields when replaying as fast as possible
+FAST_YIELD_EVERY = 256
+
+_PCAP_MAGIC_US = 0xA1B2C3D4
+_PCAP_MAGIC_NS = 0xA1B23C4D
+_PCAPNG_SHB = 0x0A0D0D0A
+_PCAPNG_BYTE_ORDER = 0x1A2B3C4D
+
+# Link-layer types we can strip down to IPv4
+_LINKTYPE_NULL = 0
+_LINKTYPE_ETHERNET = 1
+_LINKTYPE_RAW = (12, 101, 228)
+_LINKTYPE_LINUX_SLL = 113
+_LINKTYPE_LINUX_SLL2 = 276
+
+_ETHERTYPE_IPV4 = 0x0800
+_ETHERTYPE_VLAN = (0x8100, 0x88A8)
+_IPPROTO_UDP = 17
+
+
+class CapturedPacket(NamedTuple):
+    """A UDP payload recovered from a capture file."""
+
+    timestamp: Optional[float]
+    sender: str
+    port: Optional[int]
+    payload: bytes
+
+
+def _ipv4_from_link(linktype: int, frame: bytes) -> Optional[bytes]:
+    """Strip the link-layer header, returning the IPv4 packet if any."""
+    if linktype == _LINKTYPE_ETHERNET:
+        offset = 12
+        ethertype = int.from_bytes(frame[offset : offset + 2], "big")
+        while ethertype in _ETHERTYPE_VLAN:
+            offset += 4
+            ethertype = int.from_bytes(frame[offset : offset + 2], "big")
+        return frame[offset + 2 :] if ethertype == _ETHERTYPE_IPV4 else None
+    if linktype == _LINKTYPE_LINUX_SLL:
+        proto = int.from_bytes(frame[14:16], "big")
+        return frame[16:] if proto == _ETHERTYPE_IPV4 else None
+    if linktype == _LINKTYPE_LINUX_SLL2:
+        proto = int.from_bytes(frame[0:2], "big")
+        return frame[20:] if proto == _ETHERTYPE_IPV4 else None
+    if linktype in _LINKTYPE_RAW:
+        return frame if frame[:1] and frame[0] >> 4 == 4 else None
+    if linktype == _LINKTYPE_NULL:
+        # Address family in host byte order; 2 is AF_INET everywhere
+        family = frame[:4]
+        return frame[4:] if family in (b"\x02\x00\x00\x00", b"\x00\x00\x00\x02") else None
+    return None
+
+
+def _udp_from_ipv4(packet: bytes) -> Optional[tuple[str, int, bytes]]:
+    """Extract (sender IP, destination port, payload) from an IPv4/UDP packet."""
+    if len(packet) < 20 or packet[0] >> 4 != 4:
+        return None
+    ihl = (packet[0] & 0x0F) * 4
+    if packet[9] != _IPPROTO_UDP:
+        return None
+    if int.from_bytes(packet[6:8], "big") & 0x1FFF:
+        return None  # non-first fragment, no UDP header
+    total = int.from_bytes(packet[2:4], "big") or len(packet)
+    udp = packet[ihl:total]
+    if len(udp) < 8:
+        return None
+    sender = ".".join(str(b) for b in packet[12:16])
+    port = int.from_bytes(udp[2:4], "big")
+    length = int.from_bytes(udp[4:6], "big")
+    return sender, port, udp[8:length] if length >= 8 else udp[8:]
+
+
+def _read_pcap(f, header: bytes) -> Iterator[CapturedPacket]:
+    """Iterate a classic pcap file (header already read)."""
+    magic = struct.unpack("<I", header[:4])[0]
+    if magic in (_PCAP_MAGIC_US, _PCAP_MAGIC_NS):
+        endian = "<"
+    else:
+        endian = ">"
+        magic = struct.unpack(">I", header[:4])[0]
+    scale = 1e-9 if magic == _PCAP_MAGIC_NS else 1e-6
+    linktype = struct.unpack(endian + "I", header[20:24])[0] & 0x0FFFFFFF
+    record = struct.Struct(endian + "IIII")
+
+    while True:
+        head = f.read(record.size)
+        if len(head) < record.size:
+            return
+        sec, frac, incl_len, _ = record.unpack(head)
+        frame = f.read(incl_len)
+        if len(frame) < incl_len:
+            return
+        ip = _ipv4_from_link(linktype, frame)
+        udp = _udp_from_ipv4(ip) if ip is not None else None
+        if udp is not None:
+            yield CapturedPacket(sec + frac * scale, *udp)
+
+
+def _read_pcapng(f, first: bytes) -> Iterator[CapturedPacket]:
+    """Iterate a pcapng file (first 8 bytes already read)."""
+    endian = "<"
+    interfaces: list[tuple[int, float]] = []  # (linktype, timestamp unit)
+    pending = first
+
+    while True:
+        head = pending if pending else f.read(8)
+        pending = b""
+        if len(head) < 8:
+            return
+        block_type = struct.unpack(endian + "I", head[:4])[0]
+        if block_type == _PCAPNG_SHB:  # palindromic, so endian-independent
+            # New section: byte order is defined by its magic
+            body_start = f.read(4)
+            endian = "<" if struct.unpack("<I", body_start)[0] == _PCAPNG_BYTE_ORDER else ">"
+            length = struct.unpack(endian + "I", head[4:8])[0]
+            f.read(length - 12)
+            interfaces = []
+            continue
+
+        length = struct.unpack(endian + "I", head[4:8])[0]
+        body = f.read(length - 8)
+        if len(body) < length - 8:
+            return
+        body = body[:-4]  # trailing length copy
+
+        if block_type == 1:  # Interface Description Block
+            linktype = struct.unpack(endian + "H", body[:2])[0]
+            unit = 1e-6
+            opts = body[8:]
+            while len(opts) >= 4:
+                code, olen = struct.unpack(endian + "HH", opts[:4])
+                if code == 0:
+                    break
+                if code == 9 and olen >= 1:  # if_tsresol
+                    res = opts[4]
+                    unit = 2.0 ** -(res & 0x7F) if res & 0x80 else 10.0 ** -res
+                opts = opts[4 + ((olen + 3) & ~3) :]
+            interfaces.append((linktype, unit))
+        elif block_type == 6:  # Enhanced Packet Block
+            iface, ts_high, ts_low, cap_len, _ = struct.unpack(endian + "IIIII", body[:20])
+            if iface >= len(interfaces):
+                continue
+            linktype, unit = interfaces[iface]
+            ip = _ipv4_from_link(linktype, body[20 : 20 + cap_len])
+            udp = _udp_from_ipv4(ip) if ip is not None else None
+            if udp is not None:
+                yield CapturedPacket(((ts_high << 32) | ts_low) * unit, *udp)
+        elif block_type == 3 and interfaces:  # Simple Packet Block
+            linktype, _ = interfaces[0]
+            ip = _ipv4_from_link(linktype, body[4:])
+            udp = _udp_from_ipv4(ip) if ip is not None else None
+            if udp is not None:
+                yield CapturedPacket(None, *udp)
+
+
+def _read_log(f, first: bytes) -> Iterator[CapturedPacket]:
+    """Iterate a plain NMEA log, one sentence per line, without timing."""
+    for line in (first + f.read()).splitlines(keepends=True):
+        if line.strip():
+            yield CapturedPacket(None, "replay", None, line)
+
+
+def read_capture(path: str) -> Iterator[CapturedPacket]:
+    """Iterate the UDP payloads in a pcap, pcapng or plain NMEA log file.
+
+    Args:
+        path: Capture file path. The format is detected from its magic.
+
+    Raises:
+        OSError: If the file cannot be read.
+    """
+    with open(path, "rb") as f:
+        first = f.read(24)
+        magic_le = struct.unpack("<I", first[:4])[0] if len(first) >= 4 else 0
+        magic_be = struct.unpack(">I", first[:4])[0] if len(first) >= 4 else 0
+
+        if _PCAPNG_SHB in (magic_le, magic_be):
+            f.seek(8)
+            yield from _read_pcapng(f, first[:8])
+        elif {magic_le, magic_be} & {_PCAP_MAGIC_US, _PCAP_MAGIC_NS} and len(first) == 24:
+            yield from _read_pcap(f, first)
+        else:
+            yield from _read_log(f, first)
+
+
+class ReplayListener(CallbackListener):
+    """Manages replay sources that feed capture files into the bridge.
+
+    A replay source (``type: replay``) has a ``path`` and optional
+    ``speed``: 1.0 replays at the captured timing, 2.0 twice as fast and
+    0 as fast as possible. Packets are framed and filtered using the
+    configured UDP source whose port they were sent to, so sub-source
+    names and filters behave as they would live.
+    """
+
+    def __init__(self):
+        super().__init__()
+        self._tasks: list[asyncio.Task] = []
+        # Source name -> summary of the finished replay
+        self.results: dict[str, dict] = {}
+
+    async def start(self, sources: list[dict], port_sources: Optional[list[dict]] = None):
+        """Start replaying all configured replay sources.
+
+        Args:
+            sources: Replay source dicts with 'name' and 'path' keys.
+            port_sources: UDP source dicts used to frame packets by port.
+        """
+        if not self._callback and not self._batch_callback:
+            raise RuntimeError("No callback set. Call set_callback() first.")
+
+        for source in sources:
+            if not source.get("enabled", True):
+                logger.info("Skipping disabled source: %s", source["name"])
+                continue
+            self._tasks.append(
+                asyncio.create_task(self.replay(source, port_sources or []))
+            )
+            logger.info(
+                "Replaying %s [%s] at %s",
+                source["path"],
+                source["name"],
+                f"{source.get('speed', 1.0)}x" if source.get("speed", 1.0) else "full speed",
+            )
+
+    async def replay(self, source: dict, port_sources: list[dict]) -> dict:
+        """Replay one capture file to completion.
+
+        Args:
+            source: Replay source dict.
+            port_sources: UDP source dicts used to frame packets by port.
+
+        Returns:
+            Summary dict with packets, sentences, seconds and rate.
+        """
+        name = source["name"]
+        speed = float(source.get("speed", 1.0))
+        default = NMEAProtocol.from_source(source, self._callback)
+        by_port = {
+            s["port"]: NMEAProtocol.from_source(s, self._callback)
+            for s in port_sources
+            if "port" in s
+        }
+
+        packets = sentences = 0
+        first_ts: Optional[float] = None
+        start = time.perf_counter()
+
+        try:
+            for packet in read_capture(source["path"]):
+                if speed > 0 and packet.timestamp is not None:
+                    if first_ts is None:
+                        first_ts = packet.timestamp
+                    delay = (packet.timestamp - first_ts) / speed - (
+                        time.perf_counter() - start
+                    )
+                    if delay > 0:
+                        await asyncio.sleep(delay)
+                elif packets % FAST_YIELD_EVERY == 0:
+                    await asyncio.sleep(0)
+
+                protocol = by_port.get(packet.port, default)
+                found = protocol.extract(
+                    packet.payload, (packet.sender, packet.port), time.time()
+                )
+                packets += 1
+                sentences += self._deliver(found)
+        except OSError as e:
+            logger.error("Replay [%s] failed: %s", name, e)
+
+        elapsed = time.perf_counter() - start
+        result = {
+            "packets": packets,
+            "sentences": sentences,
+            "seconds": elapsed,
+            "rate": sentences / elapsed if elapsed > 0 else 0.0,
+        }
+        self.results[name] = result
+        logger.info(
+            "Replay [%s] finished: %d packets, %d sentences in %.2fs (%.0f sentences/s)",
+            name,
+            packets,
+            sentences,
+            elapsed,
+            result["rate"],
+        )
+        return result
+
+    @property
+    def active(self) -> bool:
+        """Whether any replay source was started."""
+        return bool(self._tasks)
+
+    async def wait(self):
+        """Wait for all replays to finish."""
+        if self._tasks:
+            await asyncio.gather(*self._tasks, return_exceptions=True)
+
+    async def stop(self):
+        """Cancel any replay still running."""
+        for task in self._tasks:
+            task.cancel()
+        await self.wait()
+        self._tasks.clear()
+
+
+async def _replay_through_bridge(config: dict, source: dict) -> dict:
+    """Replay a capture through an NMEABridge without connecting to MQTT.
+
+    Source threads and worker processes are turned off so every sentence
+    is processed in this loop and counted in the bridge stats.
+    """
+    from .bridge import NMEABridge
+    from .sources import sources_of_type
+
+    config = {
+        **config,
+        "runtime": {**config.get("runtime", {}), "source_threads": "off"},
+        "workers": {**config.get("workers", {}), "enabled": False},
+    }
+    bridge = NMEABridge(config)
+
+    def deliver(batch: list[ReceivedSentence]):
+        bridge.feed(batch)
+        # Work through queued sentences as they arrive so the timing
+        # covers the whole pipeline
+        bridge.flush()
+
+    replayer = ReplayListener()
+    replayer.set_batch_callback(deliver)
+
+    udp_sources = sources_of_type(config.get("udp", {}).get("sources", []), "udp")
+    result = await replayer.replay(source, udp_sources)
+    result["stats"] = bridge.stats
+    return result
+
+
+def main():
+    """Replay a capture file through the parsing pipeline and report throughput."""
+    parser = argparse.ArgumentParser(
+        description="Replay a pcap/pcapng/NMEA log through the bridge pipeline "
+        "(without MQTT) and report throughput."
+    )
+    parser.add_argument("path", help="pcap, pcapng or plain NMEA log file")
+    parser.add_argument("--config", help="bridge config for source filters/dedup")
+    parser.add_argument(
+        "--speed", type=float, default=1.0, help="timing scale (2 = twice as fast)"
+    )
+    parser.add_argument(
+        "--fast", action="store_true", help="replay as fast as possible"
+    )
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
+    config: dict = {}
+    if args.config:
+        import yaml
+
+        config = yaml.safe_load(Path(args.config).read_text()) or {}
+
+    source = {
+        "name": "replay",
+        "path": args.path,
+        "speed": 0 if args.fast else args.speed,
+    }
+    try:
+        result = asyncio.run(_replay_through_bridge(config, source))
+    except KeyboardInterrupt:
+        sys.exit(130)
+
+    stats = result["stats"]
+    print(
+        f"{result['packets']} packets, {result['sentences']} sentences in "
+        f"{result['seconds']:.2f}s = {result['rate']:,.0f} sentences/s "
+        f"(parsed={stats['sentences_parsed']} skipped={stats['sentences_skipped']} "
+        f"duplicates={stats['duplicates']})"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,47 @@
+"""Process setup shared by the bridge and its worker processes."""
+
+import asyncio
+import logging
+from typing import Callable, Optional
+
+logger = logging.getLogger(__name__)
+
+
+def setup_logging(config: dict):
+    """Configure logging from config."""
+    log_config = config.get("logging", {})
+    level = getattr(logging, log_config.get("level", "INFO").upper(), logging.INFO)
+    fmt = log_config.get("format", "%(asctime)s [%(levelname)s] %(name)s: %(message)s")
+
+    logging.basicConfig(level=level, format=fmt)
+
+    # Quiet down paho-mqtt unless debugging
+    if level > logging.DEBUG:
+        logging.getLogger("paho").setLevel(logging.WARNING)
+
+
+def select_event_loop(
+    choice: str = "auto",
+) -> tuple[str, Optional[Callable[[], asyncio.AbstractEventLoop]]]:
+    """Pick the event loop implementation to run the bridge on.
+
+    Args:
+        choice: "auto" (uvloop if installed), "asyncio" or "uvloop".
+
+    Returns:
+        Tuple of (loop name, loop factory). The factory is None for the
+        default asyncio loop.
+    """
+    if choice == "asyncio":
+        return "asyncio", None
+
+    try:
+        import uvloop
+    except ImportError:
+        if choice == "uvloop":
+            logger.warning(
+                "uvloop requested but not installed, falling back to asyncio"
+            )
+        return "asyncio", None
+
+    return "uvloop", uvloop.new_event_loop
@@ -0,0 +1,298 @@
+"""Serial and pseudo-terminal NMEA sources on the event loop.
+
+Older instruments and USB NMEA dongles deliver 4800 or 38400 baud serial
+streams. A ``type: serial`` source opens its tty (or pty) non-blocking in
+raw mode and registers it with ``loop.add_reader``, so low-rate talkers
+share the event loop with the network sources without a reader thread.
+Bytes go through the same NMEAProtocol framing and filters as UDP
+datagrams. A device that disappears (USB unplugged, pty closed) is
+reopened after a delay.
+"""
+
+import asyncio
+import logging
+import os
+import time
+from typing import Callable, Optional
+
+try:
+    import termios
+except ImportError:  # Windows
+    termios = None
+
+from .ratelimit import RateGuard
+from .sources import CallbackListener, ReceivedSentence, new_connection_stats
+from .udp_listener import NMEAProtocol
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_BAUDRATE = 4800
+
+# Supported serial speeds (those the platform's termios knows)
+BAUDRATES = tuple(
+    rate
+    for rate in (1200, 2400, 4800, 9600, 19200, 38400, 57600, 115200, 230400)
+    if termios is not None and hasattr(termios, f"B{rate}")
+)
+
+# Delay before reopening a device that failed or went away (seconds)
+DEFAULT_REOPEN_DELAY = 5.0
+
+# Bytes per os.read(); well above a second of 38400 baud
+READ_SIZE = 4096
+
+# Reads per readiness event before yielding back to the loop
+MAX_READS = 16
+
+
+def open_serial(device: str, baudrate: int = DEFAULT_BAUDRATE) -> int:
+    """Open a tty non-blocking in raw 8N1 mode.
+
+    Args:
+        device: Device path, e.g. /dev/ttyUSB0 or a pty.
+        baudrate: Line speed, one of BAUDRATES.
+
+    Returns:
+        The file descriptor.
+
+    Raises:
+        OSError: If the device cannot be opened or configured.
+        ValueError: If the baud rate is not supported.
+    """
+    if termios is None:
+        raise OSError("serial sources are only supported on POSIX systems")
+    speed = getattr(termios, f"B{baudrate}", None)
+    if speed is None:
+        raise ValueError(f"unsupported baud rate {baudrate}")
+
+    fd = os.open(device, os.O_RDONLY | os.O_NOCTTY | os.O_NONBLOCK)
+    try:
+        if os.isatty(fd):
+            iflag, oflag, cflag, lflag, _, _, cc = termios.tcgetattr(fd)
+            # No input translation, flow control or line editing
+            iflag &= ~(
+                termios.IGNBRK
+                | termios.BRKINT
+                | termios.PARMRK
+                | termios.ISTRIP
+                | termios.INLCR
+                | termios.IGNCR
+                | termios.ICRNL
+                | termios.IXON
+                | termios.IXOFF
+            )
+            oflag &= ~termios.OPOST
+            lflag &= ~(
+                termios.ECHO
+                | termios.ECHONL
+                | termios.ICANON
+                | termios.ISIG
+                | termios.IEXTEN
+            )
+            cflag &= ~(termios.CSIZE | termios.PARENB | termios.CSTOPB)
+            cflag |= termios.CS8 | termios.CREAD | termios.CLOCAL
+            # VMIN=1 so an idle line reads as EAGAIN rather than b"" (EOF)
+            cc[termios.VMIN] = 1
+            cc[termios.VTIME] = 0
+            termios.tcsetattr(
+                fd,
+                termios.TCSANOW,
+                [iflag, oflag, cflag, lflag, speed, speed, cc],
+            )
+    except (OSError, termios.error) as e:
+        os.close(fd)
+        raise OSError(f"cannot configure {device}: {e}") from e
+    return fd
+
+
+class SerialPort:
+    """One open serial source, read on event loop readiness."""
+
+    def __init__(
+        self,
+        source: dict,
+        protocol: NMEAProtocol,
+        deliver: Callable[[list[ReceivedSentence]], int],
+        stats: dict,
+    ):
+        """Initialize serial port reader.
+
+        Args:
+            source: Source config dict.
+            protocol: Framer and filters for the stream.
+            deliver: Hands framed sentences on, returning how many.
+            stats: Counters to update (bytes, sentences, connected).
+        """
+        self.source = source
+        self.device = source["device"]
+        self.protocol = protocol
+        self.deliver = deliver
+        self.stats = stats
+        self.fd: Optional[int] = None
+        # Reported as the sender of every sentence
+        self._peer = (self.device, 0)
+        self._closed: Optional[asyncio.Future] = None
+
+    def open(self, loop: asyncio.AbstractEventLoop) -> asyncio.Future:
+        """Open the device and start reading.
+
+        Returns:
+            A future resolved when the device goes away.
+
+        Raises:
+            OSError: If the device cannot be opened.
+        """
+        self.fd = open_serial(
+            self.device, self.source.get("baudrate", DEFAULT_BAUDRATE)
+        )
+        self._closed = loop.create_future()
+        try:
+            loop.add_reader(self.fd, self.on_readable)
+        except Exception:
+            self.close(loop)
+            raise
+        self.stats["connected"] = True
+        return self._closed
+
+    def on_readable(self):
+        """Event loop reader callback - drain the device."""
+        stats = self.stats
+        extract = self.protocol.extract
+        for _ in range(MAX_READS):
+            try:
+                data = os.read(self.fd, READ_SIZE)
+            except (BlockingIOError, InterruptedError):
+                return
+            except OSError as e:
+                # EIO once a pty's other end or a USB adapter goes away
+                self._lost(e)
+                return
+            if not data:
+                self._lost(None)
+                return
+            stats["bytes"] += len(data)
+            stats["sentences"] += self.deliver(extract(data, self._peer, time.time()))
+            if len(data) < READ_SIZE:
+                return
+
+    def _lost(self, exc: Optional[Exception]):
+        if self._closed is not None and not self._closed.done():
+            self._closed.set_result(exc)
+
+    def close(self, loop: asyncio.AbstractEventLoop):
+        """Stop reading and close the device."""
+        if self.fd is None:
+            return
+        loop.remove_reader(self.fd)
+        os.close(self.fd)
+        self.fd = None
+        self.stats["connected"] = False
+        self._lost(None)
+
+
+class SerialListener(CallbackListener):
+    """Manages serial and pty NMEA sources."""
+
+    def __init__(self):
+        super().__init__()
+        self._tasks: list[asyncio.Task] = []
+        self.ports: dict[str, SerialPort] = {}
+        # Source name -> counters
+        self.port_stats: dict[str, dict] = {}
+        self.rate_guards: dict[str, RateGuard] = {}
+
+    async def start(self, sources: list[dict]):
+        """Start all configured serial sources.
+
+        Devices that cannot be opened yet are retried in the background.
+
+        Args:
+            sources: Source dicts with 'name' and 'device' keys, plus
+                optional 'baudrate' and 'reopen_delay'.
+        """
+        if not self._callback and not self._batch_callback:
+            raise RuntimeError("No callback set. Call set_callback() first.")
+
+        for source in sources:
+            name = source["name"]
+            if not source.get("enabled", True):
+                logger.info("Skipping disabled source: %s", name)
+                continue
+            self.rate_guards[name] = RateGuard.from_source(source)
+            self._tasks.append(asyncio.create_task(self._run_port(source)))
+            logger.info(
+                "Serial source [%s] on %s at %d baud - %s",
+                name,
+                source["device"],
+                source.get("baudrate", DEFAULT_BAUDRATE),
+                source.get("description", ""),
+            )
+
+    async def _run_port(self, source: dict):
+        """Keep a serial source open, reopening it after failures."""
+        name = source["name"]
+        delay = source.get("reopen_delay", DEFAULT_REOPEN_DELAY)
+        loop = asyncio.get_running_loop()
+        stats = self.port_stats.setdefault(name, new_connection_stats())
+
+        while True:
+            # Fresh framer per open, so a partial line is not carried over
+            protocol = NMEAProtocol.from_source(
+                source, self._callback, self.rate_guards.get(name)
+            )
+            port = SerialPort(source, protocol, self._deliver, stats)
+            try:
+                closed = port.open(loop)
+            except (OSError, ValueError) as e:
+                logger.warning(
+                    "Serial source [%s] could not open %s: %s (retry in %.0fs)",
+                    name,
+                    source["device"],
+                    e,
+                    delay,
+                )
+                await asyncio.sleep(delay)
+                continue
+
+            self.ports[name] = port
+            self._track(protocol)
+            logger.info("Serial source [%s] opened %s", name, source["device"])
+            try:
+                exc = await closed
+            finally:
+                port.close(loop)
+                self.ports.pop(name, None)
+                self._untrack(protocol)
+            logger.warning(
+                "Serial source [%s] lost %s%s (retry in %.0fs)",
+                name,
+                source["device"],
+                f": {exc}" if exc else "",
+                delay,
+            )
+            await asyncio.sleep(delay)
+
+    @property
+    def active(self) -> bool:
+        """Whether any serial source is running."""
+        return bool(self._tasks)
+
+    @property
+    def sentences_rate_limited(self) -> int:
+        """Total sentences dropped by per-source rate guards."""
+        return sum(guard.dropped for guard in self.rate_guards.values())
+
+    async def stop(self):
+        """Stop all serial sources and close their devices."""
+        was_active = self.active
+        for task in self._tasks:
+            task.cancel()
+        for task in self._tasks:
+            try:
+                await task
+            except (asyncio.CancelledError, Exception):
+                pass
+        self._tasks.clear()
+        self.ports.clear()
+        if was_active:
+            logger.info("All serial sources stopped")
@@ -0,0 +1,125 @@
+"""Source type helpers shared by the listeners."""
+
+from typing import Callable, NamedTuple, Optional
+
+# Supported values for a source's `type` key
+SOURCE_TYPES = ("udp", "tcp-client", "tcp-server", "serial", "replay", "capture")
+
+# Keys each source type needs besides 'name'
+REQUIRED_KEYS = {
+    "udp": ("port",),
+    "tcp-client": ("host", "port"),
+    "tcp-server": ("port",),
+    "serial": ("device",),
+    "replay": ("path",),
+    "capture": ("port", "directory"),
+}
+
+DEFAULT_SOURCE_TYPE = "udp"
+
+
+def source_type(source: dict) -> str:
+    """Get a source's type, defaulting to UDP."""
+    return source.get("type", DEFAULT_SOURCE_TYPE)
+
+
+def sources_of_type(sources: list[dict], *types: str) -> list[dict]:
+    """Filter source config dicts by type.
+
+    Args:
+        sources: Source config dicts.
+        *types: Source types to keep.
+    """
+    return [s for s in sources if source_type(s) in types]
+
+
+class ReceivedSentence(NamedTuple):
+    """A single NMEA sentence as handed to the bridge."""
+
+    source: str
+    sender: str
+    sentence: str
+    # Wall-clock arrival time (kernel timestamp where available)
+    received_at: Optional[float] = None
+    # Ingress interface and destination type (unicast, broadcast or
+    # multicast) from IP_PKTINFO, where available
+    interface: Optional[str] = None
+    destination: Optional[str] = None
+
+
+# Per-sentence callback, called with the fields of a ReceivedSentence
+SentenceCallback = Callable[
+    [str, str, str, Optional[float], Optional[str], Optional[str]], None
+]
+
+
+def new_connection_stats() -> dict:
+    """Create an empty per-connection statistics dict."""
+    return {"bytes": 0, "sentences": 0, "connected": False}
+
+
+class CallbackListener:
+    """Callback registration, delivery and drop counts shared by the stream
+    listeners."""
+
+    def __init__(self):
+        self._callback: Optional[SentenceCallback] = None
+        self._batch_callback: Optional[Callable[[list[ReceivedSentence]], None]] = None
+        # NMEAProtocols framing open connections or devices, and the drop
+        # counts of those already closed
+        self._protocols: set = set()
+        self._closed_drops = {"filtered": 0, "invalid": 0}
+
+    def set_callback(self, callback: SentenceCallback):
+        """Set the callback function for received NMEA sentences.
+
+        Args:
+            callback: Called with (source_name, sender, raw_sentence,
+                received_at, interface, destination) for each sentence.
+        """
+        self._callback = callback
+
+    def set_batch_callback(
+        self, callback: Callable[[list[ReceivedSentence]], None]
+    ):
+        """Set the callback used to deliver sentences as lists.
+
+        Args:
+            callback: Called with a list of ReceivedSentence tuples.
+        """
+        self._batch_callback = callback
+
+    def _deliver(self, sentences: list[ReceivedSentence]) -> int:
+        """Hand framed sentences to the bridge, returning how many."""
+        if sentences:
+            if self._batch_callback:
+                self._batch_callback(sentences)
+            else:
+                for item in sentences:
+                    self._callback(*item)
+        return len(sentences)
+
+    def _track(self, protocol):
+        """Count a connection's NMEAProtocol drops while it is open."""
+        self._protocols.add(protocol)
+
+    def _untrack(self, protocol):
+        """Keep a closed connection's drop counts after it is gone."""
+        if protocol in self._protocols:
+            self._protocols.discard(protocol)
+            self._closed_drops["filtered"] += protocol.sentences_filtered
+            self._closed_drops["invalid"] += protocol.sentences_invalid
+
+    @property
+    def sentences_filtered(self) -> int:
+        """Total sentences dropped by per-source sentence type filters."""
+        return self._closed_drops["filtered"] + sum(
+            p.sentences_filtered for p in self._protocols
+        )
+
+    @property
+    def sentences_invalid(self) -> int:
+        """Total sentences dropped for a missing or wrong checksum."""
+        return self._closed_drops["invalid"] + sum(
+            p.sentences_invalid for p in self._protocols
+        )
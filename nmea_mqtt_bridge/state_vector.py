@@ -0,0 +1,153 @@
+"""Array-backed own-ship state.
+
+The bridge normally parses each sentence into a fresh NMEAData and copies
+its values into a state dict. With ``runtime.state_vector`` the state is a
+preallocated ``array('d')`` indexed by field ID instead, and the parser's
+fast-path writers store each value straight into its slot: no NMEAData,
+no dict copy. NaN marks a field with no value yet, and each parse
+returns a bitmask of the fields it wrote so only those sensors are
+considered for publishing.
+"""
+
+import math
+from array import array
+from collections.abc import MutableMapping
+from typing import Any, Iterator
+
+from .nmea_parser import (
+    FAST_SENTENCES,
+    UNHANDLED,
+    NMEAData,
+    parse_sentence,
+    split_fields,
+    write_value,
+)
+
+# Numeric NMEAData fields by field ID. The sensor fields come first, in
+# SENSOR_DEFINITIONS order, so publishing by field ID keeps sensor order.
+FIELDS = (
+    "latitude",
+    "longitude",
+    "heading_true",
+    "heading_magnetic",
+    "speed_over_ground_knots",
+    "speed_over_ground_kmh",
+    "course_over_ground_true",
+    "depth_meters",
+    "water_temperature_c",
+    "altitude",
+    "satellites_in_use",
+    "hdop",
+    "rudder_angle",
+    "magnetic_variation",
+    "speed_through_water_knots",
+    "fix_quality",
+    "course_over_ground_magnetic",
+    "depth_offset",
+    "satellites_in_view",
+)
+FIELD_ID = {name: i for i, name in enumerate(FIELDS)}
+
+# Fields read back as int
+INT_FIELDS = frozenset(
+    FIELD_ID[name] for name in ("fix_quality", "satellites_in_use", "satellites_in_view")
+)
+
+# Sentence type -> (write function, field ID of each field it carries).
+# Fields that are not kept (e.g. utc_time) get -1.
+_WRITERS = {
+    sentence_type: (
+        entry.write,
+        tuple(FIELD_ID.get(name, -1) for name in entry.fields),
+    )
+    for sentence_type, entry in FAST_SENTENCES.items()
+}
+
+
+class StateVector(MutableMapping):
+    """Latest value of each numeric NMEAData field, NaN while unknown.
+
+    Also usable as the bridge's state dict: missing or NaN fields read as
+    absent, and int fields read back as int.
+    """
+
+    __slots__ = ("values",)
+
+    def __init__(self):
+        self.values = array("d", [math.nan]) * len(FIELDS)
+
+    def parse(self, raw: str, verified: bool = False) -> int:
+        """Parse a $ sentence into the vector.
+
+        Fast-path sentences are written in place; anything else is parsed
+        with parse_sentence() and loaded.
+
+        Args:
+            raw: Raw NMEA sentence.
+            verified: The checksum was already checked, see parse_sentence().
+
+        Returns:
+            Bitmask of the field IDs written, or -1 if the sentence was
+            rejected (bad checksum, unknown type, unparseable).
+        """
+        fields = split_fields(raw, verified)
+        if fields is None:
+            return -1
+        if fields is UNHANDLED:
+            data = parse_sentence(raw, verified)
+            return -1 if data is None or data.sentence_type == "AIS" else self.load(data)
+        write, slots = _WRITERS[raw[3:6]]
+        try:
+            return write(fields, self.values, slots)
+        except Exception:
+            return -1
+
+    def load(self, data: NMEAData) -> int:
+        """Write the numeric fields of a parsed sentence.
+
+        Returns:
+            Bitmask of the field IDs written.
+        """
+        values = self.values
+        mask = 0
+        for field_id, name in enumerate(FIELDS):
+            mask |= write_value(values, field_id, getattr(data, name))
+        return mask
+
+    def value(self, field_id: int) -> Any:
+        """Read a field by ID (None while unknown)."""
+        value = self.values[field_id]
+        if value != value:
+            return None
+        return int(value) if field_id in INT_FIELDS else value
+
+    def get(self, name: str, default: Any = None) -> Any:
+        field_id = FIELD_ID.get(name)
+        if field_id is None:
+            return default
+        value = self.value(field_id)
+        return default if value is None else value
+
+    def __getitem__(self, name: str) -> Any:
+        value = self.get(name)
+        if value is None:
+            raise KeyError(name)
+        return value
+
+    def __setitem__(self, name: str, value: Any):
+        self.values[FIELD_ID[name]] = value
+
+    def __delitem__(self, name: str):
+        if name not in self:
+            raise KeyError(name)
+        self.values[FIELD_ID[name]] = math.nan
+
+    def __contains__(self, name: object) -> bool:
+        field_id = FIELD_ID.get(name)
+        return field_id is not None and self.values[field_id] == self.values[field_id]
+
+    def __iter__(self) -> Iterator[str]:
+        return (name for i, name in enumerate(FIELDS) if self.values[i] == self.values[i])
+
+    def __len__(self) -> int:
+        return sum(1 for value in self.values if value == value)
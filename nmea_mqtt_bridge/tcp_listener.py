@@ -0,0 +1,258 @@
+"""Async TCP client and server sources for NMEA data streams."""
+
+import asyncio
+import logging
+import socket
+import time
+
+from .ratelimit import RateGuard
+from .sources import CallbackListener, new_connection_stats
+from .udp_listener import NMEAProtocol
+
+logger = logging.getLogger(__name__)
+
+# Longest line accepted from a stream before it is discarded
+MAX_LINE_BYTES = 4096
+
+# Reconnect backoff for tcp-client sources (seconds)
+DEFAULT_RECONNECT_DELAY = 5.0
+MAX_RECONNECT_DELAY = 60.0
+
+# Seconds a connect or a silent connection may take before it is treated as
+# dropped; NMEA talkers send several sentences a second
+DEFAULT_IDLE_TIMEOUT = 30.0
+
+
+class TCPListener(CallbackListener):
+    """Manages NMEA-over-TCP sources.
+
+    Supports two source types:
+        tcp-client - connect to host:port and reconnect when dropped
+        tcp-server - accept connections on bind_address:port
+
+    Streams are framed with StreamReader.readuntil and each line goes
+    through the same NMEAProtocol filtering as UDP datagrams before being
+    handed to the callback (or batch callback). A connection that sends
+    nothing for idle_timeout seconds is closed like a dropped one.
+    """
+
+    def __init__(self):
+        super().__init__()
+        self._tasks: list[asyncio.Task] = []
+        self._servers: list[asyncio.AbstractServer] = []
+        self._writers: set[asyncio.StreamWriter] = set()
+        # Connection handler tasks started by tcp-server sources
+        self._handlers: set[asyncio.Task] = set()
+        # Source and peer label -> counters, kept across reconnects
+        self.connection_stats: dict[str, dict] = {}
+        # Source and peer label -> number of open connections
+        self._open: dict[str, int] = {}
+        # Source name -> rate guard shared by all of its connections
+        self.rate_guards: dict[str, RateGuard] = {}
+
+    async def start(self, sources: list[dict], bind_address: str = "0.0.0.0"):
+        """Start all configured TCP sources.
+
+        Args:
+            sources: Source dicts with 'name', 'type', 'port' (and 'host'
+                for tcp-client) keys.
+            bind_address: Address tcp-server sources listen on.
+        """
+        if not self._callback and not self._batch_callback:
+            raise RuntimeError("No callback set. Call set_callback() first.")
+
+        for source in sources:
+            name = source["name"]
+            if not source.get("enabled", True):
+                logger.info("Skipping disabled source: %s", name)
+                continue
+            self.rate_guards[name] = RateGuard.from_source(source)
+
+            if source.get("type") == "tcp-client":
+                self._tasks.append(asyncio.create_task(self._run_client(source)))
+                logger.info(
+                    "TCP client [%s] connecting to %s:%d - %s",
+                    name,
+                    source["host"],
+                    source["port"],
+                    source.get("description", ""),
+                )
+                continue
+
+            try:
+                server = await asyncio.start_server(
+                    lambda r, w, s=source: self._serve_connection(s, r, w),
+                    bind_address,
+                    source["port"],
+                    limit=MAX_LINE_BYTES,
+                )
+            except OSError as e:
+                logger.error(
+                    "Failed to listen on %s:%d [%s]: %s",
+                    bind_address,
+                    source["port"],
+                    name,
+                    e,
+                )
+                continue
+            self._servers.append(server)
+            logger.info(
+                "TCP server listening on %s:%d [%s] - %s",
+                bind_address,
+                source["port"],
+                name,
+                source.get("description", ""),
+            )
+
+    async def _run_client(self, source: dict):
+        """Keep a tcp-client source connected, reconnecting with backoff."""
+        name = source["name"]
+        host = source["host"]
+        port = source["port"]
+        base_delay = source.get("reconnect_delay", DEFAULT_RECONNECT_DELAY)
+        timeout = source.get("idle_timeout", DEFAULT_IDLE_TIMEOUT)
+        delay = base_delay
+
+        while True:
+            try:
+                reader, writer = await asyncio.wait_for(
+                    asyncio.open_connection(host, port, limit=MAX_LINE_BYTES),
+                    timeout,
+                )
+            except (OSError, asyncio.TimeoutError) as e:
+                logger.warning(
+                    "TCP client [%s] could not connect to %s:%d: %s (retry in %.0fs)",
+                    name,
+                    host,
+                    port,
+                    str(e) or "timed out",
+                    delay,
+                )
+                await asyncio.sleep(delay)
+                delay = min(delay * 2, MAX_RECONNECT_DELAY)
+                continue
+
+            delay = base_delay
+            await self._handle_connection(source, reader, writer)
+            logger.warning(
+                "TCP client [%s] disconnected from %s:%d (retry in %.0fs)",
+                name,
+                host,
+                port,
+                delay,
+            )
+            await asyncio.sleep(delay)
+
+    async def _serve_connection(
+        self,
+        source: dict,
+        reader: asyncio.StreamReader,
+        writer: asyncio.StreamWriter,
+    ):
+        """Handle a connection accepted by a tcp-server source."""
+        task = asyncio.current_task()
+        self._handlers.add(task)
+        try:
+            await self._handle_connection(source, reader, writer)
+        finally:
+            self._handlers.discard(task)
+
+    async def _handle_connection(
+        self,
+        source: dict,
+        reader: asyncio.StreamReader,
+        writer: asyncio.StreamWriter,
+    ):
+        """Read NMEA lines from one connection until it closes."""
+        peer = writer.get_extra_info("peername") or ("unknown", 0)
+        if source.get("type") == "tcp-client":
+            label = f"{source['name']}@{source['host']}:{source['port']}"
+        else:
+            # Not the peer's port: it changes on every reconnect
+            label = f"{source['name']}@{peer[0]}"
+        stats = self.connection_stats.setdefault(label, new_connection_stats())
+        timeout = source.get("idle_timeout", DEFAULT_IDLE_TIMEOUT)
+        sock = writer.get_extra_info("socket")
+        if sock is not None:
+            # Also catch peers that vanish without a FIN while we are idle
+            sock.setsockopt(socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1)
+        stats["connected"] = True
+        self._open[label] = self._open.get(label, 0) + 1
+        self._writers.add(writer)
+        logger.info("TCP connection [%s] established from port %s", label, peer[1])
+
+        # Per-connection framer and filters
+        protocol = NMEAProtocol.from_source(
+            source, self._callback, self.rate_guards.get(source["name"])
+        )
+        deliver = self._deliver
+        self._track(protocol)
+
+        try:
+            while True:
+                try:
+                    line = await asyncio.wait_for(reader.readuntil(b"\n"), timeout)
+                except asyncio.TimeoutError:
+                    # Half-open or stalled peer - drop it so a client reconnects
+                    logger.warning(
+                        "TCP connection [%s] idle for %.0fs, closing", label, timeout
+                    )
+                    break
+                except asyncio.IncompleteReadError as e:
+                    # EOF - frame whatever was left
+                    line = e.partial
+                    if line:
+                        stats["bytes"] += len(line)
+                        stats["sentences"] += deliver(protocol.extract(line, peer, time.time()))
+                    break
+                except asyncio.LimitOverrunError as e:
+                    # No line terminator within the limit - discard the junk
+                    await reader.readexactly(e.consumed)
+                    continue
+
+                stats["bytes"] += len(line)
+                stats["sentences"] += deliver(protocol.extract(line, peer, time.time()))
+        except (ConnectionError, OSError) as e:
+            logger.warning("TCP connection [%s] error: %s", label, e)
+        finally:
+            self._untrack(protocol)
+            self._open[label] -= 1
+            stats["connected"] = self._open[label] > 0
+            self._writers.discard(writer)
+            writer.close()
+            logger.info("TCP connection [%s] closed", label)
+
+    @property
+    def active(self) -> bool:
+        """Whether any TCP source is running."""
+        return bool(self._tasks or self._servers)
+
+    @property
+    def sentences_rate_limited(self) -> int:
+        """Total sentences dropped by per-source rate guards."""
+        return sum(guard.dropped for guard in self.rate_guards.values())
+
+    async def stop(self):
+        """Stop all TCP sources and close open connections."""
+        was_active = self.active
+        for task in self._tasks:
+            task.cancel()
+        for server in self._servers:
+            server.close()
+        for writer in list(self._writers):
+            writer.close()
+        for task in self._handlers:
+            task.cancel()
+        for task in [*self._tasks, *self._handlers]:
+            try:
+                await task
+            except (asyncio.CancelledError, Exception):
+                pass
+        for server in self._servers:
+            await server.wait_closed()
+        self._tasks.clear()
+        self._handlers.clear()
+        self._servers.clear()
+        self._writers.clear()
+        if was_active:
+            logger.info("All TCP sources stopped")
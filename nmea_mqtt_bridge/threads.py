@@ -0,0 +1,223 @@
+"""Per-source processing threads for free-threaded CPython.
+
+On a free-threaded build (e.g. 3.13t with the GIL disabled) threads run
+Python code in parallel, so parsing and AIS decoding for each source can
+use its own core without the process and IPC overhead of worker mode.
+Sockets are still read on the event loop; sentences are handed to the
+thread of the source they came from, which parses them and publishes
+through the bridge's locked, thread-safe processing path.
+
+Each thread's backlog is bounded like the ingest queue it replaces, so a
+sentence storm or a stalled publish drops sentences (per the source's
+overflow policy) instead of growing memory without limit.
+"""
+
+import logging
+import sys
+import threading
+from collections import deque
+from typing import Callable, Optional
+
+from .ingest_queue import DEFAULT_MAXSIZE, DEFAULT_POLICY, OVERFLOW_POLICIES
+
+logger = logging.getLogger(__name__)
+
+# Supported values for runtime.source_threads
+SOURCE_THREAD_MODES = ("auto", "on", "off")
+
+
+def gil_enabled() -> bool:
+    """Whether the GIL is active in this interpreter.
+
+    Always True on builds without free-threading support.
+    """
+    is_gil_enabled = getattr(sys, "_is_gil_enabled", None)
+    return True if is_gil_enabled is None else is_gil_enabled()
+
+
+def use_source_threads(mode: str = "auto") -> bool:
+    """Decide whether to run per-source processing threads.
+
+    Args:
+        mode: "auto" (only when the GIL is disabled), "on" or "off".
+    """
+    if mode == "auto":
+        return not gil_enabled()
+    return mode == "on"
+
+
+def new_thread_counters() -> dict:
+    """Create the per-thread counter shard."""
+    return {
+        "sentences_received": 0,
+        "sentences_parsed": 0,
+        "sentences_skipped": 0,
+        "duplicates": 0,
+        "errors": 0,
+    }
+
+
+class SourceThread(threading.Thread):
+    """Processes the sentences of one source on a dedicated thread."""
+
+    def __init__(
+        self,
+        source_name: str,
+        process: Callable[..., None],
+        maxsize: int = DEFAULT_MAXSIZE,
+        policy: str = DEFAULT_POLICY,
+    ):
+        """Initialize source thread.
+
+        Args:
+            source_name: Source whose sentences this thread handles.
+            process: Called with (counters, *ReceivedSentence) per sentence.
+            maxsize: Most sentences waiting to be processed.
+            policy: Overflow policy, "drop-oldest" or "drop-newest";
+                "coalesce" drops the oldest sentence here.
+
+        Raises:
+            ValueError: If the policy name is unknown.
+        """
+        if policy not in OVERFLOW_POLICIES:
+            raise ValueError(f"Unknown overflow policy: {policy}")
+        super().__init__(name=f"nmea-source-{source_name}", daemon=True)
+        self.source_name = source_name
+        self._process = process
+        self.maxsize = maxsize
+        self.policy = policy
+        # A full deque with a maxlen discards from the front: drop-oldest
+        self._pending: deque = deque(maxlen=maxsize)
+        self._ready = threading.Condition()
+        self._stopping = False
+        # Owned by this thread only; summed by the stats logger
+        self.counters = new_thread_counters()
+        # Sentences dropped because the backlog was full (event loop side)
+        self.overflows = 0
+        self.high_watermark = 0
+
+    def submit(self, items: list):
+        """Queue sentences for processing (called from the event loop)."""
+        with self._ready:
+            pending = self._pending
+            excess = len(pending) + len(items) - self.maxsize
+            if excess > 0:
+                self.overflows += excess
+                if self.policy == "drop-newest":
+                    items = items[: len(items) - excess]
+            pending.extend(items)
+            if len(pending) > self.high_watermark:
+                self.high_watermark = len(pending)
+            self._ready.notify()
+
+    def __len__(self) -> int:
+        return len(self._pending)
+
+    def run(self):
+        process = self._process
+        counters = self.counters
+        ready = self._ready
+        pending = self._pending
+        while True:
+            with ready:
+                while not pending and not self._stopping:
+                    ready.wait()
+                if not pending:
+                    break
+                items = list(pending)
+                pending.clear()
+            for item in items:
+                try:
+                    process(counters, *item)
+                except Exception as e:
+                    counters["errors"] += 1
+                    logger.error(
+                        "Error processing %s: %s", item.sentence, e, exc_info=True
+                    )
+
+    def stop(self):
+        """Ask the thread to exit once its queue is drained."""
+        with self._ready:
+            self._stopping = True
+            self._ready.notify()
+
+
+class SourceThreadPool:
+    """Routes received sentences to one processing thread per source."""
+
+    def __init__(
+        self,
+        process: Callable[..., None],
+        maxsize: int = DEFAULT_MAXSIZE,
+        policies: Optional[dict[str, str]] = None,
+        default_policy: str = DEFAULT_POLICY,
+    ):
+        """Initialize thread pool.
+
+        Args:
+            process: Thread-safe per-sentence processing function, called
+                with (counters, *ReceivedSentence).
+            maxsize: Most sentences waiting per thread.
+            policies: Source name -> overflow policy.
+            default_policy: Policy for sources not listed in policies.
+        """
+        self._process = process
+        self.maxsize = maxsize
+        self._policies = dict(policies or {})
+        self._default_policy = default_policy
+        self.threads: dict[str, SourceThread] = {}
+        self._lock = threading.Lock()
+
+    def _thread(self, source_name: str) -> SourceThread:
+        thread = self.threads.get(source_name)
+        if thread is None:
+            with self._lock:
+                thread = self.threads.get(source_name)
+                if thread is None:
+                    thread = SourceThread(
+                        source_name,
+                        self._process,
+                        self.maxsize,
+                        self._policies.get(source_name, self._default_policy),
+                    )
+                    thread.start()
+                    self.threads[source_name] = thread
+        return thread
+
+    def dispatch(self, batch: list):
+        """Hand a batch of ReceivedSentence tuples to their source threads."""
+        source = batch[0].source
+        if all(item.source == source for item in batch):
+            self._thread(source).submit(batch)
+            return
+
+        by_source: dict[str, list] = {}
+        for item in batch:
+            by_source.setdefault(item.source, []).append(item)
+        for name, items in by_source.items():
+            self._thread(name).submit(items)
+
+    def counters(self) -> dict[str, int]:
+        """Sum the counter shards of all threads."""
+        totals = new_thread_counters()
+        for thread in list(self.threads.values()):
+            for key, value in thread.counters.items():
+                totals[key] += value
+        return totals
+
+    def overflows(self) -> dict[str, int]:
+        """Sentences dropped from each source's full backlog."""
+        return {
+            name: thread.overflows
+            for name, thread in list(self.threads.items())
+            if thread.overflows
+        }
+
+    def stop(self, timeout: Optional[float] = 5.0):
+        """Stop all threads, waiting for queued sentences to finish."""
+        threads = list(self.threads.values())
+        for thread in threads:
+            thread.stop()
+        for thread in threads:
+            thread.join(timeout)
+        self.threads.clear()
@@ -2,48 +2,240 @@
 
 import asyncio
 import logging
+import os
+import socket
+import struct
 import sys
+import time
 from typing import Callable, Optional
 
+from .filters import IngressFilter, SenderFilter, SentenceTypeFilter
+from .framing import Buffer, SentenceFramer
+from .ratelimit import RateGuard
+from .sources import ReceivedSentence, SentenceCallback, source_type
+
 logger = logging.getLogger(__name__)
 
+# Largest UDP payload, so batch mode reads whole datagrams as the asyncio
+# datagram path does; anything longer is counted as truncated
+RECV_BUFFER_SIZE = 65535
+
+# Default number of datagrams drained per readiness event in batch mode
+DEFAULT_BATCH_SIZE = 64
+
+# Receive buffers kept preallocated for batch mode readers
+DEFAULT_POOL_SIZE = 4
+
+# Kernel socket tables holding per-socket UDP drop counters (Linux)
+PROC_NET_UDP = ("/proc/net/udp", "/proc/net/udp6")
+
+# Nanosecond kernel receive timestamps; the socket module does not export
+# these constants, so fall back to the Linux values (SCM_ == SO_)
+SO_TIMESTAMPNS = getattr(
+    socket, "SO_TIMESTAMPNS", 35 if sys.platform.startswith("linux") else None
+)
+_TIMESPEC = struct.Struct("@ll")
+
+# Ingress interface and destination address of each datagram (Linux value
+# where the socket module lacks it); struct in_pktinfo holds the interface
+# index, the local address and the header destination address
+IP_PKTINFO = getattr(
+    socket, "IP_PKTINFO", 8 if sys.platform.startswith("linux") else None
+)
+_IN_PKTINFO = struct.Struct("@i4s4s")
+
+ANCILLARY_BUFFER_SIZE = (
+    socket.CMSG_SPACE(_TIMESPEC.size) + socket.CMSG_SPACE(_IN_PKTINFO.size)
+    if hasattr(socket, "CMSG_SPACE")
+    else 0
+)
+
+# in_pktinfo bytes -> (interface, destination type); feeds use a handful
+_ingress_tags: dict[bytes, tuple[str, str]] = {}
+MAX_CACHED_INGRESS_TAGS = 256
+
 
 class NMEAProtocol(asyncio.DatagramProtocol):
     """UDP datagram protocol handler for NMEA data."""
 
-    def __init__(self, source_name: str, callback: Callable[[str, str, str], None]):
+    def __init__(
+        self,
+        source_name: str,
+        callback: SentenceCallback,
+        sender_filter: Optional[SenderFilter] = None,
+        type_filter: Optional[SentenceTypeFilter] = None,
+        rate_guard: Optional[RateGuard] = None,
+        ingress_filter: Optional[IngressFilter] = None,
+    ):
         """Initialize protocol handler.
 
         Args:
             source_name: Identifier for this UDP source.
-            callback: Called with (source_name, sender_ip, raw_sentence) for each NMEA sentence.
+            callback: Called with (source_name, sender_ip, raw_sentence,
+                received_at, interface, destination) for each sentence.
+            sender_filter: Optional per-sender allow/deny and naming rules.
+            type_filter: Optional allow/deny rules for sentence types.
+            rate_guard: Optional per-source sentence rate limits.
+            ingress_filter: Optional routing on ingress interface and
+                destination type.
         """
         self.source_name = source_name
         self.callback = callback
         self.transport: Optional[asyncio.DatagramTransport] = None
+        self.sender_filter = (
+            sender_filter if sender_filter is not None and sender_filter.active else None
+        )
+        self.type_filter = (
+            type_filter if type_filter is not None and type_filter.active else None
+        )
+        self.rate_guard = (
+            rate_guard if rate_guard is not None and rate_guard.active else None
+        )
+        self.ingress_filter = (
+            ingress_filter
+            if ingress_filter is not None and ingress_filter.active
+            else None
+        )
+        # Type filter and checksum run on the framed bytes, before decoding
+        self.framer = SentenceFramer(
+            accept=self.type_filter.allows if self.type_filter is not None else None,
+            verify_checksum=True,
+        )
+        # Per-sender datagram counters: sender IP -> count
+        self.sender_counts: dict[str, int] = {}
+        self.sender_drops: dict[str, int] = {}
+        # Per-ingress datagram counters: (interface, destination) -> count
+        self.ingress_counts: dict[tuple[str, str], int] = {}
+        self.ingress_drops: dict[tuple[str, str], int] = {}
+
+    @classmethod
+    def from_source(
+        cls,
+        source: dict,
+        callback: SentenceCallback,
+        rate_guard: Optional[RateGuard] = None,
+    ) -> "NMEAProtocol":
+        """Build a protocol handler from a source config dict.
+
+        Args:
+            source: Source config dict.
+            callback: Per-sentence callback.
+            rate_guard: Rate guard to share with other handlers of the same
+                source; built from the source's ``rate_limit`` if omitted.
+        """
+        name = source["name"]
+        sender_filter = SenderFilter(
+            name,
+            names=source.get("senders"),
+            allow=source.get("allow_senders"),
+            deny=source.get("deny_senders"),
+        )
+        types = source.get("sentence_types") or {}
+        type_filter = SentenceTypeFilter(
+            allow=types.get("allow"),
+            deny=types.get("deny"),
+        )
+        if rate_guard is None:
+            rate_guard = RateGuard.from_source(source)
+        ingress_filter = IngressFilter(
+            name,
+            names=source.get("interface_names"),
+            interfaces=source.get("ingress_interfaces"),
+            destinations=source.get("destinations"),
+        )
+        return cls(
+            name, callback, sender_filter, type_filter, rate_guard, ingress_filter
+        )
 
     def connection_made(self, transport: asyncio.DatagramTransport):
         self.transport = transport
         logger.info("UDP listener '%s' ready", self.source_name)
 
     def datagram_received(self, data: bytes, addr: tuple):
+        # No ancillary data through the transport, so no kernel timestamp
+        # (that needs ingest_mode: batch); stamp on arrival
+        for item in self.extract(data, addr, time.time()):
+            self.callback(*item)
+
+    def extract(
+        self,
+        data: Buffer,
+        addr: tuple,
+        received_at: Optional[float] = None,
+        interface: Optional[str] = None,
+        destination: Optional[str] = None,
+    ) -> list[ReceivedSentence]:
+        """Split a datagram into the NMEA sentences it carries.
+
+        Args:
+            data: Raw datagram payload; may be a view of a buffer that is
+                reused once this returns.
+            addr: Sender address tuple.
+            received_at: Wall-clock arrival time to tag sentences with.
+            interface: Ingress interface to tag sentences with.
+            destination: Destination type to tag sentences with.
+
+        Returns:
+            List of sentences found in the datagram.
+        """
         sender_ip = addr[0]
-        try:
-            text = data.decode("ascii", errors="ignore").strip()
-        except Exception:
-            return
+        source_name = self.source_name
+        if self.sender_filter is not None:
+            source_name = self.sender_filter.resolve(sender_ip)
+            if source_name is None:
+                # Unwanted sender - drop before any decoding
+                self.sender_drops[sender_ip] = self.sender_drops.get(sender_ip, 0) + 1
+                return []
+        self.sender_counts[sender_ip] = self.sender_counts.get(sender_ip, 0) + 1
 
-        if not text:
-            return
+        if interface is not None:
+            tag = (interface, destination)
+            if self.ingress_filter is not None:
+                name = self.ingress_filter.resolve(interface, destination)
+                if name is None:
+                    self.ingress_drops[tag] = self.ingress_drops.get(tag, 0) + 1
+                    return []
+                # Sender names are more specific than interface names
+                if source_name == self.source_name:
+                    source_name = name
+            self.ingress_counts[tag] = self.ingress_counts.get(tag, 0) + 1
+
+        # A single UDP packet may contain multiple NMEA sentences; the
+        # framer has already stripped everything but printable ASCII and
+        # dropped unwanted types and bad checksums, so only survivors are
+        # decoded (straight from the receive buffer).
+        lines = self.framer.feed(sender_ip, data)
+        if self.rate_guard is not None and lines:
+            allows = self.rate_guard.allows
+            now = received_at if received_at is not None else time.time()
+            lines = [line for line in lines if allows(line, now)]
 
-        # A single UDP packet may contain multiple NMEA sentences
-        for line in text.split("\n"):
-            line = line.strip()
-            if line and (line.startswith("$") or line.startswith("!")):
-                # Clean up any stray non-printable chars
-                clean = "".join(c for c in line if 32 <= ord(c) < 127)
-                if clean:
-                    self.callback(self.source_name, sender_ip, clean)
+        return [
+            ReceivedSentence(
+                source_name,
+                sender_ip,
+                str(line, "ascii"),
+                received_at,
+                interface,
+                destination,
+            )
+            for line in lines
+        ]
+
+    @property
+    def sentences_filtered(self) -> int:
+        """Sentences dropped by the sentence type filter."""
+        return self.framer.filtered
+
+    @property
+    def sentences_invalid(self) -> int:
+        """Sentences dropped for a missing or wrong checksum."""
+        return self.framer.invalid
+
+    @property
+    def sentences_rate_limited(self) -> int:
+        """Sentences dropped by the rate guard."""
+        return self.rate_guard.dropped if self.rate_guard is not None else 0
 
     def error_received(self, exc: Exception):
         logger.error("UDP error on '%s': %s", self.source_name, exc)
@@ -53,78 +245,581 @@ class NMEAProtocol(asyncio.DatagramProtocol):
             logger.warning("UDP connection lost on '%s': %s", self.source_name, exc)
 
 
+class BufferPool:
+    """Preallocated receive buffers shared by batch mode readers.
+
+    Datagrams are received straight into a pooled ``bytearray`` and
+    framed in place, so the receive path allocates nothing per datagram
+    apart from the strings of sentences that are kept.
+    """
+
+    def __init__(self, count: int = DEFAULT_POOL_SIZE, size: int = RECV_BUFFER_SIZE):
+        """Initialize buffer pool.
+
+        Args:
+            count: Number of buffers to preallocate and keep.
+            size: Size of each buffer in bytes.
+        """
+        self.count = count
+        self.size = size
+        self._free = [bytearray(size) for _ in range(count)]
+        # Buffers allocated because the pool was empty
+        self.misses = 0
+
+    def acquire(self) -> bytearray:
+        """Take a buffer from the pool, allocating one if it is empty."""
+        try:
+            return self._free.pop()
+        except IndexError:
+            self.misses += 1
+            return bytearray(self.size)
+
+    def release(self, buf: bytearray):
+        """Return a buffer to the pool."""
+        if len(self._free) < self.count:
+            self._free.append(buf)
+
+
+class BatchReader:
+    """Drains a non-blocking UDP socket on each readiness event.
+
+    Rather than one protocol callback per datagram, every wakeup reads
+    up to ``batch_size`` datagrams in a tight ``recvmsg_into`` loop into a
+    pooled buffer and hands all sentences found to the batch callback in
+    a single call. Sentences are tagged with the kernel receive timestamp
+    (SO_TIMESTAMPNS) and their ingress interface and destination type
+    (IP_PKTINFO) when the socket provides them.
+    """
+
+    def __init__(
+        self,
+        sock: socket.socket,
+        protocol: NMEAProtocol,
+        batch_callback: Callable[[list[ReceivedSentence]], None],
+        batch_size: int = DEFAULT_BATCH_SIZE,
+        stats: Optional[dict] = None,
+        pool: Optional[BufferPool] = None,
+    ):
+        """Initialize batch reader.
+
+        Args:
+            sock: Bound, non-blocking UDP socket.
+            protocol: Protocol used to split datagrams into sentences.
+            batch_callback: Called with the list of sentences read per wakeup.
+            batch_size: Maximum datagrams read per wakeup.
+            stats: Shared batch statistics dict to update.
+            pool: Shared receive buffer pool.
+        """
+        self.sock = sock
+        self.protocol = protocol
+        self.batch_callback = batch_callback
+        self.batch_size = batch_size
+        self.stats = stats if stats is not None else new_batch_stats()
+        self.pool = pool if pool is not None else BufferPool(count=1)
+
+    def on_readable(self):
+        """Event loop reader callback - drain the socket."""
+        batch: list[ReceivedSentence] = []
+        recvmsg_into = self.sock.recvmsg_into
+        extract = self.protocol.extract
+        datagrams = 0
+
+        buf = self.pool.acquire()
+        buffers = (buf,)
+        view = memoryview(buf)
+        try:
+            while datagrams < self.batch_size:
+                try:
+                    nbytes, ancdata, flags, addr = recvmsg_into(
+                        buffers, ANCILLARY_BUFFER_SIZE
+                    )
+                except (BlockingIOError, InterruptedError):
+                    break
+                except OSError as e:
+                    self.protocol.error_received(e)
+                    break
+                datagrams += 1
+                if flags & socket.MSG_TRUNC:
+                    nbytes = self._truncated(buf, nbytes, addr)
+                    if not nbytes:
+                        continue
+                # Sentences are decoded here, so the buffer is free again
+                batch.extend(extract(view[:nbytes], addr, *_read_ancillary(ancdata)))
+        finally:
+            self.pool.release(buf)
+
+        if not datagrams:
+            return
+
+        stats = self.stats
+        stats["batches"] += 1
+        stats["datagrams"] += datagrams
+        stats["sentences"] += len(batch)
+        if datagrams > stats["max_batch"]:
+            stats["max_batch"] = datagrams
+
+        if batch:
+            self.batch_callback(batch)
+
+    def _truncated(self, buf: bytearray, nbytes: int, addr: tuple) -> int:
+        """Count a datagram cut short by the buffer and trim its partial line.
+
+        The cut-off last line must not reach the framer, which would hold
+        it back as a fragment for the sender's next datagram.
+
+        Returns:
+            Length of the datagram's complete lines; 0 if there are none.
+        """
+        self.stats["truncated"] += 1
+        logger.warning(
+            "[%s] Datagram from %s larger than the %d byte receive buffer; "
+            "dropping its truncated last line",
+            self.protocol.source_name,
+            addr[0],
+            len(buf),
+        )
+        return max(buf.rfind(b"\n", 0, nbytes), buf.rfind(b"\r", 0, nbytes)) + 1
+
+
+def _read_ancillary(
+    ancdata: list,
+) -> tuple[float, Optional[str], Optional[str]]:
+    """Get the receive time and ingress tags from ancillary data.
+
+    The receive time is the SCM_TIMESTAMPNS kernel timestamp, falling back
+    to the current time if the kernel did not supply one.
+
+    Returns:
+        Tuple of (received_at, interface, destination type); the tags are
+        None without IP_PKTINFO data.
+    """
+    received_at = None
+    interface = destination = None
+    for level, kind, cdata in ancdata:
+        if level == socket.SOL_SOCKET and kind == SO_TIMESTAMPNS:
+            sec, nsec = _TIMESPEC.unpack_from(cdata)
+            received_at = sec + nsec * 1e-9
+        elif (
+            level == socket.IPPROTO_IP
+            and kind == IP_PKTINFO
+            and len(cdata) >= _IN_PKTINFO.size
+        ):
+            interface, destination = ingress_tag(cdata)
+    if received_at is None:
+        received_at = time.time()
+    return received_at, interface, destination
+
+
+def ingress_tag(pktinfo: bytes) -> tuple[str, str]:
+    """Decode a struct in_pktinfo into ingress tags.
+
+    The destination is multicast for 224.0.0.0/4 group addresses, unicast
+    when the header destination is the local address the kernel picked,
+    and broadcast otherwise (limited or subnet-directed).
+
+    Args:
+        pktinfo: IP_PKTINFO control message data.
+
+    Returns:
+        Tuple of (interface name, destination type). The interface index
+        is used as the name if it cannot be resolved.
+    """
+    try:
+        return _ingress_tags[pktinfo]
+    except KeyError:
+        pass
+
+    ifindex, local, header_dst = _IN_PKTINFO.unpack_from(pktinfo)
+    try:
+        interface = socket.if_indextoname(ifindex)
+    except OSError:
+        interface = str(ifindex)
+    if header_dst[0] & 0xF0 == 0xE0:
+        destination = "multicast"
+    elif header_dst == local:
+        destination = "unicast"
+    else:
+        destination = "broadcast"
+
+    if len(_ingress_tags) >= MAX_CACHED_INGRESS_TAGS:
+        _ingress_tags.clear()
+    tag = _ingress_tags[bytes(pktinfo)] = (interface, destination)
+    return tag
+
+
+def new_batch_stats() -> dict:
+    """Create an empty batch statistics dict."""
+    return {
+        "batches": 0,
+        "datagrams": 0,
+        "sentences": 0,
+        "max_batch": 0,
+        "truncated": 0,
+    }
+
+
+def read_kernel_drops(
+    inodes: set[int], tables: tuple[str, ...] = PROC_NET_UDP
+) -> dict[int, int]:
+    """Read kernel drop counters for the given UDP sockets.
+
+    The last column of /proc/net/udp counts datagrams the kernel dropped
+    for a socket, e.g. because its receive buffer was full.
+
+    Args:
+        inodes: Socket inode numbers to look up.
+        tables: Proc files to scan.
+
+    Returns:
+        Dict of inode -> dropped datagram count. Sockets not found (or
+        platforms without /proc) are omitted.
+    """
+    drops: dict[int, int] = {}
+    for table in tables:
+        try:
+            with open(table) as f:
+                next(f, None)  # header
+                for line in f:
+                    fields = line.split()
+                    if len(fields) < 13:
+                        continue
+                    try:
+                        inode = int(fields[9])
+                        if inode in inodes:
+                            drops[inode] = int(fields[12])
+                    except ValueError:
+                        continue
+        except OSError:
+            continue
+    return drops
+
+
+def _open_socket(
+    bind_address: str, source: dict, timestamps: bool = False
+) -> socket.socket:
+    """Create a bound, non-blocking UDP socket for a source.
+
+    Applies the optional per-source socket settings:
+        recv_buffer_bytes - kernel receive buffer size (SO_RCVBUF)
+        interface         - pin the socket to a device (SO_BINDTODEVICE)
+        multicast_group   - IPv4 group to join (IP_ADD_MEMBERSHIP)
+
+    Args:
+        bind_address: Address to bind on.
+        source: Source config dict.
+        timestamps: Enable kernel receive timestamps (SO_TIMESTAMPNS). Only
+            batch mode reads them; the asyncio datagram transport discards
+            ancillary data.
+
+    Raises:
+        OSError: If the socket cannot be created, configured or bound.
+    """
+    name = source["name"]
+    interface = source.get("interface")
+    group = source.get("multicast_group")
+    rcvbuf = source.get("recv_buffer_bytes")
+
+    sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+    try:
+        sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+        # SO_REUSEPORT is only available on Linux/BSD, not Windows
+        if hasattr(socket, "SO_REUSEPORT"):
+            sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEPORT, 1)
+
+        if rcvbuf:
+            sock.setsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF, int(rcvbuf))
+            # Linux reports double the requested size (bookkeeping overhead)
+            # and silently caps it at net.core.rmem_max
+            effective = sock.getsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF)
+            if sys.platform.startswith("linux"):
+                effective //= 2
+            if effective < int(rcvbuf):
+                logger.warning(
+                    "[%s] Receive buffer capped at %d bytes (requested %d); "
+                    "raise net.core.rmem_max to allow more",
+                    name,
+                    effective,
+                    rcvbuf,
+                )
+            else:
+                logger.info("[%s] Receive buffer set to %d bytes", name, effective)
+
+        if timestamps and SO_TIMESTAMPNS is not None:
+            try:
+                sock.setsockopt(socket.SOL_SOCKET, SO_TIMESTAMPNS, 1)
+            except OSError as e:
+                logger.debug("[%s] Kernel receive timestamps unavailable: %s", name, e)
+
+        if IP_PKTINFO is not None:
+            try:
+                sock.setsockopt(socket.IPPROTO_IP, IP_PKTINFO, 1)
+            except OSError as e:
+                logger.debug("[%s] Ingress interface tags unavailable: %s", name, e)
+
+        if interface:
+            bind_to_device = getattr(socket, "SO_BINDTODEVICE", None)
+            if bind_to_device is None:
+                raise OSError("interface pinning is only supported on Linux")
+            sock.setsockopt(
+                socket.SOL_SOCKET, bind_to_device, interface.encode() + b"\0"
+            )
+
+        sock.setblocking(False)
+        sock.bind((bind_address, source["port"]))
+
+        if group:
+            if interface:
+                # struct ip_mreqn: group, local address, interface index
+                mreq = struct.pack(
+                    "=4s4si",
+                    socket.inet_aton(group),
+                    socket.inet_aton("0.0.0.0"),
+                    socket.if_nametoindex(interface),
+                )
+            else:
+                mreq = struct.pack(
+                    "=4s4s", socket.inet_aton(group), socket.inet_aton("0.0.0.0")
+                )
+            sock.setsockopt(socket.IPPROTO_IP, socket.IP_ADD_MEMBERSHIP, mreq)
+            logger.info(
+                "[%s] Joined multicast group %s%s",
+                name,
+                group,
+                f" on {interface}" if interface else "",
+            )
+    except OSError:
+        sock.close()
+        raise
+    return sock
+
+
 class UDPListener:
     """Manages multiple async UDP listeners for NMEA data."""
 
     def __init__(self):
         self.transports: list[asyncio.DatagramTransport] = []
-        self._callback: Optional[Callable] = None
+        self.readers: list[BatchReader] = []
+        self.protocols: list[NMEAProtocol] = []
+        self._callback: Optional[SentenceCallback] = None
+        self._batch_callback: Optional[Callable] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self.batch_stats = new_batch_stats()
+        self.buffer_pool = BufferPool()
+        # Source name -> socket inode, for kernel drop accounting
+        self._inodes: dict[str, int] = {}
 
-    def set_callback(self, callback: Callable[[str, str, str], None]):
+    def set_callback(self, callback: SentenceCallback):
         """Set the callback function for received NMEA sentences.
 
         Args:
-            callback: Called with (source_name, sender_ip, raw_sentence).
+            callback: Called with (source_name, sender_ip, raw_sentence,
+                received_at, interface, destination) for each sentence.
         """
         self._callback = callback
 
+    def set_batch_callback(
+        self, callback: Callable[[list[ReceivedSentence]], None]
+    ):
+        """Set the callback used in batch ingest mode.
+
+        When set, sockets are read directly on each readiness event and
+        all sentences read are delivered in one call.
+
+        Args:
+            callback: Called with a list of ReceivedSentence tuples.
+        """
+        self._batch_callback = callback
+
     async def start(
         self,
         sources: list[dict],
         bind_address: str = "0.0.0.0",
         loop: Optional[asyncio.AbstractEventLoop] = None,
+        batch_size: int = DEFAULT_BATCH_SIZE,
     ):
         """Start UDP listeners for all configured sources.
 
         Args:
             sources: List of source dicts with 'name', 'port', 'enabled' keys.
+                Sources whose type is not 'udp' are ignored.
             bind_address: Address to bind listeners on.
             loop: Event loop (defaults to running loop).
+            batch_size: Maximum datagrams drained per wakeup in batch mode.
         """
-        if not self._callback:
+        if not self._callback and not self._batch_callback:
             raise RuntimeError("No callback set. Call set_callback() first.")
 
         if loop is None:
             loop = asyncio.get_running_loop()
+        self._loop = loop
 
+        sources = [s for s in sources if source_type(s) == "udp"]
+        enabled = 0
         for source in sources:
             if not source.get("enabled", True):
                 logger.info("Skipping disabled source: %s", source["name"])
                 continue
+            enabled += 1
 
             port = source["port"]
             name = source["name"]
             desc = source.get("description", "")
 
             try:
-                # reuse_port is only supported on Linux/BSD, not Windows
-                reuse = sys.platform != "win32"
-                transport, _ = await loop.create_datagram_endpoint(
-                    lambda n=name: NMEAProtocol(n, self._callback),
-                    local_addr=(bind_address, port),
-                    reuse_port=reuse,
+                protocol = NMEAProtocol.from_source(source, self._callback)
+                sock = _open_socket(
+                    bind_address, source, timestamps=bool(self._batch_callback)
                 )
-                self.transports.append(transport)
+                try:
+                    await self._attach(loop, protocol, sock, batch_size)
+                except OSError:
+                    sock.close()
+                    raise
                 logger.info(
-                    "Listening on %s:%d [%s] - %s",
+                    "Listening on %s:%d%s [%s] - %s",
                     bind_address,
                     port,
+                    f" ({source['interface']})" if source.get("interface") else "",
                     name,
                     desc,
                 )
-            except OSError as e:
+            except (OSError, ValueError) as e:
                 logger.error(
                     "Failed to bind %s:%d [%s]: %s", bind_address, port, name, e
                 )
 
-        if not self.transports:
+        count = len(self.transports) + len(self.readers)
+        if not enabled:
+            return
+        if not count:
             raise RuntimeError("No UDP listeners could be started")
 
-        logger.info("Started %d UDP listener(s)", len(self.transports))
+        logger.info(
+            "Started %d UDP listener(s)%s",
+            count,
+            " in batch mode" if self.readers else "",
+        )
+
+    async def _attach(
+        self,
+        loop: asyncio.AbstractEventLoop,
+        protocol: NMEAProtocol,
+        sock: socket.socket,
+        batch_size: int,
+    ):
+        """Register a bound source socket with the event loop."""
+        name = protocol.source_name
+        self._inodes[name] = os.fstat(sock.fileno()).st_ino
+
+        if not self._batch_callback:
+            if protocol.ingress_filter is not None:
+                logger.warning(
+                    "[%s] Ingress interface/destination routing needs batch "
+                    "ingest mode; accepting all traffic",
+                    name,
+                )
+            transport, _ = await loop.create_datagram_endpoint(
+                lambda: protocol,
+                sock=sock,
+            )
+            self.transports.append(transport)
+            self.protocols.append(protocol)
+            return
+
+        reader = BatchReader(
+            sock,
+            protocol,
+            self._batch_callback,
+            batch_size,
+            self.batch_stats,
+            self.buffer_pool,
+        )
+        try:
+            loop.add_reader(sock.fileno(), reader.on_readable)
+        except NotImplementedError:
+            raise OSError("batch ingest is not supported by this event loop")
+        self.readers.append(reader)
+        self.protocols.append(protocol)
+        logger.info("UDP listener '%s' ready", name)
+
+    def kernel_drops(self) -> dict[str, int]:
+        """Get datagrams dropped by the kernel for each source.
+
+        Returns:
+            Dict of source name -> dropped datagram count since the socket
+            was opened. Empty where /proc/net/udp is unavailable.
+        """
+        drops = read_kernel_drops(set(self._inodes.values()))
+        return {
+            name: drops[inode]
+            for name, inode in self._inodes.items()
+            if inode in drops
+        }
+
+    @property
+    def active(self) -> bool:
+        """Whether any UDP listener is running."""
+        return bool(self.transports or self.readers)
+
+    @property
+    def sentences_filtered(self) -> int:
+        """Total sentences dropped by per-source sentence type filters."""
+        return sum(p.sentences_filtered for p in self.protocols)
+
+    @property
+    def sentences_invalid(self) -> int:
+        """Total sentences dropped for a missing or wrong checksum."""
+        return sum(p.sentences_invalid for p in self.protocols)
+
+    @property
+    def sentences_rate_limited(self) -> int:
+        """Total sentences dropped by per-source rate guards."""
+        return sum(p.sentences_rate_limited for p in self.protocols)
+
+    def sender_stats(self) -> dict[str, dict[str, tuple[int, int]]]:
+        """Get per-sender datagram counters for each source.
+
+        Returns:
+            Dict of source name -> {sender IP: (accepted, dropped)}.
+        """
+        stats: dict[str, dict[str, tuple[int, int]]] = {}
+        for protocol in self.protocols:
+            senders = stats.setdefault(protocol.source_name, {})
+            for ip in protocol.sender_counts.keys() | protocol.sender_drops.keys():
+                senders[ip] = (
+                    protocol.sender_counts.get(ip, 0),
+                    protocol.sender_drops.get(ip, 0),
+                )
+        return stats
+
+    def ingress_stats(self) -> dict[str, dict[tuple[str, str], tuple[int, int]]]:
+        """Get per-ingress datagram counters for each source.
+
+        Returns:
+            Dict of source name -> {(interface, destination type):
+            (accepted, dropped)}.
+        """
+        stats: dict[str, dict[tuple[str, str], tuple[int, int]]] = {}
+        for protocol in self.protocols:
+            tags = stats.setdefault(protocol.source_name, {})
+            for tag in protocol.ingress_counts.keys() | protocol.ingress_drops.keys():
+                tags[tag] = (
+                    protocol.ingress_counts.get(tag, 0),
+                    protocol.ingress_drops.get(tag, 0),
+                )
+        return stats
 
     async def stop(self):
         """Stop all UDP listeners."""
+        self._inodes.clear()
+        self.protocols.clear()
         for transport in self.transports:
             transport.close()
         self.transports.clear()
+
+        for reader in self.readers:
+            if self._loop is not None:
+                self._loop.remove_reader(reader.sock.fileno())
+            reader.sock.close()
+        self.readers.clear()
         logger.info("All UDP listeners stopped")
@@ -0,0 +1,600 @@
+"""Multi-process source workers feeding the bridge over shared memory.
+
+In worker mode each source group (e.g. nav and AIS) runs in its own
+process: the worker owns the group's sockets, frames and parses
+sentences and decodes AIS, then pushes compact records through a
+single-producer/single-consumer ring in ``multiprocessing.shared_memory``.
+The coordinator (the main bridge process) drains the rings and keeps
+everything that must be unified - duplicate suppression, throttling,
+accumulated state, the AIS vessel registry and the MQTT publisher - so
+Home Assistant sees the same behaviour as in single-process mode.
+
+Records are marshalled tuples of plain values:
+
+    (kind, arrival monotonic time, received_at, fields, raw or None,
+     ingress interface or None)
+
+where ``fields`` holds the non-empty NMEAData fields (RECORD_NMEA) or the
+decoded AIS fields (RECORD_AIS). The raw sentence and ingress interface
+are only sent when the coordinator needs them for duplicate suppression.
+"""
+
+import asyncio
+import logging
+import marshal
+import multiprocessing
+import multiprocessing.synchronize
+import signal
+import struct
+import time
+from multiprocessing import shared_memory
+from typing import Any, Optional
+
+from .ais_decoder import AISDecoder, decode_fields
+from .nmea_parser import parse_sentence
+from .rates import SENTENCE_TYPE, SOURCE, sentence_formatter
+from .replay import ReplayListener
+from .runtime import select_event_loop, setup_logging
+from .serial_listener import SerialListener
+from .sources import source_type, sources_of_type
+from .tcp_listener import TCPListener
+from .udp_listener import DEFAULT_BATCH_SIZE, ReceivedSentence, UDPListener
+
+logger = logging.getLogger(__name__)
+
+# Record kinds
+RECORD_NMEA = 0
+RECORD_AIS = 1
+RECORD_STATS = 2
+
+# Group for enabled sources not listed in workers.groups
+DEFAULT_GROUP = "default"
+
+# Shared memory per worker ring
+DEFAULT_RING_BYTES = 1 << 20
+
+# Seconds between worker stats records (and parent liveness checks)
+STATS_INTERVAL = 1.0
+
+# Coordinator sleep when every ring is empty
+POLL_INTERVAL = 0.005
+
+# Ring header: bytes written, bytes read, data capacity
+_HEADER = struct.Struct("=QQQ")
+_COUNTER = struct.Struct("=Q")
+_LENGTH = struct.Struct("=I")
+_WRAP = 0xFFFFFFFF
+
+# Returned by SharedRing.get() while the producer holds the ring lock
+BUSY = object()
+
+
+class SharedRing:
+    """Single-producer, single-consumer byte ring in shared memory.
+
+    The header holds two free-running counters - bytes written (head) and
+    bytes read (tail) - followed by the data area. Each record is a 4-byte
+    length and the payload; a record that would straddle the end of the
+    area is written at the start instead, after a wrap marker. The
+    producer only ever stores the head and the consumer the tail.
+
+    Plain stores to shared memory are not ordered across cores on weakly
+    ordered CPUs (e.g. ARM), so a consumer could see a new head before
+    the payload it covers. Both sides therefore hold a process-shared
+    lock while touching the ring; its acquire and release are memory
+    barriers, so each side sees the other's data before its counter.
+    The consumer never waits for the lock: a producer killed while holding
+    it would otherwise block the coordinator's event loop for good.
+    """
+
+    def __init__(
+        self,
+        shm: shared_memory.SharedMemory,
+        owner: bool,
+        lock: multiprocessing.synchronize.Lock,
+    ):
+        """Wrap a shared memory block; use create() or attach()."""
+        self._shm = shm
+        self._owner = owner
+        self.lock = lock
+        self._buf = shm.buf
+        self.capacity = _HEADER.unpack_from(self._buf, 0)[2]
+        self.name = shm.name
+        # Records refused because the ring was full
+        self.dropped = 0
+        # Set by the consumer once the producer died holding the lock
+        self.dead = False
+
+    @classmethod
+    def create(
+        cls,
+        size: int = DEFAULT_RING_BYTES,
+        context: Optional[multiprocessing.context.BaseContext] = None,
+    ) -> "SharedRing":
+        """Create a new ring with ``size`` bytes of data area.
+
+        Args:
+            size: Bytes of data area.
+            context: Multiprocessing context the attaching process is
+                started with, used to create the ring's lock.
+        """
+        shm = shared_memory.SharedMemory(create=True, size=_HEADER.size + size)
+        _HEADER.pack_into(shm.buf, 0, 0, 0, size)
+        lock = (context or multiprocessing.get_context()).Lock()
+        return cls(shm, owner=True, lock=lock)
+
+    @classmethod
+    def attach(cls, name: str, lock: multiprocessing.synchronize.Lock) -> "SharedRing":
+        """Attach to a ring created by another process.
+
+        Args:
+            name: Shared memory name of the ring.
+            lock: The creating ring's ``lock``.
+        """
+        return cls(shared_memory.SharedMemory(name=name), owner=False, lock=lock)
+
+    def put(self, payload: bytes) -> bool:
+        """Append a record (producer side).
+
+        Returns:
+            False if the ring is full and the record was dropped.
+        """
+        with self.lock:
+            return self._put(payload)
+
+    def get(self) -> Any:
+        """Take the oldest record (consumer side) without blocking.
+
+        Returns:
+            The record, None if the ring is empty, or BUSY if the producer
+            holds the lock.
+        """
+        if not self.lock.acquire(block=False):
+            return BUSY
+        try:
+            return self._get()
+        finally:
+            self.lock.release()
+
+    def _put(self, payload: bytes) -> bool:
+        buf = self._buf
+        capacity = self.capacity
+        head = _COUNTER.unpack_from(buf, 0)[0]
+        tail = _COUNTER.unpack_from(buf, 8)[0]
+        size = _LENGTH.size + len(payload)
+
+        pos = head % capacity
+        skip = capacity - pos if pos + size > capacity else 0
+        if size > capacity or head + skip + size - tail > capacity:
+            self.dropped += 1
+            return False
+
+        if skip:
+            if skip >= _LENGTH.size:
+                _LENGTH.pack_into(buf, _HEADER.size + pos, _WRAP)
+            pos = 0
+        start = _HEADER.size + pos
+        _LENGTH.pack_into(buf, start, len(payload))
+        buf[start + _LENGTH.size : start + size] = payload
+        _COUNTER.pack_into(buf, 0, head + skip + size)
+        return True
+
+    def _get(self) -> Optional[bytes]:
+        buf = self._buf
+        capacity = self.capacity
+        head = _COUNTER.unpack_from(buf, 0)[0]
+        tail = _COUNTER.unpack_from(buf, 8)[0]
+        if tail == head:
+            return None
+
+        pos = tail % capacity
+        if (
+            capacity - pos < _LENGTH.size
+            or _LENGTH.unpack_from(buf, _HEADER.size + pos)[0] == _WRAP
+        ):
+            tail += capacity - pos
+            pos = 0
+        start = _HEADER.size + pos
+        length = _LENGTH.unpack_from(buf, start)[0]
+        payload = bytes(buf[start + _LENGTH.size : start + _LENGTH.size + length])
+        _COUNTER.pack_into(buf, 8, tail + _LENGTH.size + length)
+        return payload
+
+    def close(self):
+        """Detach from the ring, removing it if this process created it."""
+        self._buf = None
+        self._shm.close()
+        if self._owner:
+            self._shm.unlink()
+
+
+def source_groups(config: dict) -> dict[str, list[dict]]:
+    """Assign enabled sources to worker groups.
+
+    Args:
+        config: Full configuration dictionary.
+
+    Returns:
+        Dict of group name -> source dicts, omitting empty groups.
+        Sources not listed in ``workers.groups`` go to the default group.
+        Capture sources always run in the main process and are skipped.
+    """
+    groups = config.get("workers", {}).get("groups") or {}
+    group_of = {name: group for group, names in groups.items() for name in names}
+
+    assigned: dict[str, list[dict]] = {}
+    for source in config.get("udp", {}).get("sources", []):
+        if not source.get("enabled", True) or source_type(source) == "capture":
+            continue
+        group = group_of.get(source["name"], DEFAULT_GROUP)
+        assigned.setdefault(group, []).append(source)
+    return assigned
+
+
+class SourceWorker:
+    """Receives, parses and decodes one source group inside a worker."""
+
+    def __init__(self, config: dict, group: str, ring: SharedRing):
+        """Initialize source worker.
+
+        Args:
+            config: Full configuration dictionary.
+            group: Name of the source group this worker runs.
+            ring: Ring to push records into.
+        """
+        self.config = config
+        self.group = group
+        self.ring = ring
+        self.sources = source_groups(config).get(group, [])
+        self.udp_listener = UDPListener()
+        self.tcp_listener = TCPListener()
+        self.serial_listener = SerialListener()
+        self.replay_listener = ReplayListener()
+
+        # Multipart AIS assembly only; the vessel registry is the coordinator's
+        self._ais = AISDecoder()
+        self._ais_throttle = config.get("sensors", {}).get("throttle", {}).get("ais", 10)
+        self._last_ais = 0.0
+        # The coordinator needs the raw sentence to suppress duplicates
+        self._send_raw = config.get("dedup", {}).get("enabled", False)
+
+        self.stats = {
+            "sentences_received": 0,
+            "sentences_parsed": 0,
+            "records": 0,
+            "ring_full": 0,
+        }
+        # Cumulative per-source and per-type counts for the rate meters
+        self._count_rates = config.get("diagnostics", {}).get("enabled", False)
+        self.source_counts: dict[str, int] = {}
+        self.type_counts: dict[str, int] = {}
+        self._stop_event: Optional[asyncio.Event] = None
+
+    def on_sentence(
+        self,
+        source_name: str,
+        sender_ip: str,
+        raw: str,
+        received_at: Optional[float] = None,
+        interface: Optional[str] = None,
+        destination: Optional[str] = None,
+    ):
+        """Parse one sentence and push the resulting record(s)."""
+        stats = self.stats
+        stats["sentences_received"] += 1
+        if self._count_rates:
+            counts = self.source_counts
+            counts[source_name] = counts.get(source_name, 0) + 1
+            sentence_type = sentence_formatter(raw)
+            counts = self.type_counts
+            counts[sentence_type] = counts.get(sentence_type, 0) + 1
+        data = parse_sentence(raw, verified=True)
+        if data is None:
+            return
+        stats["sentences_parsed"] += 1
+
+        now = time.monotonic()
+        if received_at is not None:
+            now -= max(0.0, time.time() - received_at)
+        raw_or_none = raw if self._send_raw else None
+        interface_or_none = interface if self._send_raw else None
+
+        if data.sentence_type == "AIS" and data.ais_messages:
+            # Same sentence-level throttle as the coordinator applies, so
+            # throttled messages are never decoded
+            if now - self._last_ais < self._ais_throttle:
+                return
+            self._last_ais = now
+            for msg in data.ais_messages:
+                parts = self._ais.assemble(msg)
+                if parts is None:
+                    continue
+                fields = decode_fields(*parts)
+                if fields is not None:
+                    self._put(
+                        (
+                            RECORD_AIS,
+                            now,
+                            received_at,
+                            fields,
+                            raw_or_none,
+                            interface_or_none,
+                        )
+                    )
+            return
+
+        fields = {
+            key: value
+            for key, value in vars(data).items()
+            if value is not None and key != "ais_messages"
+        }
+        self._put(
+            (RECORD_NMEA, now, received_at, fields, raw_or_none, interface_or_none)
+        )
+
+    def on_batch(self, batch: list[ReceivedSentence]):
+        """Batch callback - parse every sentence in the batch."""
+        on_sentence = self.on_sentence
+        for item in batch:
+            on_sentence(*item)
+
+    def _put(self, record: tuple):
+        if self.ring.put(marshal.dumps(record)):
+            self.stats["records"] += 1
+        else:
+            self.stats["ring_full"] += 1
+
+    def _push_stats(self):
+        stats = dict(self.stats)
+        stats["filtered"] = (
+            self.udp_listener.sentences_filtered
+            + self.tcp_listener.sentences_filtered
+            + self.serial_listener.sentences_filtered
+        )
+        stats["invalid"] = (
+            self.udp_listener.sentences_invalid
+            + self.tcp_listener.sentences_invalid
+            + self.serial_listener.sentences_invalid
+        )
+        stats["rate_limited"] = (
+            self.udp_listener.sentences_rate_limited
+            + self.tcp_listener.sentences_rate_limited
+            + self.serial_listener.sentences_rate_limited
+        )
+        stats["kernel_drops"] = self.udp_listener.kernel_drops()
+        stats["rate_counts"] = {
+            SOURCE: self.source_counts,
+            SENTENCE_TYPE: self.type_counts,
+        }
+        self.ring.put(marshal.dumps((RECORD_STATS, 0.0, None, stats, self.group)))
+
+    async def run(self):
+        """Run the group's sources until stopped or the parent exits."""
+        udp_config = self.config.get("udp", {})
+        self.udp_listener.set_callback(self.on_sentence)
+        self.tcp_listener.set_callback(self.on_sentence)
+        self.serial_listener.set_callback(self.on_sentence)
+        if udp_config.get("ingest_mode", "datagram") == "batch":
+            self.udp_listener.set_batch_callback(self.on_batch)
+            self.serial_listener.set_batch_callback(self.on_batch)
+        self.replay_listener.set_batch_callback(self.on_batch)
+
+        bind_address = udp_config.get("bind_address", "0.0.0.0")
+        await self.udp_listener.start(
+            self.sources,
+            bind_address,
+            batch_size=udp_config.get("batch_size", DEFAULT_BATCH_SIZE),
+        )
+        await self.tcp_listener.start(
+            sources_of_type(self.sources, "tcp-client", "tcp-server"), bind_address
+        )
+        await self.serial_listener.start(sources_of_type(self.sources, "serial"))
+        await self.replay_listener.start(
+            sources_of_type(self.sources, "replay"),
+            sources_of_type(udp_config.get("sources", []), "udp"),
+        )
+
+        loop = asyncio.get_running_loop()
+        self._stop_event = asyncio.Event()
+        loop.add_signal_handler(signal.SIGTERM, self._stop_event.set)
+        parent = multiprocessing.parent_process()
+        logger.info(
+            "Worker [%s] running %d source(s)", self.group, len(self.sources)
+        )
+
+        try:
+            while not self._stop_event.is_set():
+                try:
+                    await asyncio.wait_for(self._stop_event.wait(), STATS_INTERVAL)
+                except asyncio.TimeoutError:
+                    pass
+                self._push_stats()
+                if parent is not None and not parent.is_alive():
+                    logger.warning("Worker [%s] lost its parent, exiting", self.group)
+                    break
+        finally:
+            await self.udp_listener.stop()
+            await self.tcp_listener.stop()
+            await self.serial_listener.stop()
+            await self.replay_listener.stop()
+
+
+def run_worker(
+    config: dict,
+    group: str,
+    ring_name: str,
+    ring_lock: multiprocessing.synchronize.Lock,
+):
+    """Worker process entry point.
+
+    Args:
+        config: Full configuration dictionary.
+        group: Source group to run.
+        ring_name: Shared memory name of the group's ring.
+        ring_lock: Lock shared with the coordinator's end of the ring.
+    """
+    setup_logging(config)
+    # Ctrl+C goes to the whole process group; the coordinator stops us
+    signal.signal(signal.SIGINT, signal.SIG_IGN)
+
+    ring = SharedRing.attach(ring_name, ring_lock)
+    worker = SourceWorker(config, group, ring)
+    _, loop_factory = select_event_loop(
+        config.get("runtime", {}).get("event_loop", "auto")
+    )
+    try:
+        with asyncio.Runner(loop_factory=loop_factory) as runner:
+            runner.run(worker.run())
+    except Exception as e:
+        logger.error("Worker [%s] failed: %s", group, e, exc_info=True)
+        raise
+    finally:
+        ring.close()
+
+
+class WorkerPool:
+    """Starts one worker process per source group and drains their rings."""
+
+    def __init__(self, config: dict):
+        """Initialize worker pool.
+
+        Args:
+            config: Full configuration dictionary.
+        """
+        self.config = config
+        self.ring_bytes = config.get("workers", {}).get("ring_bytes", DEFAULT_RING_BYTES)
+        self._context = multiprocessing.get_context("spawn")
+        self._processes: dict[str, multiprocessing.process.BaseProcess] = {}
+        self._rings: dict[str, SharedRing] = {}
+        # Group name -> latest stats reported by its worker
+        self.stats: dict[str, dict] = {}
+        self._reported_exits: set[str] = set()
+        # (group, meter kind, name) -> cumulative count already taken
+        self._counts_taken: dict[tuple[str, str, str], int] = {}
+
+    def start(self):
+        """Spawn a worker for every non-empty source group."""
+        for group, sources in source_groups(self.config).items():
+            ring = SharedRing.create(self.ring_bytes, self._context)
+            process = self._context.Process(
+                target=run_worker,
+                args=(self.config, group, ring.name, ring.lock),
+                name=f"nmea-worker-{group}",
+                daemon=True,
+            )
+            process.start()
+            self._rings[group] = ring
+            self._processes[group] = process
+            logger.info(
+                "Started worker [%s] (pid %d): %s",
+                group,
+                process.pid,
+                ", ".join(s["name"] for s in sources),
+            )
+
+    def read(self, max_records: int) -> list[tuple]:
+        """Take up to ``max_records`` data records from all rings.
+
+        Stats records are consumed here and kept in ``stats``.
+        """
+        records: list[tuple] = []
+        for group, ring in self._rings.items():
+            if ring.dead:
+                continue
+            get = ring.get
+            while len(records) < max_records:
+                payload = get()
+                if payload is BUSY:
+                    self._check_ring(group, ring)
+                    break
+                if payload is None:
+                    break
+                record = marshal.loads(payload)
+                if record[0] == RECORD_STATS:
+                    self.stats[record[4]] = record[3]
+                else:
+                    records.append(record)
+        return records
+
+    def _check_ring(self, group: str, ring: SharedRing):
+        """Give up on a ring whose lock is held by a worker that has exited.
+
+        The lock of a process killed while holding it is never released,
+        so nothing more can be read from the ring.
+        """
+        process = self._processes.get(group)
+        if process is None or process.exitcode is None:
+            return
+        if ring.lock.acquire(block=False):
+            # Released just now; the worker exited cleanly
+            ring.lock.release()
+            return
+        ring.dead = True
+        logger.error(
+            "Worker [%s] exited with code %s holding its ring lock; "
+            "no more records will be read from it",
+            group,
+            process.exitcode,
+        )
+
+    def check(self):
+        """Log workers that have exited unexpectedly."""
+        for group, process in self._processes.items():
+            if process.exitcode is not None and group not in self._reported_exits:
+                self._reported_exits.add(group)
+                logger.error(
+                    "Worker [%s] exited with code %s", group, process.exitcode
+                )
+
+    def totals(self) -> dict[str, int]:
+        """Sum the numeric counters reported by all workers."""
+        totals: dict[str, int] = {}
+        for stats in self.stats.values():
+            for key, value in stats.items():
+                if isinstance(value, int):
+                    totals[key] = totals.get(key, 0) + value
+        return totals
+
+    def take_counts(self) -> dict[tuple[str, str], int]:
+        """Get rate meter counts reported by the workers since the last call.
+
+        Returns:
+            Dict of (meter kind, name) -> sentences counted.
+        """
+        counts: dict[tuple[str, str], int] = {}
+        for group, stats in self.stats.items():
+            for kind, totals in stats.get("rate_counts", {}).items():
+                for name, total in totals.items():
+                    key = (kind, name)
+                    seen = self._counts_taken.get((group, kind, name), 0)
+                    self._counts_taken[(group, kind, name)] = total
+                    counts[key] = counts.get(key, 0) + total - seen
+        return counts
+
+    def kernel_drops(self) -> dict[str, int]:
+        """Kernel drop counts per source as last reported by the workers."""
+        drops: dict[str, int] = {}
+        for stats in self.stats.values():
+            drops.update(stats.get("kernel_drops", {}))
+        return drops
+
+    @property
+    def active(self) -> bool:
+        """Whether any worker is running."""
+        return any(p.is_alive() for p in self._processes.values())
+
+    def stop(self, timeout: float = 5.0):
+        """Stop all workers and release their rings."""
+        for process in self._processes.values():
+            if process.is_alive():
+                process.terminate()
+        for group, process in self._processes.items():
+            process.join(timeout)
+            if process.is_alive():
+                logger.warning("Worker [%s] did not stop, killing it", group)
+                process.kill()
+                process.join()
+        self._processes.clear()
+        for ring in self._rings.values():
+            ring.close()
+        self._rings.clear()
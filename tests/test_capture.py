@@ -0,0 +1,214 @@
+"""Tests for raw datagram capture."""
+
+import asyncio
+import calendar
+import socket
+import time
+
+from nmea_mqtt_bridge.capture import (
+    FILE_MAGIC,
+    CaptureListener,
+    CaptureWriter,
+    SegmentWriter,
+    read_segment,
+)
+from nmea_mqtt_bridge.workers import source_groups
+
+SENDER = socket.inet_aton("172.31.3.7")
+SOUNDER_PACKET = bytes(range(256)) * 3 + bytes(100)  # 868 bytes
+
+
+class TestSegmentWriter:
+    def test_round_trip(self, tmp_path):
+        writer = SegmentWriter(tmp_path, "sounder", segment_bytes=1 << 16)
+        writer.write(1_700_000_000_123_456_789, SENDER, 10026, SOUNDER_PACKET)
+        writer.write(1_700_000_000_200_000_000, SENDER, 10026, b"")
+        writer.close()
+
+        records = list(read_segment(writer.path))
+        assert [r.payload for r in records] == [SOUNDER_PACKET, b""]
+        assert records[0].sender == "172.31.3.7"
+        assert records[0].port == 10026
+        assert abs(records[0].timestamp - 1_700_000_000.123456789) < 1e-6
+
+    def test_trimmed_on_close(self, tmp_path):
+        writer = SegmentWriter(tmp_path, "radar", segment_bytes=1 << 16)
+        writer.write(1, SENDER, 10024, b"abc")
+        writer.flush()
+        assert writer.path.stat().st_size == 1 << 16
+        writer.close()
+        assert writer.path.stat().st_size == len(FILE_MAGIC) + 16 + 3
+
+    def test_preallocated_segment_readable(self, tmp_path):
+        writer = SegmentWriter(tmp_path, "radar", segment_bytes=1 << 16)
+        writer.write(1, SENDER, 10024, b"abc")
+        writer.flush()
+        # As left by a crash: still padded with zeros
+        assert [r.payload for r in read_segment(writer.path)] == [b"abc"]
+        writer.close()
+
+    def test_rotates_by_size(self, tmp_path):
+        writer = SegmentWriter(tmp_path, "sounder", segment_bytes=2048)
+        for i in range(5):
+            writer.write(i + 1, SENDER, 10026, SOUNDER_PACKET)
+        writer.close()
+
+        segments = sorted(tmp_path.glob("sounder-*.cap"))
+        assert writer.segments == len(segments) == 3
+        assert [len(list(read_segment(p))) for p in segments] == [2, 2, 1]
+
+    def test_oversized_record_gets_own_segment(self, tmp_path):
+        writer = SegmentWriter(tmp_path, "sounder", segment_bytes=512)
+        writer.write(1, SENDER, 10026, SOUNDER_PACKET)
+        writer.write(2, SENDER, 10026, SOUNDER_PACKET)
+        writer.close()
+        assert writer.segments == 2
+
+    def test_max_segments(self, tmp_path):
+        writer = SegmentWriter(tmp_path, "sounder", segment_bytes=1024, max_segments=2)
+        for i in range(5):
+            writer.write(i + 1, SENDER, 10026, SOUNDER_PACKET)
+        writer.close()
+
+        segments = sorted(tmp_path.glob("sounder-*.cap"))
+        assert len(segments) == 2
+        assert segments[-1] == writer.path
+
+    def test_segment_names_use_utc(self, tmp_path, monkeypatch):
+        monkeypatch.setenv("TZ", "EST+05")
+        time.tzset()
+        try:
+            before = time.time()
+            writer = SegmentWriter(tmp_path, "sounder")
+            writer.write(1, SENDER, 10026, SOUNDER_PACKET)
+            writer.close()
+        finally:
+            monkeypatch.undo()
+            time.tzset()
+        stamp = writer.path.name[len("sounder-") : len("sounder-YYYYmmdd-HHMMSS")]
+        named = calendar.timegm(time.strptime(stamp, "%Y%m%d-%H%M%S"))
+        assert abs(named - before) < 5
+
+    def test_max_segments_keeps_other_sources(self, tmp_path):
+        other = SegmentWriter(tmp_path, "radar-2")
+        other.write(1, SENDER, 10024, SOUNDER_PACKET)
+        other.close()
+
+        writer = SegmentWriter(tmp_path, "radar", segment_bytes=1024, max_segments=1)
+        for i in range(3):
+            writer.write(i + 1, SENDER, 10024, SOUNDER_PACKET)
+        writer.close()
+        assert other.path.exists()
+        assert len(list(tmp_path.glob("radar-2-*.cap"))) == 1
+
+    def test_restart_does_not_overwrite(self, tmp_path):
+        first = SegmentWriter(tmp_path, "sounder")
+        first.write(1, SENDER, 10026, b"first")
+        first.close()
+        # A restart in the same second starts counting from 1 again
+        second = SegmentWriter(tmp_path, "sounder")
+        second.write(2, SENDER, 10026, SOUNDER_PACKET)
+        second.close()
+
+        assert first.path != second.path
+        assert [r.payload for r in read_segment(first.path)] == [b"first"]
+
+
+class TestCaptureWriter:
+    def test_drops_when_behind(self, tmp_path):
+        writer = CaptureWriter(SegmentWriter(tmp_path, "radar"), max_pending=2)
+        # Not started yet, so nothing drains the queue
+        assert writer.submit(1, SENDER, 10024, b"a")
+        assert writer.submit(2, SENDER, 10024, b"b")
+        assert not writer.submit(3, SENDER, 10024, b"c")
+        assert writer.dropped == 1
+
+        writer.start()
+        writer.stop()
+        assert [r.payload for r in read_segment(writer.segments.path)] == [b"a", b"b"]
+
+
+class TestCaptureListener:
+    def test_captures_datagrams(self, tmp_path):
+        with socket.socket(socket.AF_INET, socket.SOCK_DGRAM) as s:
+            s.bind(("127.0.0.1", 0))
+            port = s.getsockname()[1]
+
+        async def run():
+            listener = CaptureListener()
+            await listener.start(
+                [{"name": "sounder", "port": port, "directory": str(tmp_path)}],
+                "127.0.0.1",
+            )
+            assert listener.active
+            with socket.socket(socket.AF_INET, socket.SOCK_DGRAM) as tx:
+                tx.sendto(SOUNDER_PACKET, ("127.0.0.1", port))
+                tx.sendto(b"\x00\x01binary", ("127.0.0.1", port))
+            deadline = time.monotonic() + 2
+            while listener.stats["sounder"]["datagrams"] < 2:
+                assert time.monotonic() < deadline
+                await asyncio.sleep(0.01)
+            stats = listener.stats["sounder"]
+            await listener.stop()
+            return stats
+
+        stats = asyncio.run(run())
+        assert stats["bytes"] == len(SOUNDER_PACKET) + 8
+        (segment,) = tmp_path.glob("sounder-*.cap")
+        records = list(read_segment(segment))
+        assert [r.payload for r in records] == [SOUNDER_PACKET, b"\x00\x01binary"]
+        assert records[0].sender == "127.0.0.1"
+
+    def test_stop_joins_writers_off_the_loop(self, tmp_path, monkeypatch):
+        ports = []
+        for _ in range(2):
+            with socket.socket(socket.AF_INET, socket.SOCK_DGRAM) as s:
+                s.bind(("127.0.0.1", 0))
+                ports.append(s.getsockname()[1])
+        stop = CaptureWriter.stop
+
+        def slow_stop(self, timeout=5.0):
+            time.sleep(0.2)
+            stop(self, timeout)
+
+        monkeypatch.setattr(CaptureWriter, "stop", slow_stop)
+
+        async def run():
+            listener = CaptureListener()
+            await listener.start(
+                [
+                    {"name": f"s{i}", "port": port, "directory": str(tmp_path)}
+                    for i, port in enumerate(ports)
+                ],
+                "127.0.0.1",
+            )
+            ticks = 0
+
+            async def tick():
+                nonlocal ticks
+                while True:
+                    ticks += 1
+                    await asyncio.sleep(0.01)
+
+            ticker = asyncio.create_task(tick())
+            start = time.monotonic()
+            await listener.stop()
+            elapsed = time.monotonic() - start
+            ticker.cancel()
+            return ticks, elapsed
+
+        ticks, elapsed = asyncio.run(run())
+        # The loop kept running, and both writers stopped together
+        assert ticks > 5
+        assert elapsed < 0.35
+
+    def test_not_assigned_to_workers(self):
+        config = {
+            "udp": {
+                "sources": [
+                    {"name": "nav", "port": 10021},
+                    {"name": "radar", "type": "capture", "port": 10024, "directory": "x"},
+                ]
+            }
+        }
+        assert [s["name"] for s in source_groups(config)["default"]] == ["nav"]
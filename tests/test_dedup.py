@@ -0,0 +1,51 @@
+"""Tests for cross-feed duplicate suppression."""
+
+from nmea_mqtt_bridge.dedup import DuplicateFilter, sentence_key
+
+
+class TestSentenceKey:
+    def test_talker_and_checksum_ignored(self):
+        assert sentence_key("$GPHDT,18.2,T*0E") == sentence_key("$IIHDT,18.2,T*19")
+
+    def test_different_formatter(self):
+        assert sentence_key("$GPHDT,18.2,T*0E") != sentence_key("$GPHDG,18.2,T*0E")
+
+    def test_proprietary_keeps_manufacturer(self):
+        assert sentence_key("$PFEC,GPatt*00") != sentence_key("$PXYZ,GPatt*00")
+
+
+class TestDuplicateFilter:
+    def test_copy_within_window_dropped(self):
+        f = DuplicateFilter(window=1.0)
+        assert not f.is_duplicate("$GPHDT,18.2,T*0E", now=10.0)
+        assert f.is_duplicate("$IIHDT,18.2,T*19", now=10.5)
+        assert f.hits == 1
+        assert f.hit_rate == 0.5
+
+    def test_copy_after_window_passes(self):
+        f = DuplicateFilter(window=1.0)
+        assert not f.is_duplicate("$GPHDT,18.2,T*0E", now=10.0)
+        assert not f.is_duplicate("$GPHDT,18.2,T*0E", now=11.5)
+
+    def test_repeat_does_not_extend_window(self):
+        f = DuplicateFilter(window=1.0)
+        assert not f.is_duplicate("$GPHDT,18.2,T*0E", now=10.0)
+        assert f.is_duplicate("$GPHDT,18.2,T*0E", now=10.9)
+        assert not f.is_duplicate("$GPHDT,18.2,T*0E", now=11.1)
+
+    def test_bounded(self):
+        f = DuplicateFilter(window=60.0, max_entries=2)
+        for i in range(5):
+            f.is_duplicate(f"$GPHDT,{i},T*00", now=10.0)
+        assert len(f._seen) == 2
+        assert not f.is_duplicate("$GPHDT,0,T*00", now=10.0)
+
+    def test_cross_interface_only(self):
+        f = DuplicateFilter(window=1.0, cross_interface_only=True)
+        assert not f.is_duplicate("$GPHDT,18.2,T*0E", now=10.0, interface="eth4")
+        # Same reading again on the same network is a fresh reading
+        assert not f.is_duplicate("$GPHDT,18.2,T*0E", now=10.1, interface="eth4")
+        # The mirrored VLAN copy is suppressed
+        assert f.is_duplicate("$IIHDT,18.2,T*19", now=10.2, interface="eth5")
+        # Untagged sentences match regardless of interface
+        assert f.is_duplicate("$GPHDT,18.2,T*0E", now=10.3)
@@ -0,0 +1,99 @@
+"""Tests for early per-source filters."""
+
+import pytest
+
+from nmea_mqtt_bridge.filters import IngressFilter, SenderFilter, SentenceTypeFilter
+
+
+class TestSenderFilter:
+    def test_default_uses_source_name(self):
+        f = SenderFilter("nav")
+        assert not f.active
+        assert f.resolve("172.31.252.1") == "nav"
+
+    def test_sub_source_names(self):
+        f = SenderFilter("nav", names={"172.31.252.1": "gps"})
+        assert f.resolve("172.31.252.1") == "gps"
+        assert f.resolve("172.31.92.1") == "nav"
+
+    def test_allow_list(self):
+        f = SenderFilter("nav", allow=["172.31.252.1", "192.168.252.0/24"])
+        assert f.resolve("172.31.252.1") == "nav"
+        assert f.resolve("192.168.252.100") == "nav"
+        assert f.resolve("172.31.24.3") is None
+
+    def test_deny_list(self):
+        f = SenderFilter("nav", deny=["172.31.24.3"])
+        assert f.resolve("172.31.24.3") is None
+        assert f.resolve("172.31.92.1") == "nav"
+
+    def test_deny_wins_over_allow(self):
+        f = SenderFilter("nav", allow=["172.31.0.0/16"], deny=["172.31.24.3"])
+        assert f.resolve("172.31.24.3") is None
+        assert f.resolve("172.31.92.1") == "nav"
+
+    def test_invalid_entry(self):
+        with pytest.raises(ValueError):
+            SenderFilter("nav", allow=["not-an-ip"])
+
+
+class TestIngressFilter:
+    def test_inactive_by_default(self):
+        f = IngressFilter("nav")
+        assert not f.active
+        assert f.resolve("eth4", "broadcast") == "nav"
+
+    def test_interfaces_and_destinations(self):
+        f = IngressFilter("nav", interfaces=["eth4"], destinations=["broadcast"])
+        assert f.resolve("eth4", "broadcast") == "nav"
+        assert f.resolve("eth5", "broadcast") is None
+        assert f.resolve("eth4", "multicast") is None
+
+    def test_names_and_untagged(self):
+        f = IngressFilter("nav", names={"eth5": "mirrored"}, interfaces=["eth4"])
+        assert f.resolve(None, None) == "nav"
+        assert f.resolve("eth5", "unicast") is None
+        assert IngressFilter("nav", names={"eth5": "mirrored"}).resolve(
+            "eth5", "unicast"
+        ) == "mirrored"
+
+
+class TestSentenceTypeFilter:
+    def test_no_rules_allows_all(self):
+        f = SentenceTypeFilter()
+        assert not f.active
+        assert f.allows(b"$GPGSA,A,3*00")
+
+    def test_formatter_deny(self):
+        f = SentenceTypeFilter(deny=["GSA", "RMC"])
+        assert not f.allows(b"$GPGSA,A,3,,,*00")
+        assert not f.allows(b"$IIRMC,1,2*00")
+        assert f.allows(b"$GPGGA,232001.00*00")
+
+    def test_proprietary_prefix_deny(self):
+        f = SentenceTypeFilter(deny=["P"])
+        assert not f.allows(b"$PFEC,GPatt,1*00")
+        assert f.allows(b"$GPHDT,18.2,T*0E")
+
+    def test_address_allow(self):
+        f = SentenceTypeFilter(allow=["AIVDM", "AIVDO"])
+        assert f.allows(b"!AIVDM,1,1,,A,x,0*00")
+        assert f.allows(b"!AIVDO,1,1,,,x,0*00")
+        assert not f.allows(b"$GPGGA,1*00")
+
+    def test_allow_and_deny(self):
+        f = SentenceTypeFilter(allow=["GP"], deny=["GSV"])
+        assert f.allows(b"$GPGGA,1*00")
+        assert not f.allows(b"$GPGSV,3,1,11*00")
+        assert not f.allows(b"$IIGGA,1*00")
+
+    def test_memoryview_slice(self):
+        f = SentenceTypeFilter(deny=["GSA"])
+        buf = memoryview(bytearray(b"xx$GPGSA,A,3*00$GPHDT,18.2,T*0E"))
+        assert not f.allows(buf[2:15])
+        assert f.allows(buf[15:])
+
+    def test_address_without_fields(self):
+        f = SentenceTypeFilter(deny=["ARPA"])
+        assert not f.allows(b"$ARPA")
+        assert not f.allows(b"$ARPA,0,0,0032")
@@ -0,0 +1,184 @@
+"""Tests for bytes-level sentence framing."""
+
+import operator
+from functools import reduce
+
+import pytest
+
+from nmea_mqtt_bridge import framing
+from nmea_mqtt_bridge.framing import (
+    SentenceFramer,
+    batch_valid_checksums,
+    has_valid_checksum,
+    xor_checksum,
+)
+
+AIS = b"!AIVDM,1,1,,B,15MwkT1P37G?fl0EJbR0OwT0@MS,0*0E"
+
+
+class TestSentenceFramer:
+    def test_single_sentence(self):
+        framer = SentenceFramer()
+        assert framer.feed("a", b"$GPHDT,18.2,T*0E\r\n") == [b"$GPHDT,18.2,T*0E"]
+
+    def test_multiple_sentences_mixed_line_endings(self):
+        framer = SentenceFramer()
+        data = b"$GPHDT,18.2,T*0E\r\n$GPHDG,11.4,,,6.8,E*0F\n!AIVDM,1,1,,A,x,0*00\r"
+        assert framer.feed("a", data) == [
+            b"$GPHDT,18.2,T*0E",
+            b"$GPHDG,11.4,,,6.8,E*0F",
+            b"!AIVDM,1,1,,A,x,0*00",
+        ]
+
+    def test_strips_non_printable(self):
+        framer = SentenceFramer()
+        data = b"\x00$GPHDT,18.2,\x07T*0E\xff\r\n"
+        assert framer.feed("a", data) == [b"$GPHDT,18.2,T*0E"]
+
+    def test_ignores_non_nmea_lines(self):
+        framer = SentenceFramer()
+        assert framer.feed("a", b"hello\r\n  \r\n") == []
+
+    def test_accepts_memoryview(self):
+        framer = SentenceFramer()
+        data = memoryview(bytearray(b"$GPHDT,18.2,T*0E\r\n"))
+        assert framer.feed("a", data) == [b"$GPHDT,18.2,T*0E"]
+
+    def test_unterminated_complete_sentence_is_emitted(self):
+        framer = SentenceFramer()
+        assert framer.feed("a", b"$GPHDT,18.2,T*0E") == [b"$GPHDT,18.2,T*0E"]
+
+    def test_reassembles_split_sentence(self):
+        framer = SentenceFramer()
+        assert framer.feed("a", b"$GPHDT,18.2,T*0E\r\n$GPGGA,2320") == [
+            b"$GPHDT,18.2,T*0E"
+        ]
+        assert framer.feed("a", b"01.00,,,,,0,,,,,,,,*00\r\n") == [
+            b"$GPGGA,232001.00,,,,,0,,,,,,,,*00"
+        ]
+
+    def test_carry_is_per_sender(self):
+        framer = SentenceFramer()
+        framer.feed("a", b"$GPGGA,2320")
+        assert framer.feed("b", b"01.00*00\r\n") == []
+        assert framer.feed("a", b"01.00*00\r\n") == [b"$GPGGA,232001.00*00"]
+
+    def test_carry_flushed_when_next_datagram_starts_sentence(self):
+        framer = SentenceFramer()
+        assert framer.feed("a", b"$SDDPT,0036.34,000.00") == []
+        assert framer.feed("a", b"$GPHDT,18.2,T*0E\r\n") == [
+            b"$SDDPT,0036.34,000.00",
+            b"$GPHDT,18.2,T*0E",
+        ]
+
+    def test_oversized_fragment_not_carried(self):
+        framer = SentenceFramer(max_carry=10)
+        assert framer.feed("a", b"$GPGGA,232001.00,1635") == [b"$GPGGA,232001.00,1635"]
+        assert framer.feed("a", b"tail*00\r\n") == []
+
+    def test_returns_views_of_input_buffer(self):
+        framer = SentenceFramer()
+        buf = bytearray(b"$GPHDT,18.2,T*0E\r\n")
+        (line,) = framer.feed("a", memoryview(buf))
+        assert isinstance(line, memoryview)
+        assert line.obj is buf
+
+    def test_accept_predicate_runs_before_output(self):
+        framer = SentenceFramer(accept=lambda line: bytes(line[3:6]) != b"HDG")
+        data = b"$GPHDT,18.2,T*0E\r\n$GPHDG,11.4,,,6.8,E*0F\r\n"
+        assert framer.feed("a", data) == [b"$GPHDT,18.2,T*0E"]
+        assert framer.filtered == 1
+
+    def test_verify_checksum(self):
+        framer = SentenceFramer(verify_checksum=True)
+        data = b"$GPHDT,18.2,T*0E\r\n$GPHDT,18.2,T*0F\r\n$SDDPT,0036.34,000.00\r\n"
+        assert framer.feed("a", data) == [b"$GPHDT,18.2,T*0E"]
+        assert framer.invalid == 2
+
+    def test_verify_checksum_without_numpy(self, monkeypatch):
+        monkeypatch.setattr(framing, "np", None)
+        with pytest.raises(ImportError):
+            batch_valid_checksums(AIS, [0], [len(AIS)])
+        framer = SentenceFramer(verify_checksum=True)
+        assert framer.feed("a", b"\r\n".join([AIS] * 20)) == [AIS] * 20
+
+
+class TestChecksum:
+    def test_xor_matches_reference(self):
+        for n in range(0, 300, 7):
+            data = bytes((i * 37 + 11) & 0xFF for i in range(n))
+            assert xor_checksum(data) == reduce(operator.xor, data, 0)
+
+    def test_valid_checksum(self):
+        assert has_valid_checksum(b"$GPHDT,18.2,T*0E")
+        assert has_valid_checksum(b"$GPHDT,18.2,T*0e")
+        assert has_valid_checksum(memoryview(b"!AIVDM,1,1,,B,15MwkT1P37G?fl0EJbR0OwT0@MS,0*0E"))
+
+    def test_invalid_checksum(self):
+        assert not has_valid_checksum(b"$GPHDT,18.2,T*0F")
+        assert not has_valid_checksum(b"$GPHDT,18.2,T*ZZ")
+        assert not has_valid_checksum(b"$GPHDT,18.2,T")
+        assert not has_valid_checksum(b"$*")
+
+
+class TestBatchChecksum:
+    LINES = [
+        b"$GPHDT,18.2,T*0E",
+        b"$GPHDT,18.2,T*0e",
+        b"$GPHDT,18.2,T*0F",
+        b"$GPHDT,18.2,T*ZZ",
+        b"$GPHDT,18.2,T",
+        b"$*",
+        b"$*00",
+        b"$*01",
+        b"!*",
+        AIS,
+        b"$SDDPT,0036.34,000.00",
+    ]
+
+    @pytest.fixture(autouse=True)
+    def numpy(self):
+        return pytest.importorskip("numpy")
+
+    def test_matches_scalar(self):
+        lines = self.LINES * 3
+        data = b"\r\n".join(lines)
+        starts, ends, offset = [], [], 0
+        for line in lines:
+            starts.append(offset)
+            ends.append(offset + len(line))
+            offset += len(line) + 2
+        valid = batch_valid_checksums(memoryview(data), starts, ends)
+        assert valid.tolist() == [has_valid_checksum(line) for line in lines]
+
+    def test_empty(self):
+        assert batch_valid_checksums(b"", [], []).tolist() == []
+
+    def test_framer_validates_burst_in_one_call(self, monkeypatch):
+        calls = []
+
+        def counting(*args):
+            calls.append(args)
+            return batch_valid_checksums(*args)
+
+        monkeypatch.setattr(framing, "batch_valid_checksums", counting)
+        bad = b"!AIVDM,1,1,,B,15MwkT1P37G?fl0EJbR0OwT0@MS,0*0F"
+        burst = b"\r\n".join([AIS, bad] * 20)
+        framer = SentenceFramer(verify_checksum=True)
+        assert framer.feed("a", burst + b"\r\n") == [AIS] * 20
+        assert framer.invalid == 20
+        assert len(calls) == 1
+
+    def test_framer_same_as_scalar(self, monkeypatch):
+        data = b" \r\n".join(self.LINES * 4) + b"\r\nnoise\r\n"
+
+        def feed():
+            framer = SentenceFramer(
+                accept=lambda line: bytes(line[3:6]) != b"DPT", verify_checksum=True
+            )
+            lines = [bytes(line) for line in framer.feed("a", data)]
+            return lines, framer.invalid, framer.filtered
+
+        batched = feed()
+        monkeypatch.setattr(framing, "BATCH_CHECKSUM_MIN", 1000)
+        assert batched == feed()
@@ -0,0 +1,88 @@
+"""Tests for the bounded ingest queue."""
+
+import asyncio
+
+import pytest
+
+from nmea_mqtt_bridge.bridge import NMEABridge
+from nmea_mqtt_bridge.ingest_queue import IngestQueue
+from nmea_mqtt_bridge.udp_listener import ReceivedSentence
+
+
+def _item(source: str, sentence: str) -> ReceivedSentence:
+    return ReceivedSentence(source, "172.31.252.1", sentence)
+
+
+class TestIngestQueue:
+    def test_fifo_drain(self):
+        q = IngestQueue(maxsize=10)
+        q.put_many([_item("a", "$GPHDT,1,T*00"), _item("a", "$GPHDT,2,T*00")])
+        assert [i.sentence for i in q.drain(1)] == ["$GPHDT,1,T*00"]
+        assert [i.sentence for i in q.drain(10)] == ["$GPHDT,2,T*00"]
+        assert len(q) == 0
+        assert q.high_watermark == 2
+
+    def test_drop_oldest(self):
+        q = IngestQueue(maxsize=2)
+        for n in range(3):
+            q.put(_item("a", f"$GPHDT,{n},T*00"))
+        assert [i.sentence for i in q.drain(10)] == ["$GPHDT,1,T*00", "$GPHDT,2,T*00"]
+        assert q.overflows == {"a": 1}
+
+    def test_drop_newest(self):
+        q = IngestQueue(maxsize=2, policies={"a": "drop-newest"})
+        for n in range(3):
+            q.put(_item("a", f"$GPHDT,{n},T*00"))
+        assert [i.sentence for i in q.drain(10)] == ["$GPHDT,0,T*00", "$GPHDT,1,T*00"]
+        assert q.overflows == {"a": 1}
+
+    def test_coalesce_replaces_pending_same_type(self):
+        q = IngestQueue(maxsize=2, policies={"hdg": "coalesce"})
+        q.put(_item("hdg", "$GPHDT,1,T*00"))
+        q.put(_item("nav", "$GPGGA,1*00"))
+        q.put(_item("hdg", "$GPHDT,2,T*00"))
+        assert [i.sentence for i in q.drain(10)] == ["$GPHDT,2,T*00", "$GPGGA,1*00"]
+        assert q.coalesced == 1
+
+    def test_coalesce_without_pending_drops_oldest(self):
+        q = IngestQueue(maxsize=1, policies={"hdg": "coalesce"})
+        q.put(_item("nav", "$GPGGA,1*00"))
+        q.put(_item("hdg", "$GPHDT,1,T*00"))
+        assert [i.sentence for i in q.drain(10)] == ["$GPHDT,1,T*00"]
+
+    def test_unknown_policy(self):
+        with pytest.raises(ValueError):
+            IngestQueue(policies={"a": "drop-random"})
+
+    def test_wait_wakes_on_put(self):
+        async def run():
+            q = IngestQueue()
+            waiter = asyncio.create_task(q.wait())
+            await asyncio.sleep(0)
+            assert not waiter.done()
+            q.put(_item("a", "$GPHDT,1,T*00"))
+            await asyncio.wait_for(waiter, 1)
+
+        asyncio.run(run())
+
+
+def test_sub_sources_inherit_overflow_policy():
+    config = {
+        "udp": {
+            "sources": [
+                {
+                    "name": "integrated",
+                    "port": 31000,
+                    "overflow": "coalesce",
+                    "senders": {"172.31.252.1": "gps"},
+                    "interface_names": {"eth5": "mirrored"},
+                },
+                {"name": "ais", "port": 10026},
+            ]
+        }
+    }
+    assert NMEABridge._overflow_policies(config) == {
+        "integrated": "coalesce",
+        "gps": "coalesce",
+        "mirrored": "coalesce",
+    }
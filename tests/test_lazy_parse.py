@@ -0,0 +1,118 @@
+"""Tests for skipping sentences whose sensors are all throttled."""
+
+import pytest
+
+from nmea_mqtt_bridge import bridge as bridge_module
+from nmea_mqtt_bridge.bridge import SENTENCE_SENSORS, SENSOR_THROTTLE_MAP, NMEABridge
+from nmea_mqtt_bridge.mqtt_publisher import SENSOR_DEFINITIONS
+from nmea_mqtt_bridge.threads import new_thread_counters
+
+HDT = "$GPHDT,18.2,T*0E"
+HDT_2 = "$GPHDT,19.0,T*0D"
+GGA = "$GPGGA,232001.00,1635.2474,S,14555.1765,E,1,11,0.70,11.5,M,62.6,M,,*72"
+GSV = "$GPGSV,3,1,11,10,63,137,17,07,61,098,15,05,59,290,20,08,54,157,30*70"
+
+
+class _Recorder:
+    def __init__(self):
+        self.sensors: list[tuple[str, object]] = []
+        self.trackers: list[tuple[float, float, dict]] = []
+
+    def publish_sensor(self, sensor_id, value):
+        self.sensors.append((sensor_id, value))
+
+    def publish_device_tracker(self, lat, lon, **attrs):
+        self.trackers.append((lat, lon, attrs))
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    now = [1000.0]
+    monkeypatch.setattr(bridge_module.time, "monotonic", lambda: now[0])
+    return now
+
+
+def _bridge(**sensors):
+    sensors.setdefault("lazy_parse", True)
+    bridge = NMEABridge({"sensors": sensors})
+    bridge.mqtt_publisher = _Recorder()
+    return bridge
+
+
+def test_sentence_sensors_known():
+    for sensors in SENTENCE_SENSORS.values():
+        assert set(sensors) <= set(SENSOR_DEFINITIONS)
+        assert set(sensors) <= set(SENSOR_THROTTLE_MAP)
+
+
+def test_off_by_default(clock):
+    bridge = NMEABridge({"sensors": {"throttle": {"heading": 2}}})
+    bridge.mqtt_publisher = _Recorder()
+    for _ in range(3):
+        bridge._process_sentence("heading", "10.0.0.1", HDT)
+    assert bridge._stats["sentences_parsed"] == 3
+    assert bridge._stats["sentences_skipped"] == 0
+
+
+def test_throttled_sentences_skipped(clock):
+    bridge = _bridge(throttle={"heading": 2})
+    # 8 Hz for 2.5 s
+    for _ in range(20):
+        bridge._process_sentence("heading", "10.0.0.1", HDT)
+        clock[0] += 0.125
+
+    assert bridge.mqtt_publisher.sensors == [("heading_true", 18.2)] * 2
+    assert bridge._stats["sentences_parsed"] == 2
+    assert bridge._stats["sentences_skipped"] == 18
+
+
+def test_same_publishes_as_without_skipping(clock):
+    feed = [HDT, HDT_2, GGA, GSV] * 50
+
+    def run(lazy):
+        clock[0] = 1000.0
+        bridge = _bridge(lazy_parse=lazy, throttle={"heading": 2, "position": 3})
+        for raw in feed:
+            bridge._process_sentence("nav", "10.0.0.1", raw)
+            clock[0] += 0.05
+        return bridge
+
+    lazy, eager = run(True), run(False)
+    assert lazy.mqtt_publisher.sensors == eager.mqtt_publisher.sensors
+    assert lazy.mqtt_publisher.trackers == eager.mqtt_publisher.trackers
+    assert lazy._stats["sentences_published"] == eager._stats["sentences_published"]
+    assert lazy._stats["sentences_skipped"] > 0
+    assert eager._stats["sentences_skipped"] == 0
+
+
+def test_tracker_uses_latest_skipped_heading(clock):
+    bridge = _bridge(throttle={"heading": 60, "position": 5})
+    bridge._process_sentence("nav", "10.0.0.1", GGA)
+    bridge._process_sentence("nav", "10.0.0.1", HDT)
+    clock[0] += 1
+    bridge._process_sentence("nav", "10.0.0.1", HDT_2)
+    assert bridge._stats["sentences_skipped"] == 1
+
+    clock[0] += 5
+    bridge._process_sentence("nav", "10.0.0.1", GGA)
+    assert bridge.mqtt_publisher.trackers[-1][2]["heading"] == 19.0
+
+
+def test_no_sensor_types_skipped_after_first(clock):
+    bridge = _bridge()
+    for _ in range(3):
+        bridge._process_sentence("nav", "10.0.0.1", GSV)
+    assert bridge._stats["sentences_parsed"] == 1
+    assert bridge._stats["sentences_skipped"] == 2
+
+
+def test_threaded_counts_skips(clock):
+    bridge = NMEABridge(
+        {"runtime": {"source_threads": "on"}, "sensors": {"lazy_parse": True}}
+    )
+    bridge.mqtt_publisher = _Recorder()
+    counters = new_thread_counters()
+    for _ in range(3):
+        bridge._process_sentence_threaded(counters, "nav", "10.0.0.1", HDT)
+    assert counters["sentences_parsed"] == 1
+    assert counters["sentences_skipped"] == 2
@@ -0,0 +1,135 @@
+"""Tests for loop lag monitoring and load shedding."""
+
+import asyncio
+import json
+import time
+
+from nmea_mqtt_bridge.load_shedding import LoadShedder, LoopLagMonitor
+from nmea_mqtt_bridge.mqtt_publisher import MQTTPublisher
+
+GGA = "$GPGGA,232001.00,1635.2474,S,14555.1765,E,1,11,0.70,11.5,M,62.6,M,,*72"
+HDT = "$GPHDT,18.2,T*0E"
+AIS_POSITION = "!AIVDM,1,1,,B,15MwkT1P37G?fl0EJbR0OwT0@MS,0*0E"
+AIS_STATIC_24 = "!AIVDM,1,1,,A,H42O55i18tMET00000000000000,2*6D"
+AIS_STATIC_5 = (
+    "!AIVDM,2,1,3,B,55?MbV02;H;s<HtKR20EHE:0@T4@Dn2222222216L961O5Gf0NSQEp6ClRp8,0*1C",
+    "!AIVDM,2,2,3,B,88888888880,2*27",
+)
+
+
+def _shedder(level: int, **kwargs) -> LoadShedder:
+    shedder = LoadShedder(**kwargs)
+    shedder.level = level
+    return shedder
+
+
+class TestLoadShedderLevels:
+    def test_enter_and_recover(self):
+        shedder = LoadShedder(thresholds=(0.05, 0.1, 0.25))
+        assert shedder.update(0.01) == 0
+        assert shedder.update(0.12) == 2
+        # Hysteresis: still above half the level 2 threshold
+        assert shedder.update(0.07) == 2
+        assert shedder.update(0.04) == 1
+        assert shedder.update(0.3) == 3
+        assert shedder.update(0.0) == 2
+        assert shedder.update(0.0) == 1
+        assert shedder.update(0.0) == 0
+
+
+class TestLoadShedderSentences:
+    def test_nothing_shed_at_level_zero(self):
+        shedder = _shedder(0)
+        assert not any(shedder.sheds(s) for s in (GGA, HDT, AIS_STATIC_24))
+
+    def test_level_one_sheds_static_ais_only(self):
+        shedder = _shedder(1)
+        assert shedder.sheds(AIS_STATIC_24)
+        assert shedder.sheds(AIS_STATIC_5[0])
+        assert shedder.sheds(AIS_STATIC_5[1])
+        assert not shedder.sheds(AIS_POSITION)
+        assert not shedder.sheds(HDT)
+        assert shedder.shed["ais_static"] == 3
+
+    def test_shed_three_part_message_drops_every_fragment(self):
+        shedder = _shedder(1)
+        fragments = [
+            AIS_STATIC_5[0].replace(",2,1,", ",3,1,"),
+            AIS_STATIC_5[1].replace(",2,2,", ",3,2,"),
+            AIS_STATIC_5[1].replace(",2,2,", ",3,3,"),
+        ]
+        assert all(shedder.sheds(f) for f in fragments)
+        assert shedder.shed["ais_static"] == 3
+        # The decision is forgotten after the last fragment
+        assert not shedder._shed_sequences
+
+    def test_level_two_decimates_ais(self):
+        shedder = _shedder(2, ais_keep_every=4)
+        kept = [not shedder.sheds(AIS_POSITION) for _ in range(8)]
+        assert sum(kept) == 2
+        assert shedder.shed["ais_decimate"] == 6
+
+    def test_level_three_decimates_heading_never_position(self):
+        shedder = _shedder(3, heading_keep_every=5)
+        assert sum(not shedder.sheds(HDT) for _ in range(10)) == 2
+        assert not any(shedder.sheds(GGA) for _ in range(100))
+
+    def test_own_ship_ais_never_shed(self):
+        for level in (1, 2, 3):
+            shedder = _shedder(level, ais_keep_every=4)
+            own_ship = AIS_POSITION.replace("VDM", "VDO")
+            assert not any(shedder.sheds(own_ship) for _ in range(20))
+            assert not shedder.sheds(AIS_STATIC_24.replace("VDM", "VDO"))
+            assert not any(shedder.shed.values())
+
+    def test_kept_multipart_keeps_all_fragments(self):
+        shedder = _shedder(2, ais_keep_every=1)
+        first = AIS_STATIC_5[0].replace(",55?", ",15?")
+        assert not shedder.sheds(first)
+        assert not shedder.sheds(AIS_STATIC_5[1])
+
+
+class TestLoopLagMonitor:
+    def test_measures_blocked_loop(self):
+        samples = []
+
+        async def run():
+            monitor = LoopLagMonitor(interval=0.01)
+            task = asyncio.create_task(monitor.run(samples.append))
+            await asyncio.sleep(0.02)
+            time.sleep(0.1)  # block the loop
+            await asyncio.sleep(0.05)
+            task.cancel()
+            return monitor
+
+        monitor = asyncio.run(run())
+        assert samples
+        assert monitor.max_lag >= 0.05
+
+
+class _FakeClient:
+    def __init__(self):
+        self.messages: list[tuple[str, str]] = []
+
+    def publish(self, topic, payload, retain=False):
+        self.messages.append((topic, payload))
+
+
+class TestPublishLoadShedLevel:
+    def test_diagnostic_sensor_discovered_once(self):
+        publisher = MQTTPublisher({}, {})
+        publisher.client = _FakeClient()
+        publisher._connected = True
+
+        publisher.publish_load_shed_level(0)
+        publisher.publish_load_shed_level(2)
+
+        assert [topic for topic, _ in publisher.client.messages] == [
+            "homeassistant/sensor/navnet_load_shed_level/config",
+            "navnet/bridge/load_shed_level",
+            "navnet/bridge/load_shed_level",
+        ]
+        config = json.loads(publisher.client.messages[0][1])
+        assert config["entity_category"] == "diagnostic"
+        assert config["state_topic"] == "navnet/bridge/load_shed_level"
+        assert [payload for _, payload in publisher.client.messages[1:]] == ["0", "2"]
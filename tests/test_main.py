@@ -0,0 +1,63 @@
+"""Tests for entry point helpers."""
+
+import sys
+
+import pytest
+
+from nmea_mqtt_bridge.__main__ import validate_config
+from nmea_mqtt_bridge.runtime import select_event_loop
+
+
+class TestSelectEventLoop:
+    def test_asyncio_explicit(self):
+        assert select_event_loop("asyncio") == ("asyncio", None)
+
+    def test_uvloop_missing_falls_back(self, monkeypatch):
+        monkeypatch.setitem(sys.modules, "uvloop", None)
+        assert select_event_loop("uvloop") == ("asyncio", None)
+        assert select_event_loop("auto") == ("asyncio", None)
+
+
+class TestValidateConfig:
+    @staticmethod
+    def _config(**extra):
+        source = {"name": "gps", "type": "serial", "device": "/dev/ttyUSB0", **extra}
+        return {"mqtt": {"host": "localhost"}, "udp": {"sources": [source]}}
+
+    def test_serial_source_accepted(self):
+        validate_config(self._config())
+
+    @pytest.mark.parametrize("key", ["senders", "interface_names"])
+    def test_serial_rejects_sender_mapping(self, key, capsys):
+        with pytest.raises(SystemExit):
+            validate_config(self._config(**{key: {"eth0": "gps"}}))
+        assert f"{key} is not supported for serial sources" in capsys.readouterr().out
+
+    @pytest.mark.parametrize("key", ["allow_senders", "deny_senders"])
+    def test_serial_rejects_sender_filters(self, key, capsys):
+        with pytest.raises(SystemExit):
+            validate_config(self._config(**{key: ["172.31.252.0/24"]}))
+        assert f"{key} is not supported for serial sources" in capsys.readouterr().out
+
+    @pytest.mark.parametrize("timeout", [0, -1, "30", True])
+    def test_tcp_rejects_bad_idle_timeout(self, timeout, capsys):
+        source = {"name": "tz", "type": "tcp-client", "host": "10.0.0.1", "port": 10110}
+        config = {**self._config(), "udp": {"sources": [{**source, "idle_timeout": timeout}]}}
+        with pytest.raises(SystemExit):
+            validate_config(config)
+        assert "idle_timeout must be a positive number" in capsys.readouterr().out
+
+    @pytest.mark.parametrize(
+        "section",
+        [
+            {"load_shedding": {"enabled": True}},
+            {"sensors": {"lazy_parse": True}},
+            {"runtime": {"state_vector": True}},
+            {"runtime": {"source_threads": "on"}},
+        ],
+    )
+    def test_workers_reject_in_process_features(self, section, capsys):
+        config = {**self._config(), "workers": {"enabled": True}, **section}
+        with pytest.raises(SystemExit):
+            validate_config(config)
+        assert "not supported with workers.enabled" in capsys.readouterr().out
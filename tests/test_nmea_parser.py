@@ -1,16 +1,27 @@
 """Tests for the NMEA 0183 sentence parser."""
 
+import math
+from functools import reduce
+
 import pytest
 
+from nmea_mqtt_bridge import nmea_parser
 from nmea_mqtt_bridge.nmea_parser import (
+    UNHANDLED,
     NMEAData,
     parse_sentence,
+    split_fields,
     validate_checksum,
+    _parse_pynmea2,
     _safe_float,
     _safe_int,
 )
 
 
+def _with_checksum(body: str, digits: str = "{:02X}") -> str:
+    return f"${body}*" + digits.format(reduce(lambda c, ch: c ^ ord(ch), body, 0))
+
+
 # --- Checksum validation ---
 
 
@@ -234,3 +245,93 @@ class TestEdgeCases:
     def test_too_few_fields(self):
         raw = "$GP*00"
         assert parse_sentence(raw) is None
+
+
+# --- Fast path ---
+
+
+FAST_BODIES = [
+    "GPGGA,232001.00,1635.2474,S,14555.1765,E,1,11,0.70,11.5,M,62.6,M,,",
+    "GPGGA,232001.00,4916.45,N,12311.12,W,1,08,0.9,545.4,M,46.9,M,,",
+    "GPGGA,,,,,,0,,,,,,,,",
+    "GPGGA,232001.00,0,N,abc,E,1,11,0.70,11.5,M,,,,",
+    "GPGGA,232001.00,1635.2474,X,14555.1765,E,x,1.5,bad,alt",
+    "GPGGA,232001.00",
+    "GPVTG,17.6,T,10.8,M,23.6,N,43.7,K",
+    "GPHDT,18.2,T",
+    "GPHDT,,T",
+    "GPHDT,sNaN,T",
+    "GPHDG,11.4,,,6.8,E",
+    "GPHDG,11.4,,,6.8,W",
+    "GPZDA,232001.00,10,02,2026,-10,00",
+    "GPZDA,232001.00,1a,2,2026",
+    "GPRSA,0.6,A,,",
+    "GPRSA,0.6,V,,",
+    "GPGSV,3,1,11,10,63,137,17",
+    "IIDPT,36.03,-3.2,",
+    "SDDPT,0036.34,000.00",
+    "VWVHW,,T,,M,000.00,N,,K",
+    "IIVHW,18.2,T,11.4,M,0.0,N,0.0,K",
+    "YXMTW,076.25,C",
+    "YXMTW,20.5,",
+    "YXMTW,70,F",
+    "YXMTW,20,K",
+]
+
+
+class TestFastPath:
+    @pytest.mark.parametrize("body", FAST_BODIES)
+    def test_same_as_pynmea2(self, body):
+        for raw in (_with_checksum(body), _with_checksum(body, "{:02x}")):
+            assert split_fields(raw) is not UNHANDLED
+            assert parse_sentence(raw) == _parse_pynmea2(raw)
+
+    @pytest.mark.parametrize(
+        "raw",
+        [
+            _with_checksum("PGHDT,18.2,T"),  # proprietary "PGHD"
+            _with_checksum("GPhdt,18.2,T"),
+            _with_checksum("GPXDR,C,20.5,C,AIR"),
+            _with_checksum("GPHDT,1*2,T"),
+            _with_checksum("GPHDT,18.2,T") + "0",
+            _with_checksum("GPHDT,18.2,\u2103"),
+            "$GPHDT,18.2,T",
+            "$GPHDT,18.2,T*ZZ",
+        ],
+    )
+    def test_unusual_sentences_left_to_pynmea2(self, raw):
+        assert split_fields(raw) is UNHANDLED
+
+    def test_bad_checksum(self):
+        assert split_fields("$GPHDT,18.2,T*0F") is None
+        assert parse_sentence("$GPHDT,18.2,T*0F") is None
+
+    def test_address_cache_is_bounded(self, monkeypatch):
+        monkeypatch.setattr(nmea_parser, "_fast_addresses", {})
+        monkeypatch.setattr(nmea_parser, "MAX_CACHED_ADDRESSES", 2)
+        for talker in ("GP", "GN", "II"):
+            raw = _with_checksum(f"{talker}HDT,18.2,T")
+            assert parse_sentence(raw).heading_true == 18.2
+        assert list(nmea_parser._fast_addresses) == ["GPHDT", "GNHDT"]
+
+    def test_decimal_only_spelling(self):
+        # Decimal reads "NaN1" as NaN where float() rejects it
+        raw = _with_checksum("GPVTG,,T,,M,NaN1,N,NaN1,K")
+        fast, slow = parse_sentence(raw), _parse_pynmea2(raw)
+        assert math.isnan(fast.speed_over_ground_knots)
+        assert math.isnan(slow.speed_over_ground_knots)
+        assert fast.speed_over_ground_kmh is slow.speed_over_ground_kmh is None
+
+    def test_verified_skips_checksum(self):
+        raw = _with_checksum("GPHDT,18.2,T")
+        assert parse_sentence(raw, verified=True) == parse_sentence(raw)
+        # Only the framer's check stands between a bad checksum and the parser
+        assert split_fields("$GPHDT,18.2,T*0F", verified=True) == ["18.2", "T"]
+        assert parse_sentence("$GPHDT,18.2,T*0F", verified=True).heading_true == 18.2
+
+    def test_verified_ais_skips_checksum(self, monkeypatch):
+        raw = "!AIVDM,1,1,,B,15MwkT1P37G?fl0EJbR0OwT0@MS,0*0E"
+        calls = []
+        monkeypatch.setattr(nmea_parser, "validate_checksum", calls.append)
+        assert parse_sentence(raw, verified=True).ais_messages == [raw]
+        assert calls == []
@@ -0,0 +1,74 @@
+"""Tests for per-source sentence rate guards."""
+
+from nmea_mqtt_bridge.ratelimit import RateGuard, TokenBucket
+from nmea_mqtt_bridge.udp_listener import NMEAProtocol
+
+HDT = b"$GPHDT,18.2,T*0E"
+HDG = b"$GPHDG,11.4,,,6.8,E*0F"
+
+
+class TestTokenBucket:
+    def test_burst_then_refill(self):
+        bucket = TokenBucket(rate=2, burst=3)
+        assert [bucket.take(0.0) for _ in range(4)] == [True, True, True, False]
+        assert bucket.take(0.5)
+        assert not bucket.take(0.5)
+
+    def test_refill_capped_at_burst(self):
+        bucket = TokenBucket(rate=10)
+        bucket.take(0.0)
+        assert sum(bucket.take(100.0) for _ in range(20)) == 10
+
+    def test_clock_step_back_does_not_refill(self):
+        bucket = TokenBucket(rate=1)
+        assert bucket.take(10.0)
+        assert not bucket.take(5.0)
+        assert bucket.take(11.0)
+
+
+class TestRateGuard:
+    def test_inactive_without_limits(self):
+        assert not RateGuard("nav").active
+        assert not RateGuard.from_source({"name": "nav"}).active
+
+    def test_source_limit(self):
+        guard = RateGuard("nav", rate=2)
+        assert [guard.allows(HDT, 0.0) for _ in range(3)] == [True, True, False]
+        assert guard.dropped == 1
+        assert guard.drops == {"source": 1}
+
+    def test_sentence_type_limit_shared_across_talkers(self):
+        guard = RateGuard("nav", sentence_types={"hdt": 1})
+        assert guard.allows(HDT, 0.0)
+        assert not guard.allows(b"$HEHDT,18.2,T*14", 0.0)
+        # Other types are not limited
+        assert all(guard.allows(HDG, 0.0) for _ in range(10))
+        assert guard.drops == {"HDT": 1}
+
+    def test_type_drop_does_not_consume_source_tokens(self):
+        guard = RateGuard("nav", rate=1, sentence_types={"HDT": 1})
+        assert guard.allows(HDT, 0.0)
+        guard._bucket.tokens = 1.0
+        assert not guard.allows(HDT, 0.0)
+        assert guard.allows(HDG, 0.0)
+
+    def test_warns_once_per_interval(self, caplog):
+        guard = RateGuard("nav", rate=1, warn_interval=60)
+        for now in (0.0, 0.0, 0.0, 30.0):
+            guard.allows(HDT, now)
+        guard.allows(HDT, 30.0)
+        assert len(caplog.records) == 1
+        for _ in range(2):
+            guard.allows(HDT, 61.0)
+        assert len(caplog.records) == 2
+
+
+class TestProtocolRateLimit:
+    def test_excess_sentences_dropped_before_decoding(self):
+        protocol = NMEAProtocol.from_source(
+            {"name": "nav", "rate_limit": {"rate": 2}}, lambda *args: None
+        )
+        data = b"\r\n".join([HDT] * 5) + b"\r\n"
+        found = protocol.extract(data, ("172.31.252.1", 10110), 1000.0)
+        assert [r.sentence for r in found] == [HDT.decode()] * 2
+        assert protocol.sentences_rate_limited == 3
@@ -0,0 +1,140 @@
+"""Tests for rate meters and their diagnostic sensors."""
+
+import json
+
+import pytest
+
+from nmea_mqtt_bridge.mqtt_publisher import MQTTPublisher
+from nmea_mqtt_bridge.rates import (
+    OTHER,
+    SENTENCE_TYPE,
+    SOURCE,
+    RateMeters,
+    sentence_formatter,
+)
+
+
+class TestSentenceFormatter:
+    def test_standard_and_ais(self):
+        assert sentence_formatter("$GPGGA,232001.00,,*72") == "GGA"
+        assert sentence_formatter("!AIVDM,1,1,,A,x,0*00") == "VDM"
+
+    def test_proprietary(self):
+        assert sentence_formatter("$PFEC,GPatt,1*00") == "PFEC"
+        assert sentence_formatter("$PFEC") == "PFEC"
+
+
+class TestRateMeters:
+    def test_first_interval_sets_rate(self):
+        meters = RateMeters(time_constant=30)
+        meters.tick(0.0)
+        for _ in range(100):
+            meters.mark("heading_fast", "HDT")
+        rates = meters.tick(10.0)
+        assert rates[(SOURCE, "heading_fast")] == pytest.approx(10.0)
+        assert rates[(SENTENCE_TYPE, "HDT")] == pytest.approx(10.0)
+
+    def test_silent_feed_decays(self):
+        meters = RateMeters(time_constant=30)
+        meters.tick(0.0)
+        meters.mark("ais", "VDM", count=300)
+        assert meters.tick(30.0)[(SOURCE, "ais")] == pytest.approx(10.0)
+        rate = meters.tick(60.0)[(SOURCE, "ais")]
+        # One time constant of silence leaves ~37% of the rate
+        assert rate == pytest.approx(10.0 * 0.3679, rel=1e-3)
+
+    def test_ewma_moves_towards_new_rate(self):
+        meters = RateMeters(time_constant=30)
+        meters.tick(0.0)
+        meters.mark("nav", "GGA", count=30)
+        meters.tick(30.0)
+        meters.mark("nav", "GGA", count=60)
+        rate = meters.tick(60.0)[(SOURCE, "nav")]
+        assert 1.0 < rate < 2.0
+
+    def test_registered_meter_reports_zero(self):
+        meters = RateMeters()
+        meters.register(SOURCE, "ais")
+        meters.tick(0.0)
+        assert meters.tick(30.0) == {(SOURCE, "ais"): 0.0}
+
+    def test_counts_before_first_tick_discarded(self):
+        meters = RateMeters()
+        meters.mark("nav", "GGA", count=1000)
+        meters.tick(0.0)
+        assert meters.tick(10.0)[(SOURCE, "nav")] == 0.0
+
+    def test_add_external_counts(self):
+        meters = RateMeters()
+        meters.tick(0.0)
+        meters.add(SENTENCE_TYPE, "GGA", 50)
+        assert meters.tick(10.0)[(SENTENCE_TYPE, "GGA")] == pytest.approx(5.0)
+
+    def test_sentence_types_beyond_bound_share_other(self):
+        meters = RateMeters(max_sentence_types=2)
+        meters.tick(0.0)
+        for sentence_type in ("GGA", "HDT", "PXYZ", "PABC"):
+            meters.mark("nav", sentence_type, count=10)
+        meters.add(SENTENCE_TYPE, "PDEF", 10)
+        rates = meters.tick(10.0)
+        assert set(meters.sentence_types) == {"GGA", "HDT", OTHER}
+        assert rates[(SENTENCE_TYPE, OTHER)] == pytest.approx(3.0)
+
+
+class _FakeClient:
+    def __init__(self):
+        self.messages: list[tuple[str, str]] = []
+
+    def publish(self, topic, payload, retain=False):
+        self.messages.append((topic, payload))
+
+
+class TestPublishRate:
+    def test_discovery_once_then_state(self):
+        publisher = MQTTPublisher({}, {})
+        publisher.client = _FakeClient()
+        publisher._connected = True
+
+        publisher.publish_rate(SOURCE, "heading fast", 9.87654)
+        publisher.publish_rate(SOURCE, "heading fast", 4.5)
+
+        topics = [topic for topic, _ in publisher.client.messages]
+        assert topics == [
+            "homeassistant/sensor/navnet_rate_source_heading_fast/config",
+            "navnet/diagnostics/rate/source/heading_fast",
+            "navnet/diagnostics/rate/source/heading_fast",
+        ]
+        config = json.loads(publisher.client.messages[0][1])
+        assert config["entity_category"] == "diagnostic"
+        assert config["unit_of_measurement"] == "Hz"
+        assert config["state_topic"] == "navnet/diagnostics/rate/source/heading_fast"
+        assert [payload for _, payload in publisher.client.messages[1:]] == [
+            "9.88",
+            "4.50",
+        ]
+
+    def test_not_connected(self):
+        publisher = MQTTPublisher({}, {})
+        publisher.client = _FakeClient()
+        publisher.publish_rate(SENTENCE_TYPE, "GGA", 1.0)
+        assert publisher.client.messages == []
+
+    def test_colliding_slugs_get_distinct_ids(self):
+        publisher = MQTTPublisher({}, {})
+        publisher.client = _FakeClient()
+        publisher._connected = True
+
+        publisher.publish_rate(SOURCE, "a_b", 1.0)
+        publisher.publish_rate(SOURCE, "a-b", 2.0)
+        publisher.publish_rate(SOURCE, "a-b", 3.0)
+
+        configs = [
+            json.loads(payload)
+            for topic, payload in publisher.client.messages
+            if topic.endswith("/config")
+        ]
+        assert len(configs) == 2
+        assert configs[0]["unique_id"] == "navnet_rate_source_a_b"
+        assert configs[1]["unique_id"] != configs[0]["unique_id"]
+        assert configs[1]["state_topic"] != configs[0]["state_topic"]
+        assert publisher.client.messages[-1] == (configs[1]["state_topic"], "3.00")
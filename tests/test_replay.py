@@ -0,0 +1,132 @@
+"""Tests for capture file replay."""
+
+import asyncio
+import struct
+
+from nmea_mqtt_bridge.replay import ReplayListener, _replay_through_bridge, read_capture
+
+HDT = b"$GPHDT,18.2,T*0E\r\n"
+GGA = b"$GPGGA,232001.00,1635.2474,S,14555.1765,E,1,11,0.70,11.5,M,62.6,M,,*72\r\n"
+
+
+def _ethernet_udp(payload: bytes, sender: str, port: int) -> bytes:
+    udp = struct.pack(">HHHH", 40000, port, 8 + len(payload), 0) + payload
+    ip = struct.pack(
+        ">BBHHHBBH4s4s",
+        0x45, 0, 20 + len(udp), 0, 0, 64, 17, 0,
+        bytes(int(o) for o in sender.split(".")),
+        bytes([172, 31, 255, 255]),
+    )
+    return b"\xff" * 6 + b"\x00\x11\x22\x33\x44\x55" + b"\x08\x00" + ip + udp
+
+
+def _write_pcap(path, packets):
+    with open(path, "wb") as f:
+        f.write(struct.pack("<IHHiIII", 0xA1B2C3D4, 2, 4, 0, 0, 65535, 1))
+        for ts, frame in packets:
+            sec = int(ts)
+            f.write(struct.pack("<IIII", sec, int((ts - sec) * 1e6), len(frame), len(frame)))
+            f.write(frame)
+
+
+def _pcapng_block(block_type: int, body: bytes) -> bytes:
+    body += b"\x00" * (-len(body) % 4)
+    length = 12 + len(body)
+    return struct.pack("<II", block_type, length) + body + struct.pack("<I", length)
+
+
+def _write_pcapng(path, packets):
+    with open(path, "wb") as f:
+        f.write(_pcapng_block(0x0A0D0D0A, struct.pack("<IHHq", 0x1A2B3C4D, 1, 0, -1)))
+        # Interface with if_tsresol = 9 (nanoseconds)
+        opts = struct.pack("<HHB3x", 9, 1, 9) + struct.pack("<HH", 0, 0)
+        f.write(_pcapng_block(1, struct.pack("<HHI", 1, 0, 65535) + opts))
+        for ts, frame in packets:
+            ticks = int(ts * 1e9)
+            epb = struct.pack("<IIIII", 0, ticks >> 32, ticks & 0xFFFFFFFF, len(frame), len(frame))
+            f.write(_pcapng_block(6, epb + frame))
+
+
+class TestReadCapture:
+    def test_pcap(self, tmp_path):
+        path = tmp_path / "cap.pcap"
+        _write_pcap(path, [(100.5, _ethernet_udp(HDT, "172.31.252.1", 10036))])
+        (packet,) = list(read_capture(str(path)))
+        assert packet.timestamp == 100.5
+        assert packet.sender == "172.31.252.1"
+        assert packet.port == 10036
+        assert packet.payload == HDT
+
+    def test_pcapng(self, tmp_path):
+        path = tmp_path / "cap.pcapng"
+        _write_pcapng(
+            path,
+            [
+                (100.25, _ethernet_udp(HDT, "172.31.252.1", 10036)),
+                (101.0, _ethernet_udp(GGA, "172.31.252.1", 10021)),
+            ],
+        )
+        packets = list(read_capture(str(path)))
+        assert [p.port for p in packets] == [10036, 10021]
+        assert abs(packets[0].timestamp - 100.25) < 1e-6
+        assert packets[1].payload == GGA
+
+    def test_plain_log(self, tmp_path):
+        path = tmp_path / "nmea.log"
+        path.write_bytes(HDT + b"\r\n" + GGA)
+        packets = list(read_capture(str(path)))
+        assert [p.payload for p in packets] == [HDT, GGA]
+        assert packets[0].timestamp is None
+
+
+class TestReplayListener:
+    def test_frames_by_port_and_reports(self, tmp_path):
+        path = tmp_path / "cap.pcap"
+        _write_pcap(
+            path,
+            [
+                (10.0, _ethernet_udp(HDT, "172.31.252.1", 10036)),
+                (10.01, _ethernet_udp(GGA, "172.31.252.1", 10021)),
+                (10.02, _ethernet_udp(b"\x01\x02binary", "172.31.92.1", 10026)),
+            ],
+        )
+        received = []
+        listener = ReplayListener()
+        listener.set_batch_callback(received.extend)
+
+        async def run():
+            await listener.start(
+                [{"name": "cap", "path": str(path), "speed": 0}],
+                [
+                    {"name": "heading_fast", "port": 10036},
+                    {"name": "primary_nav", "port": 10021, "senders": {"172.31.252.1": "gps"}},
+                ],
+            )
+            await listener.wait()
+
+        asyncio.run(run())
+        assert [(r.source, r.sentence[:6]) for r in received] == [
+            ("heading_fast", "$GPHDT"),
+            ("gps", "$GPGGA"),
+        ]
+        result = listener.results["cap"]
+        assert result["packets"] == 3
+        assert result["sentences"] == 2
+
+
+def test_replay_through_bridge_counts_every_sentence(tmp_path):
+    path = tmp_path / "nmea.log"
+    path.write_bytes(HDT + GGA + HDT)
+    config = {
+        "queue": {"enabled": True, "batch_size": 1},
+        "runtime": {"source_threads": "on"},
+        "udp": {"sources": [{"name": "nav", "port": 10110}]},
+    }
+    result = asyncio.run(
+        _replay_through_bridge(config, {"name": "log", "path": str(path), "speed": 0})
+    )
+    assert result["sentences"] == 3
+    assert result["stats"]["sentences_received"] == 3
+    assert result["stats"]["sentences_parsed"] == 3
+    # The caller's config is left alone
+    assert config["runtime"]["source_threads"] == "on"
@@ -0,0 +1,158 @@
+"""Tests for serial and pty NMEA sources."""
+
+import asyncio
+import os
+import pty
+
+import pytest
+
+from nmea_mqtt_bridge.serial_listener import SerialListener, open_serial
+
+
+async def _wait_for(predicate, timeout: float = 2.0):
+    for _ in range(int(timeout / 0.01)):
+        if predicate():
+            return
+        await asyncio.sleep(0.01)
+
+
+@pytest.fixture
+def pty_pair():
+    master, slave = pty.openpty()
+    path = os.ttyname(slave)
+    os.close(slave)
+    yield master, path
+    try:
+        os.close(master)
+    except OSError:
+        pass
+
+
+class TestOpenSerial:
+    def test_raw_nonblocking(self, pty_pair):
+        _, path = pty_pair
+        fd = open_serial(path, 38400)
+        try:
+            assert not os.get_blocking(fd)
+            with pytest.raises(BlockingIOError):
+                os.read(fd, 100)
+        finally:
+            os.close(fd)
+
+    def test_unsupported_baudrate(self, pty_pair):
+        _, path = pty_pair
+        with pytest.raises(ValueError):
+            open_serial(path, 12345)
+
+    def test_missing_device(self, tmp_path):
+        with pytest.raises(OSError):
+            open_serial(str(tmp_path / "ttyUSB9"))
+
+
+class TestSerialListener:
+    def test_receives_split_sentences(self, pty_pair):
+        master, path = pty_pair
+        received = []
+
+        async def run():
+            listener = SerialListener()
+            listener.set_callback(lambda *a: received.append(a))
+            await listener.start([{"name": "gps", "type": "serial", "device": path}])
+            await _wait_for(lambda: "gps" in listener.ports)
+            os.write(master, b"$GPHDT,18.2,T*0E\r\n$GPHDG,11.4,")
+            await _wait_for(lambda: len(received) >= 1)
+            os.write(master, b",,6.8,E*0F\r\nnoise\r\n")
+            await _wait_for(lambda: len(received) >= 2)
+            stats = dict(listener.port_stats["gps"])
+            await listener.stop()
+            return stats
+
+        stats = asyncio.run(run())
+        assert [r[2] for r in received] == ["$GPHDT,18.2,T*0E", "$GPHDG,11.4,,,6.8,E*0F"]
+        assert received[0][0] == "gps"
+        assert received[0][1] == path
+        assert stats["sentences"] == 2
+        assert stats["connected"]
+
+    def test_batch_callback(self, pty_pair):
+        master, path = pty_pair
+        batches = []
+
+        async def run():
+            listener = SerialListener()
+            listener.set_batch_callback(batches.append)
+            await listener.start([{"name": "gps", "type": "serial", "device": path}])
+            await _wait_for(lambda: "gps" in listener.ports)
+            os.write(master, b"$GPHDT,18.2,T*0E\r\n$GPHDT,18.3,T*0F\r\n")
+            await _wait_for(lambda: sum(map(len, batches)) >= 2)
+            await listener.stop()
+
+        asyncio.run(run())
+        assert [s.sentence for batch in batches for s in batch] == [
+            "$GPHDT,18.2,T*0E",
+            "$GPHDT,18.3,T*0F",
+        ]
+
+    def test_counts_filtered_and_invalid(self, pty_pair):
+        master, path = pty_pair
+        received = []
+        source = {
+            "name": "gps",
+            "type": "serial",
+            "device": path,
+            "sentence_types": {"deny": ["HDG"]},
+        }
+
+        async def run():
+            listener = SerialListener()
+            listener.set_callback(lambda *a: received.append(a))
+            await listener.start([source])
+            await _wait_for(lambda: "gps" in listener.ports)
+            os.write(
+                master,
+                b"$GPHDT,18.2,T*0F\r\n$GPHDG,11.4,,,6.8,E*0F\r\n$GPHDT,18.2,T*0E\r\n",
+            )
+            await _wait_for(lambda: received)
+            open_counts = (listener.sentences_filtered, listener.sentences_invalid)
+            await listener.stop()
+            return open_counts, (listener.sentences_filtered, listener.sentences_invalid)
+
+        # Kept once the device is closed
+        assert asyncio.run(run()) == ((1, 1), (1, 1))
+
+    def test_closed_pty_is_lost(self, pty_pair):
+        master, path = pty_pair
+
+        async def run():
+            listener = SerialListener()
+            listener.set_callback(lambda *a: None)
+            await listener.start(
+                [{"name": "gps", "type": "serial", "device": path, "reopen_delay": 60}]
+            )
+            await _wait_for(lambda: "gps" in listener.ports)
+            os.close(master)
+            await _wait_for(lambda: "gps" not in listener.ports)
+            ports = dict(listener.ports)
+            stats = dict(listener.port_stats["gps"])
+            assert listener.active
+            await listener.stop()
+            return ports, stats
+
+        ports, stats = asyncio.run(run())
+        assert ports == {}
+        assert not stats["connected"]
+
+    def test_missing_device_retried(self, tmp_path):
+        async def run():
+            listener = SerialListener()
+            listener.set_callback(lambda *a: None)
+            await listener.start(
+                [{"name": "gps", "device": str(tmp_path / "ttyUSB9"), "reopen_delay": 60}]
+            )
+            await asyncio.sleep(0.05)
+            assert listener.active
+            assert listener.ports == {}
+            await listener.stop()
+            assert not listener.active
+
+        asyncio.run(run())
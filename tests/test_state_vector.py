@@ -0,0 +1,142 @@
+"""Tests for the array-backed state vector."""
+
+import math
+from functools import reduce
+
+import pytest
+
+from nmea_mqtt_bridge import bridge as bridge_module
+from nmea_mqtt_bridge.bridge import FIELD_SENSORS, NMEABridge
+from nmea_mqtt_bridge.mqtt_publisher import SENSOR_DEFINITIONS
+from nmea_mqtt_bridge.nmea_parser import parse_sentence
+from nmea_mqtt_bridge.state_vector import FIELD_ID, FIELDS, StateVector
+
+GGA = "$GPGGA,232001.00,1635.2474,S,14555.1765,E,1,11,0.70,11.5,M,62.6,M,,*72"
+HDT = "$GPHDT,18.2,T*0E"
+AIS = "!AIVDM,1,1,,B,15MwkT1P37G?fl0EJbR0OwT0@MS,0*0E"
+
+BODIES = [
+    "GPGGA,232001.00,1635.2474,S,14555.1765,E,1,11,0.70,11.5,M,62.6,M,,",
+    "GPGGA,232001.00,4916.45,N,bad,W,1,08,0.9,545.4,M,46.9,M,,",
+    "GPGGA,,,,,,0,,,,,,,,",
+    "GPVTG,17.6,T,10.8,M,23.6,N,43.7,K",
+    "GPHDT,18.2,T",
+    "GPHDT,,T",
+    "GPHDG,11.4,,,6.8,W",
+    "GPZDA,232001.00,10,02,2026,-10,00",
+    "GPRSA,0.6,A,,",
+    "GPRSA,0.6,V,,",
+    "GPGSV,3,1,11,10,63,137,17",
+    "IIDPT,36.03,-3.2,",
+    "IIVHW,18.2,T,11.4,M,0.0,N,0.0,K",
+    "YXMTW,076.25,C",
+    "YXMTW,20,K",
+    "GPhdt,18.2,T",
+]
+
+
+def _with_checksum(body: str) -> str:
+    return f"${body}*{reduce(lambda c, ch: c ^ ord(ch), body, 0):02X}"
+
+
+def _snapshot(vector: StateVector) -> dict:
+    return {name: vector.get(name) for name in FIELDS}
+
+
+class TestStateVector:
+    def test_parse_in_place(self):
+        vector = StateVector()
+        mask = vector.parse(GGA)
+        assert mask == sum(
+            1 << FIELD_ID[name]
+            for name in (
+                "latitude",
+                "longitude",
+                "altitude",
+                "fix_quality",
+                "satellites_in_use",
+                "hdop",
+            )
+        )
+        assert vector["latitude"] < 0
+        assert vector["satellites_in_use"] == 11
+        assert isinstance(vector["satellites_in_use"], int)
+        assert "heading_true" not in vector
+
+        assert vector.parse(HDT) == 1 << FIELD_ID["heading_true"]
+        # Earlier fields are kept
+        assert vector["heading_true"] == 18.2
+        assert vector["fix_quality"] == 1
+
+    @pytest.mark.parametrize("body", BODIES)
+    def test_same_values_as_nmea_data(self, body):
+        raw = _with_checksum(body)
+        in_place, loaded = StateVector(), StateVector()
+        mask = in_place.parse(raw)
+        assert mask == loaded.load(parse_sentence(raw))
+        assert _snapshot(in_place) == _snapshot(loaded)
+
+    def test_rejected(self):
+        vector = StateVector()
+        assert vector.parse("$GPHDT,18.2,T*0F") == -1
+        assert vector.parse(AIS) == -1
+        assert vector.parse("$GPXYZ,1,2,3*49") == -1
+        assert len(vector) == 0
+
+    def test_mapping(self):
+        vector = StateVector()
+        vector["heading_true"] = 18.2
+        vector["fix_quality"] = 1
+        assert dict(vector) == {"heading_true": 18.2, "fix_quality": 1}
+        del vector["heading_true"]
+        assert vector.get("heading_true") is None
+        assert math.isnan(vector.values[FIELD_ID["heading_true"]])
+        with pytest.raises(KeyError):
+            vector["heading_true"]
+
+    def test_field_sensors(self):
+        assert {s for s in FIELD_SENSORS if s is not None} == set(SENSOR_DEFINITIONS)
+        # Sensor fields first, in definition order, so publish order matches
+        assert [s for s in FIELD_SENSORS if s is not None] == list(SENSOR_DEFINITIONS)
+
+
+class _Recorder:
+    def __init__(self):
+        self.sensors: list = []
+        self.trackers: list = []
+
+    def publish_sensor(self, sensor_id, value):
+        self.sensors.append((sensor_id, value, type(value)))
+
+    def publish_device_tracker(self, lat, lon, **attrs):
+        self.trackers.append((lat, lon, attrs))
+
+
+class TestBridge:
+    @pytest.mark.parametrize("lazy", [True, False])
+    def test_same_publishes_as_nmea_data(self, monkeypatch, lazy):
+        now = [1000.0]
+        monkeypatch.setattr(bridge_module.time, "monotonic", lambda: now[0])
+        feed = [_with_checksum(body) for body in BODIES] * 20
+
+        def run(state_vector):
+            now[0] = 1000.0
+            bridge = NMEABridge(
+                {
+                    "runtime": {"state_vector": state_vector, "source_threads": "off"},
+                    "sensors": {"lazy_parse": lazy, "throttle": {"heading": 1}},
+                }
+            )
+            bridge.mqtt_publisher = _Recorder()
+            for raw in feed:
+                bridge._process_sentence("nav", "10.0.0.1", raw)
+                now[0] += 0.2
+            return bridge
+
+        vector, dataclass = run(True), run(False)
+        assert isinstance(vector._state, StateVector)
+        assert vector.mqtt_publisher.sensors == dataclass.mqtt_publisher.sensors
+        assert vector.mqtt_publisher.trackers == dataclass.mqtt_publisher.trackers
+        assert vector._stats == dataclass._stats
+        # The vector also keeps the fields no sensor reads
+        assert {key: vector._state.get(key) for key in dataclass._state} == dataclass._state
@@ -0,0 +1,233 @@
+"""Tests for TCP NMEA sources."""
+
+import asyncio
+import socket
+
+from nmea_mqtt_bridge.tcp_listener import TCPListener
+
+
+def _free_port() -> int:
+    with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as s:
+        s.bind(("127.0.0.1", 0))
+        return s.getsockname()[1]
+
+
+async def _wait_for(predicate, timeout: float = 2.0):
+    for _ in range(int(timeout / 0.01)):
+        if predicate():
+            return
+        await asyncio.sleep(0.01)
+
+
+class TestTCPServer:
+    def test_receives_lines(self):
+        port = _free_port()
+        received = []
+
+        async def run():
+            listener = TCPListener()
+            listener.set_callback(lambda *a: received.append(a))
+            await listener.start(
+                [{"name": "mux", "type": "tcp-server", "port": port}], "127.0.0.1"
+            )
+            _, writer = await asyncio.open_connection("127.0.0.1", port)
+            writer.write(b"$GPHDT,18.2,T*0E\r\n$GPHDG,11.4,")
+            await writer.drain()
+            writer.write(b",,6.8,E*0F\r\nnoise\r\n")
+            await writer.drain()
+            await _wait_for(lambda: len(received) >= 2)
+            writer.close()
+            stats = dict(listener.connection_stats)
+            await listener.stop()
+            return stats
+
+        stats = asyncio.run(run())
+        assert [r[2] for r in received] == ["$GPHDT,18.2,T*0E", "$GPHDG,11.4,,,6.8,E*0F"]
+        assert received[0][0] == "mux"
+        (conn,) = stats.values()
+        assert conn["sentences"] == 2
+        assert conn["bytes"] == len(b"$GPHDT,18.2,T*0E\r\n$GPHDG,11.4,,,6.8,E*0F\r\nnoise\r\n")
+
+    def test_reconnects_share_stats(self):
+        port = _free_port()
+        received = []
+
+        async def run():
+            listener = TCPListener()
+            listener.set_callback(lambda *a: received.append(a))
+            await listener.start(
+                [{"name": "mux", "type": "tcp-server", "port": port}], "127.0.0.1"
+            )
+            for count in range(1, 4):
+                _, writer = await asyncio.open_connection("127.0.0.1", port)
+                writer.write(b"$GPHDT,18.2,T*0E\r\n")
+                await writer.drain()
+                await _wait_for(lambda: len(received) >= count)
+                writer.close()
+                await _wait_for(
+                    lambda: not listener.connection_stats["mux@127.0.0.1"]["connected"]
+                )
+            stats = dict(listener.connection_stats)
+            await listener.stop()
+            return stats
+
+        stats = asyncio.run(run())
+        assert list(stats) == ["mux@127.0.0.1"]
+        assert stats["mux@127.0.0.1"]["sentences"] == 3
+        assert not stats["mux@127.0.0.1"]["connected"]
+
+    def test_counts_filtered_and_invalid_across_connections(self):
+        port = _free_port()
+        received = []
+        source = {
+            "name": "mux",
+            "type": "tcp-server",
+            "port": port,
+            "sentence_types": {"deny": ["HDG"]},
+        }
+
+        async def run():
+            listener = TCPListener()
+            listener.set_callback(lambda *a: received.append(a))
+            await listener.start([source], "127.0.0.1")
+            counts = []
+            for _ in range(2):
+                _, writer = await asyncio.open_connection("127.0.0.1", port)
+                writer.write(
+                    b"$GPHDT,18.2,T*0F\r\n$GPHDG,11.4,,,6.8,E*0F\r\n"
+                    b"$GPHDT,18.2,T*0E\r\n"
+                )
+                await writer.drain()
+                await _wait_for(lambda: len(received) >= len(counts) + 1)
+                counts.append(
+                    (listener.sentences_filtered, listener.sentences_invalid)
+                )
+                writer.close()
+                await _wait_for(
+                    lambda: not listener.connection_stats["mux@127.0.0.1"]["connected"]
+                )
+            counts.append((listener.sentences_filtered, listener.sentences_invalid))
+            await listener.stop()
+            return counts
+
+        # Counted while open and kept once the connection closes
+        assert asyncio.run(run()) == [(1, 1), (2, 2), (2, 2)]
+
+    def test_stop_finishes_open_connections(self):
+        port = _free_port()
+
+        async def run():
+            listener = TCPListener()
+            listener.set_callback(lambda *a: None)
+            await listener.start(
+                [{"name": "mux", "type": "tcp-server", "port": port}], "127.0.0.1"
+            )
+            _, writer = await asyncio.open_connection("127.0.0.1", port)
+            await _wait_for(lambda: listener._handlers)
+            handlers = set(listener._handlers)
+            await listener.stop()
+            writer.close()
+            return handlers
+
+        handlers = asyncio.run(run())
+        assert handlers
+        assert all(task.done() for task in handlers)
+
+    def test_closes_silent_peer(self):
+        port = _free_port()
+
+        async def run():
+            listener = TCPListener()
+            listener.set_callback(lambda *a: None)
+            await listener.start(
+                [{"name": "mux", "type": "tcp-server", "port": port, "idle_timeout": 0.1}],
+                "127.0.0.1",
+            )
+            reader, writer = await asyncio.open_connection("127.0.0.1", port)
+            # The bridge hangs up on a peer that never sends anything
+            closed = await asyncio.wait_for(reader.read(), 2.0)
+            stats = listener.connection_stats["mux@127.0.0.1"]
+            await listener.stop()
+            writer.close()
+            return closed, stats["connected"]
+
+        assert asyncio.run(run()) == (b"", False)
+
+
+class TestTCPClient:
+    def test_connects_and_reconnects(self):
+        port = _free_port()
+        received = []
+        connections = []
+
+        async def serve(reader, writer):
+            connections.append(writer)
+            writer.write(b"$GPHDT,18.2,T*0E\r\n")
+            await writer.drain()
+            writer.close()
+
+        async def run():
+            server = await asyncio.start_server(serve, "127.0.0.1", port)
+            listener = TCPListener()
+            listener.set_batch_callback(received.extend)
+            await listener.start(
+                [
+                    {
+                        "name": "tz",
+                        "type": "tcp-client",
+                        "host": "127.0.0.1",
+                        "port": port,
+                        "reconnect_delay": 0.01,
+                    }
+                ]
+            )
+            await _wait_for(lambda: len(received) >= 2)
+            await listener.stop()
+            server.close()
+            return list(listener.connection_stats)
+
+        assert asyncio.run(run()) == [f"tz@127.0.0.1:{port}"]
+        assert len(connections) >= 2
+        assert received[0].source == "tz"
+        assert received[0].sentence == "$GPHDT,18.2,T*0E"
+
+    def test_reconnects_after_silent_server(self):
+        port = _free_port()
+        received = []
+        connections = []
+
+        async def serve(reader, writer):
+            # Accept, send one sentence, then go quiet without closing
+            connections.append(writer)
+            writer.write(b"$GPHDT,18.2,T*0E\r\n")
+            await writer.drain()
+
+        async def run():
+            server = await asyncio.start_server(serve, "127.0.0.1", port)
+            listener = TCPListener()
+            listener.set_batch_callback(received.extend)
+            await listener.start(
+                [
+                    {
+                        "name": "tz",
+                        "type": "tcp-client",
+                        "host": "127.0.0.1",
+                        "port": port,
+                        "reconnect_delay": 0.01,
+                        "idle_timeout": 0.1,
+                    }
+                ]
+            )
+            await _wait_for(lambda: len(connections) >= 2 and listener._writers)
+            sock = next(iter(listener._writers)).get_extra_info("socket")
+            keepalive = sock.getsockopt(socket.SOL_SOCKET, socket.SO_KEEPALIVE)
+            await listener.stop()
+            for writer in connections:
+                writer.close()
+            server.close()
+            return keepalive
+
+        keepalive = asyncio.run(run())
+        assert len(connections) >= 2
+        assert len(received) >= 2
+        assert keepalive
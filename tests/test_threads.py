@@ -0,0 +1,155 @@
+"""Tests for per-source processing threads."""
+
+import sys
+import threading
+
+import pytest
+
+from nmea_mqtt_bridge.bridge import NMEABridge
+from nmea_mqtt_bridge.threads import (
+    SourceThreadPool,
+    gil_enabled,
+    new_thread_counters,
+    use_source_threads,
+)
+from nmea_mqtt_bridge.udp_listener import ReceivedSentence
+
+HDT = "$GPHDT,18.2,T*0E"
+GGA = "$GPGGA,232001.00,1635.2474,S,14555.1765,E,1,11,0.70,11.5,M,62.6,M,,*72"
+AIS = "!AIVDM,1,1,,B,15MwkT1P37G?fl0EJbR0OwT0@MS,0*0E"
+
+
+class TestMode:
+    def test_gil_detection(self, monkeypatch):
+        monkeypatch.setattr(sys, "_is_gil_enabled", lambda: False, raising=False)
+        assert not gil_enabled()
+        assert use_source_threads("auto")
+        monkeypatch.setattr(sys, "_is_gil_enabled", lambda: True, raising=False)
+        assert not use_source_threads("auto")
+
+    def test_explicit_modes(self):
+        assert use_source_threads("on")
+        assert not use_source_threads("off")
+
+
+class TestSourceThreadPool:
+    def test_routes_by_source(self):
+        seen: dict[str, set] = {}
+        lock = threading.Lock()
+
+        def process(counters, source, sender, sentence, *tags):
+            counters["sentences_received"] += 1
+            with lock:
+                seen.setdefault(source, set()).add(threading.current_thread().name)
+
+        pool = SourceThreadPool(process)
+        pool.dispatch([ReceivedSentence("a", "10.0.0.1", HDT, None)] * 3)
+        pool.dispatch(
+            [
+                ReceivedSentence("a", "10.0.0.1", HDT, None),
+                ReceivedSentence("b", "10.0.0.2", GGA, None),
+            ]
+        )
+        pool.stop()
+
+        assert seen == {"a": {"nmea-source-a"}, "b": {"nmea-source-b"}}
+        assert pool.threads == {}
+
+    def test_errors_counted_and_thread_survives(self):
+        def process(counters, source, sender, sentence, *tags):
+            counters["sentences_received"] += 1
+            if sentence == "bad":
+                raise ValueError(sentence)
+
+        pool = SourceThreadPool(process)
+        pool.dispatch([ReceivedSentence("a", "10.0.0.1", s, None) for s in ("bad", HDT)])
+        threads = list(pool.threads.values())
+        pool.stop()
+
+        totals = new_thread_counters()
+        for thread in threads:
+            for key, value in thread.counters.items():
+                totals[key] += value
+        assert totals["sentences_received"] == 2
+        assert totals["errors"] == 1
+
+
+    @pytest.mark.parametrize(
+        "policy, kept",
+        [("drop-oldest", list(range(97, 100))), ("drop-newest", [1, 2, 3])],
+    )
+    def test_stalled_thread_backlog_bounded(self, policy, kept):
+        release = threading.Event()
+        started = threading.Event()
+        processed = []
+
+        def process(counters, source, sender, sentence, *tags):
+            started.set()
+            release.wait(5)
+            processed.append(int(sentence))
+
+        pool = SourceThreadPool(process, maxsize=3, policies={"a": policy})
+        pool.dispatch([ReceivedSentence("a", "10.0.0.1", "0", None)])
+        assert started.wait(5)
+        # The thread is stuck on sentence 0; the rest pile up behind it
+        for i in range(1, 100):
+            pool.dispatch([ReceivedSentence("a", "10.0.0.1", str(i), None)])
+        thread = pool.threads["a"]
+        assert len(thread) == 3
+        assert thread.high_watermark == 3
+        assert pool.overflows() == {"a": 96}
+
+        release.set()
+        pool.stop()
+        assert processed == [0, *kept]
+
+
+class TestThreadedBridge:
+    def _bridge(self, **config):
+        return NMEABridge({"runtime": {"source_threads": "on"}, **config})
+
+    def test_enabled_from_config(self):
+        assert self._bridge()._threads is not None
+        assert NMEABridge({"runtime": {"source_threads": "off"}})._threads is None
+
+    def test_ingest_queue_not_built(self):
+        assert self._bridge(queue={"enabled": True})._queue is None
+        off = NMEABridge(
+            {"runtime": {"source_threads": "off"}, "queue": {"enabled": True}}
+        )
+        assert off._queue is not None
+
+    def test_processes_and_counts(self):
+        bridge = self._bridge()
+        counters = new_thread_counters()
+        for sentence in (HDT, GGA, "$GPXXX,garbage*00"):
+            bridge._process_sentence_threaded(counters, "nav", "10.0.0.1", sentence)
+
+        assert counters["sentences_received"] == 3
+        assert counters["sentences_parsed"] == 2
+        assert bridge._state["heading_true"] == 18.2
+        assert bridge._state["latitude"] < 0
+
+    def test_duplicates_suppressed(self):
+        bridge = self._bridge(dedup={"enabled": True})
+        counters = new_thread_counters()
+        bridge._process_sentence_threaded(counters, "nav", "10.0.0.1", HDT)
+        bridge._process_sentence_threaded(counters, "mirror", "10.0.0.2", HDT)
+        assert counters["duplicates"] == 1
+
+    def test_ais_decoded_into_registry(self):
+        bridge = self._bridge()
+        counters = new_thread_counters()
+        bridge._process_sentence_threaded(counters, "ais", "10.0.0.3", AIS)
+        assert len(bridge.ais_decoder.vessels) == 1
+
+    def test_parallel_sources(self):
+        bridge = self._bridge()
+        batches = [
+            [ReceivedSentence(f"src{i}", "10.0.0.1", HDT, None)] * 200 for i in range(4)
+        ]
+        for batch in batches:
+            bridge._threads.dispatch(batch)
+        bridge._threads.stop()
+
+        assert bridge._state["heading_true"] == 18.2
@@ -0,0 +1,305 @@
+"""Tests for the UDP listener."""
+
+import asyncio
+import socket
+import struct
+import time
+
+from nmea_mqtt_bridge.udp_listener import (
+    SO_TIMESTAMPNS,
+    BufferPool,
+    NMEAProtocol,
+    ReceivedSentence,
+    UDPListener,
+    _open_socket,
+    ingress_tag,
+    read_kernel_drops,
+)
+
+
+def _free_port() -> int:
+    with socket.socket(socket.AF_INET, socket.SOCK_DGRAM) as s:
+        s.bind(("127.0.0.1", 0))
+        return s.getsockname()[1]
+
+
+class TestExtract:
+    def test_multiple_sentences(self):
+        protocol = NMEAProtocol("nav", lambda *a: None)
+        data = b"$GPHDT,18.2,T*0E\r\n$GPHDG,11.4,,,6.8,E*0F\r\n"
+        assert protocol.extract(data, ("172.31.252.1", 10021)) == [
+            ReceivedSentence("nav", "172.31.252.1", "$GPHDT,18.2,T*0E"),
+            ReceivedSentence("nav", "172.31.252.1", "$GPHDG,11.4,,,6.8,E*0F"),
+        ]
+
+    def test_ignores_non_nmea_lines(self):
+        protocol = NMEAProtocol("nav", lambda *a: None)
+        assert protocol.extract(b"hello\r\n", ("172.31.252.1", 10021)) == []
+
+    def test_drops_bad_checksum_before_decoding(self):
+        protocol = NMEAProtocol("nav", lambda *args: None)
+        data = b"$GPHDT,18.2,T*0F\r\n$SDDPT,0036.34,000.00\r\n$GPHDT,18.2,T*0E\r\n"
+        assert protocol.extract(data, ("172.31.252.1", 10110)) == [
+            ReceivedSentence("nav", "172.31.252.1", "$GPHDT,18.2,T*0E")
+        ]
+        assert protocol.sentences_invalid == 2
+
+    def test_reused_buffer_does_not_alias_sentences(self):
+        protocol = NMEAProtocol("nav", lambda *args: None)
+        buf = bytearray(64)
+        view = memoryview(buf)
+        first = b"$GPHDT,18.2,T*0E\r\n"
+        buf[: len(first)] = first
+        kept = protocol.extract(view[: len(first)], ("172.31.252.1", 10110))
+        buf[:] = bytes(64)
+        assert kept[0].sentence == "$GPHDT,18.2,T*0E"
+
+
+class TestBufferPool:
+    def test_reuses_buffers(self):
+        pool = BufferPool(count=2, size=16)
+        buf = pool.acquire()
+        pool.release(buf)
+        assert pool.acquire() is buf
+        assert pool.misses == 0
+
+    def test_allocates_when_empty_and_keeps_at_most_count(self):
+        pool = BufferPool(count=1, size=16)
+        a = pool.acquire()
+        b = pool.acquire()
+        assert pool.misses == 1
+        assert len(b) == 16
+        pool.release(a)
+        pool.release(b)
+        assert pool.acquire() is a
+        assert pool.misses == 1
+
+
+class TestBatchIngest:
+    def test_drains_datagrams_into_one_batch(self):
+        port = _free_port()
+        batches = []
+
+        async def run():
+            listener = UDPListener()
+            listener.set_batch_callback(batches.append)
+            await listener.start(
+                [{"name": "nav", "port": port}], bind_address="127.0.0.1"
+            )
+            with socket.socket(socket.AF_INET, socket.SOCK_DGRAM) as tx:
+                for _ in range(5):
+                    tx.sendto(b"$GPHDT,18.2,T*0E\r\n", ("127.0.0.1", port))
+            for _ in range(50):
+                if listener.batch_stats["datagrams"] >= 5:
+                    break
+                await asyncio.sleep(0.01)
+            await listener.stop()
+            return listener.batch_stats
+
+        stats = asyncio.run(run())
+        sentences = [item for batch in batches for item in batch]
+        assert len(sentences) == 5
+        assert sentences[0][:3] == ("nav", "127.0.0.1", "$GPHDT,18.2,T*0E")
+        # Tagged with the kernel receive timestamp and ingress (Linux only)
+        assert abs(sentences[0].received_at - time.time()) < 5
+        if sentences[0].interface is not None:
+            assert sentences[0].interface == "lo"
+            assert sentences[0].destination == "unicast"
+        assert stats["datagrams"] == 5
+        assert stats["max_batch"] >= 1
+        assert stats["batches"] == len(batches)
+
+    def test_truncated_datagram_drops_only_its_partial_line(self):
+        port = _free_port()
+        sentence = b"$GPHDT,18.2,T*0E\r\n"
+        batches = []
+
+        async def run():
+            listener = UDPListener()
+            listener.set_batch_callback(batches.append)
+            # Room for three whole sentences and part of a fourth
+            listener.buffer_pool = BufferPool(size=64)
+            await listener.start(
+                [{"name": "nav", "port": port}], bind_address="127.0.0.1"
+            )
+            with socket.socket(socket.AF_INET, socket.SOCK_DGRAM) as tx:
+                tx.sendto(sentence * 5, ("127.0.0.1", port))
+                tx.sendto(sentence, ("127.0.0.1", port))
+            for _ in range(50):
+                if listener.batch_stats["datagrams"] >= 2:
+                    break
+                await asyncio.sleep(0.01)
+            invalid = listener.sentences_invalid
+            await listener.stop()
+            return listener.batch_stats, invalid
+
+        stats, invalid = asyncio.run(run())
+        sentences = [item.sentence for batch in batches for item in batch]
+        assert sentences == ["$GPHDT,18.2,T*0E"] * 4
+        assert stats["truncated"] == 1
+        # The cut-off line is not carried into the next datagram
+        assert invalid == 0
+
+
+class TestSocketOptions:
+    def test_recv_buffer_applied(self):
+        sock = _open_socket(
+            "127.0.0.1",
+            {"name": "nav", "port": _free_port(), "recv_buffer_bytes": 65536},
+        )
+        try:
+            assert sock.getsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF) >= 65536
+            assert not sock.getblocking()
+        finally:
+            sock.close()
+
+    def test_kernel_timestamps_only_when_requested(self):
+        source = {"name": "nav", "port": _free_port()}
+        if SO_TIMESTAMPNS is None:
+            return
+        for timestamps in (False, True):
+            sock = _open_socket("127.0.0.1", source, timestamps=timestamps)
+            try:
+                enabled = sock.getsockopt(socket.SOL_SOCKET, SO_TIMESTAMPNS)
+                assert bool(enabled) is timestamps
+            finally:
+                sock.close()
+
+    def test_datagram_mode_uses_configured_socket(self):
+        port = _free_port()
+        received = []
+
+        async def run():
+            listener = UDPListener()
+            listener.set_callback(lambda *a: received.append(a))
+            await listener.start(
+                [{"name": "nav", "port": port, "recv_buffer_bytes": 65536}],
+                bind_address="127.0.0.1",
+            )
+            with socket.socket(socket.AF_INET, socket.SOCK_DGRAM) as tx:
+                tx.sendto(b"$GPHDT,18.2,T*0E\r\n", ("127.0.0.1", port))
+            for _ in range(50):
+                if received:
+                    break
+                await asyncio.sleep(0.01)
+            await listener.stop()
+
+        asyncio.run(run())
+        assert [r[:3] for r in received] == [("nav", "127.0.0.1", "$GPHDT,18.2,T*0E")]
+        assert abs(received[0][3] - time.time()) < 5
+
+
+class TestKernelDrops:
+    def test_reads_drop_column_by_inode(self, tmp_path):
+        table = tmp_path / "udp"
+        table.write_text(
+            "  sl  local_address rem_address   st tx_queue rx_queue tr tm->when "
+            "retrnsmt   uid  timeout inode ref pointer drops\n"
+            "  1: 00000000:2725 00000000:0000 07 00000000:00000000 00:00000000 "
+            "00000000  1000        0 4242 2 0000000000000000 17\n"
+            "  2: 00000000:2735 00000000:0000 07 00000000:00000000 00:00000000 "
+            "00000000  1000        0 4343 2 0000000000000000 5\n"
+        )
+        assert read_kernel_drops({4242}, (str(table),)) == {4242: 17}
+
+    def test_missing_table(self, tmp_path):
+        assert read_kernel_drops({1}, (str(tmp_path / "nope"),)) == {}
+
+    def test_listener_reports_per_source(self):
+        port = _free_port()
+
+        async def run():
+            listener = UDPListener()
+            listener.set_batch_callback(lambda batch: None)
+            await listener.start(
+                [{"name": "nav", "port": port}], bind_address="127.0.0.1"
+            )
+            drops = listener.kernel_drops()
+            await listener.stop()
+            return drops
+
+        drops = asyncio.run(run())
+        # /proc/net/udp only exists on Linux
+        if drops:
+            assert drops == {"nav": 0}
+
+
+class TestSenderFiltering:
+    def test_sub_source_and_drop(self):
+        protocol = NMEAProtocol.from_source(
+            {
+                "name": "primary_nav",
+                "port": 10021,
+                "senders": {"172.31.252.1": "gps"},
+                "deny_senders": ["172.31.24.3"],
+            },
+            lambda *a: None,
+        )
+        data = b"$GPHDT,18.2,T*0E\r\n"
+        assert protocol.extract(data, ("172.31.252.1", 10021)) == [
+            ReceivedSentence("gps", "172.31.252.1", "$GPHDT,18.2,T*0E")
+        ]
+        assert protocol.extract(b"!AIVDM,1,1,,A,x,0*00\r\n", ("172.31.24.3", 10021)) == []
+        assert protocol.sender_counts == {"172.31.252.1": 1}
+        assert protocol.sender_drops == {"172.31.24.3": 1}
+
+
+def _pktinfo(ifindex: int, local: str, destination: str) -> bytes:
+    return struct.pack(
+        "@i4s4s", ifindex, socket.inet_aton(local), socket.inet_aton(destination)
+    )
+
+
+class TestIngressTags:
+    def test_destination_types(self):
+        lo = socket.if_nameindex()[0]
+        assert ingress_tag(_pktinfo(lo[0], "172.31.3.2", "172.31.3.2")) == (
+            lo[1],
+            "unicast",
+        )
+        assert ingress_tag(_pktinfo(lo[0], "172.31.3.2", "172.31.255.255"))[1] == (
+            "broadcast"
+        )
+        assert ingress_tag(_pktinfo(lo[0], "172.31.3.2", "255.255.255.255"))[1] == (
+            "broadcast"
+        )
+        assert ingress_tag(_pktinfo(lo[0], "172.31.3.2", "239.255.0.2"))[1] == (
+            "multicast"
+        )
+
+    def test_unknown_interface_uses_index(self):
+        assert ingress_tag(_pktinfo(99999, "10.0.0.1", "10.0.0.1"))[0] == "99999"
+
+    def test_routing_by_interface_and_destination(self):
+        protocol = NMEAProtocol.from_source(
+            {
+                "name": "integrated",
+                "port": 31000,
+                "interface_names": {"eth5": "mirrored"},
+                "ingress_interfaces": ["eth4", "eth5"],
+                "destinations": ["broadcast"],
+            },
+            lambda *a: None,
+        )
+        data = b"$GPHDT,18.2,T*0E\r\n"
+        addr = ("172.31.3.7", 31000)
+
+        (primary,) = protocol.extract(data, addr, 1.0, "eth4", "broadcast")
+        assert primary.source == "integrated"
+        assert (primary.interface, primary.destination) == ("eth4", "broadcast")
+        (mirrored,) = protocol.extract(data, addr, 1.0, "eth5", "broadcast")
+        assert mirrored.source == "mirrored"
+
+        assert protocol.extract(data, addr, 1.0, "eth6", "broadcast") == []
+        assert protocol.extract(data, addr, 1.0, "eth4", "unicast") == []
+        # Untagged datagrams cannot be routed and are accepted
+        assert len(protocol.extract(data, addr)) == 1
+
+        assert protocol.ingress_counts == {
+            ("eth4", "broadcast"): 1,
+            ("eth5", "broadcast"): 1,
+        }
+        assert protocol.ingress_drops == {
+            ("eth6", "broadcast"): 1,
+            ("eth4", "unicast"): 1,
+        }
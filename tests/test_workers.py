@@ -0,0 +1,233 @@
+"""Tests for multi-process source workers."""
+
+import asyncio
+import marshal
+import multiprocessing
+import socket
+import time
+
+import pytest
+
+from nmea_mqtt_bridge.workers import (
+    BUSY,
+    DEFAULT_GROUP,
+    RECORD_AIS,
+    RECORD_NMEA,
+    RECORD_STATS,
+    SharedRing,
+    SourceWorker,
+    WorkerPool,
+    source_groups,
+)
+
+HDT = "$GPHDT,18.2,T*0E"
+AIS = "!AIVDM,1,1,,B,15MwkT1P37G?fl0EJbR0OwT0@MS,0*0E"
+
+
+def _hold_lock(lock, held):
+    """Worker stand-in that takes the ring lock and never lets go."""
+    lock.acquire()
+    held.set()
+    time.sleep(60)
+
+
+@pytest.fixture
+def ring():
+    ring = SharedRing.create(64)
+    yield ring
+    ring.close()
+
+
+class TestSharedRing:
+    def test_put_get_in_order(self, ring):
+        assert ring.get() is None
+        assert ring.put(b"one")
+        assert ring.put(b"two")
+        assert ring.get() == b"one"
+        assert ring.get() == b"two"
+        assert ring.get() is None
+
+    def test_wraps_around(self, ring):
+        for i in range(50):
+            payload = bytes([i]) * (i % 20 + 1)
+            assert ring.put(payload)
+            assert ring.get() == payload
+
+    def test_full_ring_drops(self, ring):
+        assert ring.put(b"x" * 40)
+        assert not ring.put(b"y" * 40)
+        assert ring.dropped == 1
+        assert ring.get() == b"x" * 40
+        assert ring.put(b"y" * 40)
+
+    def test_attach_sees_records(self, ring):
+        other = SharedRing.attach(ring.name, ring.lock)
+        try:
+            other.put(b"from worker")
+            assert ring.get() == b"from worker"
+        finally:
+            other.close()
+
+
+class TestSourceGroups:
+    def test_unlisted_sources_use_default_group(self):
+        config = {
+            "workers": {"groups": {"ais": ["ais"]}},
+            "udp": {
+                "sources": [
+                    {"name": "nav", "port": 1},
+                    {"name": "ais", "port": 2},
+                    {"name": "off", "port": 3, "enabled": False},
+                ]
+            },
+        }
+        groups = source_groups(config)
+        assert [s["name"] for s in groups["ais"]] == ["ais"]
+        assert [s["name"] for s in groups[DEFAULT_GROUP]] == ["nav"]
+
+
+class TestSourceWorker:
+    def _records(self, ring):
+        records = []
+        while (payload := ring.get()) is not None:
+            records.append(marshal.loads(payload))
+        return records
+
+    def test_parsed_fields_pushed(self):
+        ring = SharedRing.create(4096)
+        try:
+            worker = SourceWorker({"dedup": {"enabled": True}}, "nav", ring)
+            worker.on_sentence("nav", "172.31.252.1", HDT, time.time())
+            worker.on_sentence("nav", "172.31.252.1", "$GPHDT,bad")
+            (record,) = self._records(ring)
+        finally:
+            ring.close()
+        kind, now, received_at, fields, raw, interface = record
+        assert kind == RECORD_NMEA
+        assert fields == {"heading_true": 18.2, "sentence_type": "HDT"}
+        assert raw == HDT
+        assert worker.stats["sentences_received"] == 2
+        assert worker.stats["sentences_parsed"] == 1
+
+    def test_ais_decoded_and_throttled(self):
+        ring = SharedRing.create(4096)
+        try:
+            worker = SourceWorker({}, "ais", ring)
+            worker.on_sentence("ais", "172.31.24.3", AIS)
+            worker.on_sentence("ais", "172.31.24.3", AIS)
+            records = self._records(ring)
+        finally:
+            ring.close()
+        assert len(records) == 1
+        kind, _, _, fields, raw, _ = records[0]
+        assert kind == RECORD_AIS
+        assert fields["mmsi"] == 366998416
+        assert fields["status"] == "AtAnchor"
+        assert raw is None
+
+
+    def test_stats_include_tcp_drops(self):
+        with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as s:
+            s.bind(("127.0.0.1", 0))
+            port = s.getsockname()[1]
+        source = {
+            "name": "mux",
+            "type": "tcp-server",
+            "port": port,
+            "sentence_types": {"deny": ["HDG"]},
+        }
+        ring = SharedRing.create(4096)
+        worker = SourceWorker({"udp": {"sources": [source]}}, DEFAULT_GROUP, ring)
+
+        async def run():
+            listener = worker.tcp_listener
+            listener.set_callback(worker.on_sentence)
+            await listener.start([source], "127.0.0.1")
+            _, writer = await asyncio.open_connection("127.0.0.1", port)
+            writer.write(
+                b"$GPHDT,18.2,T*0F\r\n$GPHDG,11.4,,,6.8,E*0F\r\n" + HDT.encode() + b"\r\n"
+            )
+            await writer.drain()
+            for _ in range(200):
+                if worker.stats["sentences_received"]:
+                    break
+                await asyncio.sleep(0.01)
+            writer.close()
+            worker._push_stats()
+            await listener.stop()
+
+        try:
+            asyncio.run(run())
+            records = self._records(ring)
+        finally:
+            ring.close()
+        (stats,) = [r[3] for r in records if r[0] == RECORD_STATS]
+        assert stats["filtered"] == 1
+        assert stats["invalid"] == 1
+
+
+class TestWorkerPool:
+    def test_take_counts_returns_increments(self):
+        pool = WorkerPool({})
+        pool.stats = {
+            "nav": {"rate_counts": {"source": {"gps": 5}, "sentence_type": {"GGA": 5}}},
+            "ais": {"rate_counts": {"source": {"ais": 2}, "sentence_type": {"VDM": 2}}},
+        }
+        assert pool.take_counts() == {
+            ("source", "gps"): 5,
+            ("sentence_type", "GGA"): 5,
+            ("source", "ais"): 2,
+            ("sentence_type", "VDM"): 2,
+        }
+        pool.stats["nav"]["rate_counts"]["source"]["gps"] = 8
+        assert pool.take_counts()[("source", "gps")] == 3
+        assert pool.take_counts()[("source", "gps")] == 0
+
+    def test_worker_killed_holding_lock_does_not_block(self):
+        context = multiprocessing.get_context("spawn")
+        ring = SharedRing.create(4096, context)
+        held = context.Event()
+        process = context.Process(target=_hold_lock, args=(ring.lock, held), daemon=True)
+        process.start()
+        pool = WorkerPool({})
+        pool._rings["nav"] = ring
+        pool._processes["nav"] = process
+        try:
+            assert held.wait(20)
+            assert ring.get() is BUSY
+            process.kill()
+            process.join(5)
+
+            start = time.monotonic()
+            assert pool.read(10) == []
+            assert time.monotonic() - start < 1
+            assert ring.dead
+            assert pool.read(10) == []
+        finally:
+            pool.stop()
+
+    def test_worker_process_delivers_records(self):
+        with socket.socket(socket.AF_INET, socket.SOCK_DGRAM) as s:
+            s.bind(("127.0.0.1", 0))
+            port = s.getsockname()[1]
+        config = {
+            "udp": {
+                "bind_address": "127.0.0.1",
+                "sources": [{"name": "nav", "port": port}],
+            },
+            "logging": {"level": "WARNING"},
+        }
+        pool = WorkerPool(config)
+        pool.start()
+        try:
+            records = []
+            deadline = time.monotonic() + 20
+            with socket.socket(socket.AF_INET, socket.SOCK_DGRAM) as tx:
+                while not records and time.monotonic() < deadline:
+                    tx.sendto(HDT.encode() + b"\r\n", ("127.0.0.1", port))
+                    time.sleep(0.05)
+                    records = pool.read(10)
+        finally:
+            pool.stop()
+        assert records
+        assert records[0][3]["heading_true"] == 18.2